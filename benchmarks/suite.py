@@ -0,0 +1,423 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+# Résultats et référence par défaut, à côté de ce fichier
+DOSSIER_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+FICHIER_RESULTATS = os.path.join(DOSSIER_BENCHMARKS, "resultats.json")
+FICHIER_REFERENCE = os.path.join(DOSSIER_BENCHMARKS, "reference.json")
+
+# Hausse relative tolérée avant de signaler une régression (20 %)
+SEUIL_REGRESSION = 0.2
+
+# Nombre d'appels mesurés une fois les données en mémoire
+NB_REPETITIONS = 5
+
+# Mesures comparées à la référence, et hausse absolue en dessous de
+# laquelle un écart est attribué au bruit de mesure
+ECARTS_MINIMAUX = {"chaud_s": 0.001, "froid_s": 0.005, "pic_memoire_mo": 0.5}
+
+# Toutes les caractéristiques proposées par `choix_features`
+FEATURES = [
+    "pourcentage_victoire_matchs",
+    "pourcentage_victoire_tournois", "pourcentage_victoire_set1_perdu",
+    "pourcentage_balle_break_sauvée", "pourcentage_sem_top_1_10",
+    "pourcentage_sem_top_11_50", "pourcentage_sem_top_51_100",
+    "main_dominante"
+]
+
+# Nombre de clusters des mesures de la classification
+NB_CLUSTERS = 4
+
+
+def oublier_donnees():
+    """
+    Vide les tables gardées en mémoire par le stockage : l'appel suivant
+    relit les données (depuis le cache Parquet), comme au premier appel
+    d'une session.
+    """
+    from tennis_app.donnees.stockage import (
+        invalider_classements,
+        invalider_joueurs,
+        invalider_matchs
+    )
+
+    invalider_matchs()
+    invalider_classements()
+    invalider_joueurs()
+
+
+def preparer_contexte(sexe="H"):
+    """
+    Choisit les entrées fixes des mesures dans le jeu de données : les
+    deux joueurs ayant joué le plus de matchs, un tournoi du premier, la
+    dernière saison, la matrice de tous les joueurs actifs et les modèles
+    entraînés sur cette matrice.
+
+    Args:
+        sexe (str): Circuit mesuré ('H' ou 'F').
+
+    Returns:
+        dict: Entrées des mesures.
+    """
+    from tennis_app.donnees.stockage import joueurs_actifs, table_joueurs
+    from tennis_app.joueur.creer_joueur import creer_joueurs
+    from tennis_app.logique.fonctions_classification import clustering
+    from tennis_app.logique.preparation_classification import (
+        preaprer_liste_id,
+        preparer_matrice
+    )
+
+    joueurs = table_joueurs(sexe)
+    ids = (
+        joueurs.sort_values(["nb_matchs_joue", "player_id"],
+                            ascending=[False, True])["player_id"]
+        .head(2)
+        .tolist()
+    )
+    joueur1, joueur2 = creer_joueurs(ids, sexe)
+    saison = int(joueurs_actifs(sexe)["annee"].max())
+    liste_id = preaprer_liste_id(sexe, saison=saison)
+    X, noms = preparer_matrice(liste_id, sexe, None, FEATURES, graine=0)
+    _, _, kmeans, pca = clustering(X, noms, NB_CLUSTERS, FEATURES)
+
+    return {
+        "sexe": sexe,
+        "joueur1": joueur1,
+        "joueur2": joueur2,
+        "tournoi": joueur1.data_match_joueur(["tourney_id"]).iloc[0, 0],
+        "saison": saison,
+        "liste_id": liste_id,
+        "X": X,
+        "noms": noms,
+        "kmeans": kmeans,
+        "pca": pca
+    }
+
+
+def _tirer_joueurs(contexte):
+    """Tire 50 joueurs valides (tirage reproductible)."""
+    from tennis_app.logique.preparation_classification import tirer_joueurs
+
+    liste_id = contexte["liste_id"]
+    return tirer_joueurs(
+        liste_id, contexte["sexe"], min(50, len(liste_id)), graine=0
+        )
+
+
+def _preparer_matrice(contexte):
+    """Calcule la matrice de tous les joueurs actifs de la saison."""
+    from tennis_app.logique.preparation_classification import (
+        preparer_matrice
+    )
+
+    return preparer_matrice(
+        contexte["liste_id"], contexte["sexe"], None, FEATURES, graine=0
+        )
+
+
+def _entrainer_kmeans(contexte):
+    """Entraîne le K-Means seul, avec le moteur choisi par l'application."""
+    from tennis_app.logique.moteur_clustering import (
+        choisir_moteur,
+        entrainer_kmeans
+    )
+
+    X = contexte["X"]
+    return entrainer_kmeans(X, NB_CLUSTERS, choisir_moteur(len(X)))
+
+
+def _clustering(contexte):
+    """Classe tous les joueurs actifs de la saison en 4 clusters."""
+    from tennis_app.logique.fonctions_classification import clustering
+
+    return clustering(contexte["X"], contexte["noms"], NB_CLUSTERS, FEATURES)
+
+
+def _predire_clusters(contexte):
+    """Prédit le cluster de tous les joueurs actifs de la saison avec les
+    modèles entraînés."""
+    from tennis_app.logique.fonctions_classification import predire_clusters
+    from tennis_app.logique.preparation_classification import (
+        table_joueurs_eligibles
+    )
+
+    data = table_joueurs_eligibles(contexte["liste_id"], contexte["sexe"])
+    return predire_clusters(
+        data, contexte["kmeans"], FEATURES, contexte["pca"]
+        )
+
+
+def _creer_joueur(contexte):
+    """Crée le premier joueur à partir de son identifiant."""
+    from tennis_app.joueur.creer_joueur import creer_joueur
+
+    return creer_joueur(
+        id=contexte["joueur1"].id_joueur, sexe=contexte["sexe"]
+        )
+
+
+def _preaprer_liste_id(contexte):
+    """Liste les joueurs actifs de la saison."""
+    from tennis_app.logique.preparation_classification import (
+        preaprer_liste_id
+    )
+
+    return preaprer_liste_id(contexte["sexe"], saison=contexte["saison"])
+
+
+# Nom de la mesure -> fonction mesurée (appelée avec le contexte)
+CAS = {
+    "data_match": lambda c: c["joueur1"].data_match(),
+    "chercher_resultat": lambda c: c["joueur1"].chercher_resultat(),
+    "chercher_parcours_tournoi":
+        lambda c: c["joueur1"].chercher_parcours_tournoi(c["tournoi"]),
+    "cherche_10_joueur": lambda c: c["joueur1"].cherche_10_joueur(),
+    "chercher_match_adversaire":
+        lambda c: c["joueur1"].chercher_match_adversaire(c["joueur2"]),
+    "chercher_rang": lambda c: c["joueur1"].chercher_rang(),
+    "comparer_rang": lambda c: c["joueur1"].comparer_rang(c["joueur2"]),
+    "creer_joueur": _creer_joueur,
+    "preaprer_liste_id": _preaprer_liste_id,
+    "tirer_joueurs": _tirer_joueurs,
+    "preparer_matrice": _preparer_matrice,
+    "entrainer_kmeans": _entrainer_kmeans,
+    "clustering": _clustering,
+    "predire_clusters": _predire_clusters
+}
+
+
+def mesurer(fonction, contexte, repetitions=NB_REPETITIONS):
+    """
+    Mesure le temps et la mémoire d'une fonction.
+
+    Args:
+        fonction (callable): Fonction mesurée, appelée avec le contexte.
+        contexte (dict): Entrées de la fonction.
+        repetitions (int): Nombre d'appels « à chaud ».
+
+    Returns:
+        dict:
+            - 'froid_s' : durée du premier appel, données à relire,
+            - 'chaud_s' : durée médiane des appels suivants,
+            - 'chaud_min_s' : durée minimale des appels suivants,
+            - 'pic_memoire_mo' : pic de mémoire allouée (tracemalloc)
+              pendant un premier appel, en Mo.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        oublier_donnees()
+        debut = time.perf_counter()
+        fonction(contexte)
+        froid = time.perf_counter() - debut
+
+        # Mesure de mémoire à part : tracemalloc ralentit les appels
+        oublier_donnees()
+        tracemalloc.start()
+        fonction(contexte)
+        _, pic = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        durees = []
+        for _ in range(repetitions):
+            debut = time.perf_counter()
+            fonction(contexte)
+            durees.append(time.perf_counter() - debut)
+
+    return {
+        "froid_s": froid,
+        "chaud_s": statistics.median(durees),
+        "chaud_min_s": min(durees),
+        "pic_memoire_mo": pic / 2**20
+    }
+
+
+def lancer(noms=None, repetitions=NB_REPETITIONS, sexe="H"):
+    """
+    Lance les mesures.
+
+    Args:
+        noms (list, optional): Mesures à lancer (par défaut toutes).
+        repetitions (int): Nombre d'appels « à chaud » par mesure.
+        sexe (str): Circuit mesuré.
+
+    Returns:
+        dict: Résultats, une entrée par mesure.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        contexte = preparer_contexte(sexe)
+
+    resultats = {}
+    for nom in noms or CAS:
+        print(f"Mesure : {nom}...", flush=True)
+        resultats[nom] = mesurer(CAS[nom], contexte, repetitions)
+
+    return resultats
+
+
+def comparer(resultats, reference, seuil=SEUIL_REGRESSION):
+    """
+    Compare des résultats à une référence.
+
+    Args:
+        resultats (dict): Résultats des mesures.
+        reference (dict): Résultats de référence.
+        seuil (float): Hausse relative tolérée (0.2 = 20 %). Les hausses
+            plus petites que `ECARTS_MINIMAUX` sont ignorées.
+
+    Returns:
+        list:
+            Régressions, sous forme de tuples (mesure, grandeur, valeur de
+            référence, valeur actuelle).
+    """
+    regressions = []
+    for nom, mesures in resultats.items():
+        if nom not in reference:
+            continue
+        for grandeur, ecart_minimal in ECARTS_MINIMAUX.items():
+            avant = reference[nom][grandeur]
+            apres = mesures[grandeur]
+            if (apres > avant * (1 + seuil)
+                    and apres - avant > ecart_minimal):
+                regressions.append((nom, grandeur, avant, apres))
+
+    return regressions
+
+
+def afficher_resultats(resultats, reference=None):
+    """
+    Affiche les résultats, avec l'écart à la référence si elle est
+    fournie.
+
+    Args:
+        resultats (dict): Résultats des mesures.
+        reference (dict, optional): Résultats de référence.
+    """
+    print(f"\n{'Mesure':<28}{'froid (s)':>11}{'chaud (s)':>11}"
+          f"{'mémoire (Mo)':>14}{'écart':>10}")
+    for nom, mesures in resultats.items():
+        ecart = ""
+        if reference and nom in reference and reference[nom]["chaud_s"]:
+            rapport = mesures["chaud_s"] / reference[nom]["chaud_s"] - 1
+            ecart = f"{rapport:+.0%}"
+        print(
+            f"{nom:<28}{mesures['froid_s']:>11.4f}"
+            f"{mesures['chaud_s']:>11.4f}"
+            f"{mesures['pic_memoire_mo']:>14.1f}{ecart:>10}"
+            )
+
+
+def ecrire_json(chemin, resultats, dossier):
+    """
+    Enregistre les résultats en JSON, avec la description de la machine
+    et du jeu de données.
+
+    Args:
+        chemin (str): Fichier écrit.
+        resultats (dict): Résultats des mesures.
+        dossier (str): Dossier du jeu de données mesuré.
+    """
+    contenu = {
+        "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "dossier": dossier,
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "resultats": resultats
+    }
+    with open(chemin, "w", encoding="utf-8") as f:
+        json.dump(contenu, f, ensure_ascii=False, indent=2)
+
+
+def main(arguments=None):
+    """
+    Point d'entrée en ligne de commande :
+    python -m benchmarks.suite [--dossier ...] [--reference ...]
+    [--seuil 0.2] [--enregistrer-reference] [--cas nom ...]
+
+    Returns:
+        int: 1 si une régression est détectée, 0 sinon.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mesure le temps et la mémoire des requêtes Joueur et "
+                    "des étapes de la classification."
+        )
+    parser.add_argument(
+        "--dossier", default=".",
+        help="Dossier contenant le dossier Donnees du jeu mesuré."
+        )
+    parser.add_argument(
+        "--sortie", default=FICHIER_RESULTATS,
+        help="Fichier JSON des résultats."
+        )
+    parser.add_argument(
+        "--reference", default=FICHIER_REFERENCE,
+        help="Fichier JSON de référence."
+        )
+    parser.add_argument(
+        "--seuil", type=float, default=SEUIL_REGRESSION,
+        help="Hausse relative tolérée (par défaut 0.2, soit 20 %%)."
+        )
+    parser.add_argument(
+        "--repetitions", type=int, default=NB_REPETITIONS,
+        help="Nombre d'appels mesurés une fois les données chargées."
+        )
+    parser.add_argument(
+        "--sexe", choices=["H", "F"], default="H", help="Circuit mesuré."
+        )
+    parser.add_argument(
+        "--cas", nargs="+", choices=list(CAS), help="Mesures à lancer."
+        )
+    parser.add_argument(
+        "--enregistrer-reference", action="store_true",
+        help="Enregistre les résultats comme nouvelle référence."
+        )
+    arguments = parser.parse_args(arguments)
+
+    sortie = os.path.abspath(arguments.sortie)
+    fichier_reference = os.path.abspath(arguments.reference)
+    dossier = os.path.abspath(arguments.dossier)
+
+    # L'application lit ses fichiers relativement au dossier courant
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    sys.path.insert(0, os.path.dirname(DOSSIER_BENCHMARKS))
+    os.chdir(dossier)
+
+    resultats = lancer(arguments.cas, arguments.repetitions, arguments.sexe)
+    ecrire_json(sortie, resultats, dossier)
+
+    reference = None
+    if os.path.exists(fichier_reference):
+        with open(fichier_reference, encoding="utf-8") as f:
+            reference = json.load(f)["resultats"]
+
+    afficher_resultats(resultats, reference)
+    print(f"\nRésultats enregistrés dans {sortie}")
+
+    if arguments.enregistrer_reference:
+        ecrire_json(fichier_reference, resultats, dossier)
+        print(f"Nouvelle référence : {fichier_reference}")
+        return 0
+
+    if reference is None:
+        return 0
+
+    regressions = comparer(resultats, reference, arguments.seuil)
+    for nom, grandeur, avant, apres in regressions:
+        print(f"❌ Régression {nom} ({grandeur}) : "
+              f"{avant:.4f} -> {apres:.4f}")
+    if not regressions:
+        print(f"✅ Aucune régression au-delà de {arguments.seuil:.0%}.")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
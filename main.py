@@ -51,4 +51,21 @@ def application_tennis():
 
 # Point d'entrée de l'application
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Application d'analyse de joueurs de tennis."
+        )
+    parser.add_argument(
+        "--profil", nargs="?", const="profil_trace.json", metavar="TRACE",
+        help="Mesure les chargements de données et les requêtes Joueur ; "
+             "un rapport est affiché en quittant et la trace JSON est "
+             "écrite dans TRACE (par défaut profil_trace.json)."
+        )
+    arguments = parser.parse_args()
+
+    if arguments.profil:
+        from tennis_app.donnees.profilage import activer
+        activer(arguments.profil)
+
     application_tennis()
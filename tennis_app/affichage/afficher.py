@@ -67,6 +67,15 @@ def afficher_tournoi(data, lignes_par_page=20):
             input("\nAppuie sur Entrée pour voir la suite...")
 
 
+def _mention_statut(row):
+    """
+    Retourne la mention de l'issue d'un match (abandon, forfait...) à
+    ajouter au score, ou une chaîne vide pour un match complet.
+    """
+    statut = row.get('statut', '')
+    return f" ({statut})" if isinstance(statut, str) and statut else ""
+
+
 def afficher_matchs(data):
     """
     Affiche un résumé des matchs, incluant le round, les gagnants,
@@ -84,6 +93,7 @@ def afficher_matchs(data):
         print(
             f"{row['round_label']} : Victoire de {row['winner_name']} "
             f"contre {row['loser_name']}, score de {row['score']}"
+            f"{_mention_statut(row)}"
             )
 
 
@@ -111,7 +121,8 @@ def afficher_matchs_rencontre(data, lignes_par_page=25):
                 f"📅 {row['tourney_date']} - 🎾 Tournoi de "
                 f"{row['tourney_name']}, 🌀 Round : {row['round']}\n"
                 f"🏆 Victoire de {row['winner_name']} contre "
-                f"{row['loser_name']}, 📊 Score : {row['score']}\n"
+                f"{row['loser_name']}, 📊 Score : {row['score']}"
+                f"{_mention_statut(row)}\n"
             )
         if i + lignes_par_page < n:
             input("Appuie sur Entrée pour voir la suite...")
@@ -184,36 +195,55 @@ def afficher_nuage_point_deux_joueurs(data, joueur1, joueur2):
         joueur2 (Joueur) :
             Deuxième joueur à comparer.
 
+    Retourne :
+        fig (matplotlib.figure.Figure) : L'objet matplotlib de la figure.
+    """
+    return afficher_nuage_point_n_joueurs(
+        data,
+        [joueur1, joueur2],
+        couleurs=['blue', 'red']
+        )
+
+
+def afficher_nuage_point_n_joueurs(data, joueurs, couleurs=None):
+    """
+    Compare graphiquement les classements de plusieurs joueurs au fil du
+    temps.
+
+    Paramètres :
+        data (DataFrame) :
+            Données de classement avec la colonne 'ranking_date' et une
+            colonne 'rankjoueur{k}' par joueur (voir `comparer_rangs`).
+        joueurs (list) :
+            Joueurs à comparer, dans l'ordre des colonnes.
+        couleurs (list, optionnel) :
+            Couleur de chaque courbe (cycle matplotlib par défaut).
+
     Retourne :
         fig (matplotlib.figure.Figure) : L'objet matplotlib de la figure.
     """
     # S'assurer que la colonne 'ranking_date' est bien au format datetime
+    data = data.copy()
     data['ranking_date'] = pd.to_datetime(data['ranking_date'])
 
     # Créer le graphique
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    # Tracer les deux courbes
-    ax.plot(
-        data['ranking_date'],
-        data['rankjoueur1'],
-        label=joueur1.nom,
-        color='blue',
-        marker='o',
-        linewidth=1
-    )
-    ax.plot(
-        data['ranking_date'],
-        data['rankjoueur2'],
-        label=joueur2.nom,
-        color='red',
-        marker='o',
-        linewidth=1
-    )
+    # Tracer une courbe par joueur
+    for k, joueur in enumerate(joueurs, start=1):
+        ax.plot(
+            data['ranking_date'],
+            data[f'rankjoueur{k}'],
+            label=joueur.nom,
+            color=couleurs[k - 1] if couleurs else None,
+            marker='o',
+            linewidth=1
+        )
 
     # Titre et axes
     ax.set_title(
-        f"Comparaison des Classements : {joueur1.nom} vs {joueur2.nom}"
+        "Comparaison des Classements : "
+        + " vs ".join(joueur.nom for joueur in joueurs)
         )
     ax.set_xlabel("Date")
     ax.set_ylabel("Classement")
@@ -231,31 +261,38 @@ def afficher_nuage_point_deux_joueurs(data, joueur1, joueur2):
     return fig
 
 
-def k_means_visualisation(X):
+def k_means_visualisation(scores, k_suggere=None):
     """
-    Affiche la courbe d'inertie pour différents nombres de clusters
-    (méthode du coude).
+    Affiche la courbe d'inertie et le score de silhouette pour différents
+    nombres de clusters (méthode du coude).
 
     Args:
-        X (np.ndarray): Matrice des caractéristiques des joueurs.
+        scores (pd.DataFrame):
+            Colonnes 'k', 'inertie' et 'silhouette' (voir
+            `tennis_app.logique.courbe_coude.calculer_coude`).
+        k_suggere (int, optional):
+            Nombre de clusters suggéré, mis en évidence sur le graphique.
     """
-    from sklearn.cluster import KMeans
-    # Déterminer le nombre optimal de clusters avec la méthode du coude
-    inertias = []
-    K_range = range(1, 11)
+    # Visualiser la courbe du coude
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(scores['k'], scores['inertie'], 'bo-', label='Inertie')
+    ax.set_xlabel('Nombre de clusters (k)')
+    ax.set_ylabel('Inertie')
+    ax.set_title('Méthode du coude pour déterminer k optimal')
+    ax.grid(True)
 
-    for k in K_range:
-        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-        kmeans.fit(X)
-        inertias.append(kmeans.inertia_)
+    # Score de silhouette sur un second axe
+    ax2 = ax.twinx()
+    ax2.plot(scores['k'], scores['silhouette'], 'rs--', label='Silhouette')
+    ax2.set_ylabel('Score de silhouette')
 
-    # Visualiser la courbe du coude
-    plt.figure(figsize=(10, 6))
-    plt.plot(K_range, inertias, 'bo-')
-    plt.xlabel('Nombre de clusters (k)')
-    plt.ylabel('Inertie')
-    plt.title('Méthode du coude pour déterminer k optimal')
-    plt.grid(True)
+    if k_suggere is not None:
+        ax.axvline(k_suggere, color='green', linestyle=':',
+                   label=f'k suggéré ({k_suggere})')
+
+    lignes, labels = ax.get_legend_handles_labels()
+    lignes2, labels2 = ax2.get_legend_handles_labels()
+    ax.legend(lignes + lignes2, labels + labels2)
     plt.show()
 
 
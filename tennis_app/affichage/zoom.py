@@ -1,5 +1,7 @@
 import pandas as pd
 
+from ..donnees.classements import bornes_periode
+
 
 def zoom_annee(data):
     """
@@ -185,8 +187,10 @@ def zoom_graph(data):
             par l'utilisateur.
     """
     from ..logique.fonctions_divers import boucle_01
-    # S'assurer que 'ranking_date' est bien de type datetime
+    # S'assurer que 'ranking_date' est bien de type datetime et triée
+    data = data.copy()
     data['ranking_date'] = pd.to_datetime(data['ranking_date'])
+    data = data.sort_values(by='ranking_date', kind='stable')
 
     # Extraire les années uniques et les trier
     annee_liste = sorted(data['ranking_date'].dt.year.unique())
@@ -247,10 +251,10 @@ def zoom_graph(data):
             date_debut = pd.to_datetime(f'{annees[0]}-01-01')
             date_fin = pd.to_datetime(f'{annees[1]}-12-31')
 
-            # Filtrer le DataFrame
-            data = data[
-                (data['ranking_date'] >= date_debut) &
-                (data['ranking_date'] <= date_fin)
-                ]
+            # Filtrer le DataFrame (recherche dichotomique sur les dates)
+            debut, fin = bornes_periode(
+                data['ranking_date'], date_debut, date_fin
+                )
+            data = data.iloc[debut:fin]
 
     return data
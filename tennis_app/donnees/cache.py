@@ -0,0 +1,417 @@
+import glob
+import importlib.util
+import json
+import os
+
+import pandas as pd
+
+from .profilage import compter, profilage_actif, profiler
+from .schemas import schema_fichier, types_colonnes
+
+
+DOSSIER_DONNEES = "Donnees"
+DOSSIER_CACHE = os.path.join(DOSSIER_DONNEES, ".cache")
+
+# Nombre de lignes du CSV converties à la fois lors de la construction
+# du cache
+NB_LIGNES_CONVERSION = 200000
+
+
+def parquet_disponible():
+    """
+    Indique si un moteur Parquet (pyarrow ou fastparquet) est installé.
+
+    Returns:
+        bool: True si le cache colonne peut être utilisé.
+    """
+    return (
+        importlib.util.find_spec("pyarrow") is not None
+        or importlib.util.find_spec("fastparquet") is not None
+    )
+
+
+def chemins_cache(fichier):
+    """
+    Donne les chemins du fichier Parquet et de sa signature pour un CSV.
+
+    Args:
+        fichier (str):
+            Chemin du fichier CSV source (par exemple
+            'Donnees/atp_rankings.csv').
+
+    Returns:
+        tuple:
+            - chemin du fichier Parquet,
+            - chemin du fichier JSON contenant la signature de la source.
+    """
+    nom = os.path.splitext(os.path.basename(fichier))[0]
+    return (
+        os.path.join(DOSSIER_CACHE, f"{nom}.parquet"),
+        os.path.join(DOSSIER_CACHE, f"{nom}.json")
+    )
+
+
+def signature_source(fichier):
+    """
+    Calcule la signature (taille et date de modification) d'un fichier.
+
+    Args:
+        fichier (str): Chemin du fichier source.
+
+    Returns:
+        dict: Taille en octets et date de modification en nanosecondes.
+    """
+    info = os.stat(fichier)
+    return {"taille": info.st_size, "mtime": info.st_mtime_ns}
+
+
+def cache_valide(fichier):
+    """
+    Vérifie que le cache d'un CSV existe et correspond à la source actuelle.
+
+    Args:
+        fichier (str): Chemin du fichier CSV source.
+
+    Returns:
+        bool:
+            True si le fichier Parquet existe et que la taille et la date
+            de modification du CSV n'ont pas changé depuis sa création.
+    """
+    chemin_parquet, chemin_signature = chemins_cache(fichier)
+    if not (os.path.exists(chemin_parquet)
+            and os.path.exists(chemin_signature)):
+        return False
+
+    with open(chemin_signature, encoding="utf-8") as f:
+        signature = json.load(f)
+
+    return signature == signature_source(fichier)
+
+
+def _uniformiser_colonnes_texte(data):
+    """
+    Convertit en texte les colonnes objet qui mélangent plusieurs types
+    (par exemple des têtes de série '8F' et 8.0), que Parquet refuse.
+
+    Args:
+        data (pd.DataFrame): Données lues depuis le CSV.
+
+    Returns:
+        pd.DataFrame: Données dont les colonnes objet ne contiennent plus
+        que du texte ou des valeurs manquantes.
+    """
+    for colonne in data.columns[data.dtypes == object]:
+        valeurs = data[colonne]
+        data[colonne] = valeurs.where(valeurs.isna(), valeurs.astype(str))
+    return data
+
+
+def octets_lus(chemin, colonnes=None):
+    """
+    Estime les octets lus sur disque pour lire un fichier.
+
+    Pour un fichier Parquet lu avec pyarrow, seules les colonnes lues sont
+    comptées (taille compressée de leurs blocs) ; sinon c'est la taille du
+    fichier.
+
+    Args:
+        chemin (str): Fichier lu (CSV ou Parquet).
+        colonnes (list, optional): Colonnes lues (None : toutes).
+
+    Returns:
+        int: Nombre d'octets.
+    """
+    if (colonnes is None or not chemin.endswith(".parquet")
+            or importlib.util.find_spec("pyarrow") is None):
+        return os.path.getsize(chemin)
+
+    import pyarrow.parquet as pq
+
+    metadonnees = pq.ParquetFile(chemin).metadata
+    octets = 0
+    for i in range(metadonnees.num_row_groups):
+        groupe = metadonnees.row_group(i)
+        for j in range(groupe.num_columns):
+            bloc = groupe.column(j)
+            if bloc.path_in_schema in colonnes:
+                octets += bloc.total_compressed_size
+    return octets
+
+
+def _compter_lecture(chemin, data, colonnes=None):
+    """Relève pour le profilage les octets et les lignes d'une lecture
+    (rien n'est calculé si le profilage n'est pas activé)."""
+    if profilage_actif():
+        compter(octets_lus(chemin, colonnes), len(data))
+
+
+def lire_csv_type(fichier, colonnes=None):
+    """
+    Lit un fichier CSV en appliquant les types de son schéma.
+
+    Args:
+        fichier (str):
+            Chemin du fichier CSV source.
+        colonnes (list, optional):
+            Colonnes à lire. Si None, toutes les colonnes sont lues.
+
+    Returns:
+        pd.DataFrame: Les données typées.
+    """
+    data = pd.read_csv(fichier, usecols=colonnes, low_memory=False)
+    data = _uniformiser_colonnes_texte(data)
+
+    types = types_colonnes(schema_fichier(fichier), data.columns)
+    return data.astype(types)
+
+
+def _ecrire_parquet_par_morceaux(fichier, chemin_parquet):
+    """
+    Écrit le Parquet typé d'un CSV morceau par morceau, sans charger le
+    fichier en entier.
+
+    Chaque morceau est typé selon le schéma du fichier puis ramené aux
+    types du premier morceau (une colonne hors schéma peut être lue
+    comme entière dans un morceau et décimale dans un autre).
+
+    Args:
+        fichier (str): Chemin du fichier CSV source.
+        chemin_parquet (str): Fichier Parquet écrit.
+
+    Returns:
+        bool:
+            False si un morceau n'a pas pu être ramené aux types du
+            premier (le fichier écrit est alors incomplet).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = schema_fichier(fichier)
+    ecrivain = None
+    try:
+        morceaux = pd.read_csv(
+            fichier, chunksize=NB_LIGNES_CONVERSION, low_memory=False
+            )
+        for data in morceaux:
+            data = _uniformiser_colonnes_texte(data)
+            data = data.astype(types_colonnes(schema, data.columns))
+            table = pa.Table.from_pandas(data, preserve_index=False)
+
+            if ecrivain is None:
+                ecrivain = pq.ParquetWriter(chemin_parquet, table.schema)
+            elif not table.schema.equals(
+                    ecrivain.schema, check_metadata=False
+                    ):
+                table = table.cast(ecrivain.schema)
+            ecrivain.write_table(table)
+
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return False
+
+    finally:
+        if ecrivain is not None:
+            ecrivain.close()
+
+    # Fichier sans aucune ligne : aucun morceau n'a été lu
+    return ecrivain is not None
+
+
+def construire_cache(fichier):
+    """
+    Convertit un fichier CSV en fichier Parquet typé dans le dossier
+    de cache.
+
+    Les types appliqués sont ceux du schéma du fichier
+    (voir `tennis_app.donnees.schemas`). Avec pyarrow, le CSV est converti
+    par morceaux de `NB_LIGNES_CONVERSION` lignes : la mémoire occupée ne
+    dépend pas de la taille du fichier. Le fichier est d'abord écrit sous
+    un nom temporaire puis renommé, pour ne jamais laisser un cache à
+    moitié écrit.
+
+    Args:
+        fichier (str): Chemin du fichier CSV source.
+    """
+    os.makedirs(DOSSIER_CACHE, exist_ok=True)
+    chemin_parquet, chemin_signature = chemins_cache(fichier)
+    temporaire = chemin_parquet + ".tmp"
+
+    signature = signature_source(fichier)
+    if profilage_actif():
+        compter(octets=os.path.getsize(fichier))
+
+    if (importlib.util.find_spec("pyarrow") is None
+            or not _ecrire_parquet_par_morceaux(fichier, temporaire)):
+        # Sans pyarrow, ou si les morceaux n'ont pas les mêmes types :
+        # conversion du fichier entier
+        lire_csv_type(fichier).to_parquet(temporaire, index=False)
+    os.replace(temporaire, chemin_parquet)
+
+    with open(chemin_signature, "w", encoding="utf-8") as f:
+        json.dump(signature, f)
+
+
+@profiler
+def lire_donnees(fichier, colonnes=None):
+    """
+    Lit un fichier de données en passant par le cache colonne.
+
+    Au premier appel le CSV est converti en Parquet typé (par morceaux,
+    voir `construire_cache`) ; seules les colonnes demandées sont ensuite
+    lues dans le Parquet, dès ce premier appel et tant que le CSV n'a pas
+    changé (taille ou date de modification). Sans moteur Parquet installé,
+    le CSV est lu directement.
+
+    Args:
+        fichier (str):
+            Chemin du fichier CSV source.
+        colonnes (list, optional):
+            Colonnes à lire. Si None, toutes les colonnes sont lues.
+            Ne lire que les colonnes utiles réduit le temps de lecture et
+            la mémoire occupée.
+
+    Returns:
+        pd.DataFrame: Les données du fichier.
+    """
+    if not parquet_disponible():
+        data = lire_csv_type(fichier, colonnes)
+        _compter_lecture(fichier, data)
+        return data
+
+    if not cache_valide(fichier):
+        construire_cache(fichier)
+
+    chemin_parquet, _ = chemins_cache(fichier)
+    data = pd.read_parquet(chemin_parquet, columns=colonnes)
+    _compter_lecture(chemin_parquet, data, colonnes)
+    return data
+
+
+def lire_par_morceaux(fichier, colonnes=None, nb_lignes=100000):
+    """
+    Lit un fichier de données morceau par morceau, sans jamais le charger
+    en entier.
+
+    Le cache Parquet est lu par lots s'il est à jour (et pyarrow
+    installé) ; sinon le CSV est lu par morceaux, typés selon son schéma.
+    Le cache n'est pas construit ici.
+
+    Args:
+        fichier (str):
+            Chemin du fichier CSV source.
+        colonnes (list, optional):
+            Colonnes à lire. Si None, toutes les colonnes sont lues.
+        nb_lignes (int, optional):
+            Nombre maximal de lignes par morceau.
+
+    Yields:
+        pd.DataFrame: Morceaux successifs du fichier.
+    """
+    if (importlib.util.find_spec("pyarrow") is not None
+            and cache_valide(fichier)):
+        import pyarrow.parquet as pq
+
+        chemin_parquet, _ = chemins_cache(fichier)
+        lots = pq.ParquetFile(chemin_parquet).iter_batches(
+            batch_size=nb_lignes, columns=colonnes
+            )
+        _compter_lecture(chemin_parquet, [], colonnes)
+        for lot in lots:
+            compter(lignes=lot.num_rows)
+            yield lot.to_pandas()
+        return
+
+    _compter_lecture(fichier, [])
+    morceaux = pd.read_csv(
+        fichier, usecols=colonnes, chunksize=nb_lignes, low_memory=False
+        )
+    for data in morceaux:
+        compter(lignes=len(data))
+        data = _uniformiser_colonnes_texte(data)
+        types = types_colonnes(schema_fichier(fichier), data.columns)
+        yield data.astype(types)
+
+
+@profiler
+def charger_derive(nom, signature):
+    """
+    Recharge une table dérivée (calculée à partir des fichiers de données)
+    enregistrée dans le dossier de cache.
+
+    Args:
+        nom (str):
+            Nom de la table dérivée (par exemple 'tournois_H').
+        signature (list):
+            Signatures actuelles des fichiers sources de la table.
+
+    Returns:
+        pd.DataFrame or None:
+            La table, ou None si elle est absente, si aucun moteur Parquet
+            n'est installé ou si elle a été calculée à partir d'autres
+            versions des fichiers sources.
+    """
+    chemin_parquet, chemin_signature = chemins_cache(nom)
+    if not (parquet_disponible()
+            and os.path.exists(chemin_parquet)
+            and os.path.exists(chemin_signature)):
+        return None
+
+    with open(chemin_signature, encoding="utf-8") as f:
+        if json.load(f) != signature:
+            return None
+
+    data = pd.read_parquet(chemin_parquet)
+    _compter_lecture(chemin_parquet, data)
+    return data
+
+
+def sauvegarder_derive(nom, data, signature):
+    """
+    Enregistre une table dérivée dans le dossier de cache, avec la
+    signature des fichiers à partir desquels elle a été calculée.
+
+    Sans moteur Parquet, rien n'est enregistré.
+
+    Args:
+        nom (str): Nom de la table dérivée.
+        data (pd.DataFrame): Table à enregistrer.
+        signature (list): Signatures des fichiers sources.
+    """
+    if not parquet_disponible():
+        return
+
+    os.makedirs(DOSSIER_CACHE, exist_ok=True)
+    chemin_parquet, chemin_signature = chemins_cache(nom)
+
+    data.to_parquet(chemin_parquet + ".tmp")
+    os.replace(chemin_parquet + ".tmp", chemin_parquet)
+
+    with open(chemin_signature, "w", encoding="utf-8") as f:
+        json.dump(signature, f)
+
+
+def construire_tout_le_cache(dossier=DOSSIER_DONNEES):
+    """
+    Pré-construit le cache de tous les fichiers CSV du dossier de données.
+
+    Seuls les fichiers dont le cache est absent ou périmé sont convertis.
+
+    Args:
+        dossier (str): Dossier contenant les fichiers CSV.
+    """
+    if not parquet_disponible():
+        print("❌ Installer pyarrow pour utiliser le cache colonne.")
+        return
+
+    for fichier in sorted(glob.glob(os.path.join(dossier, "*.csv"))):
+        if cache_valide(fichier):
+            print(f"Cache à jour : {fichier}")
+        else:
+            print(f"Conversion : {fichier}")
+            construire_cache(fichier)
+
+    print(f"✅ Cache construit dans : {DOSSIER_CACHE}")
+
+
+# Pré-construction du cache : python -m tennis_app.donnees.cache
+if __name__ == "__main__":
+    construire_tout_le_cache()
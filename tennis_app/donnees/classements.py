@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+
+def construire_series_classement(joueurs, dates, rangs):
+    """
+    Réorganise une table de classement hebdomadaire en séries par joueur.
+
+    Les semaines de chaque joueur sont rangées de façon contiguë et
+    triées par date : la série du joueur `ids[k]` est
+    `dates[offsets[k]:offsets[k + 1]]` (et de même pour `rangs`).
+
+    Args:
+        joueurs (np.ndarray): Identifiant du joueur de chaque ligne.
+        dates (np.ndarray): Date de classement de chaque ligne
+            (datetime64).
+        rangs (np.ndarray): Rang de chaque ligne.
+
+    Returns:
+        dict:
+            - 'ids' : identifiants triés des joueurs classés,
+            - 'offsets' : début de chaque joueur (avec la fin du dernier
+              joueur en dernière position),
+            - 'dates' : dates, groupées par joueur puis triées,
+            - 'rangs' : rangs dans le même ordre.
+    """
+    ordre = np.lexsort((dates, joueurs))
+    joueurs = joueurs[ordre]
+
+    ids, debuts = np.unique(joueurs, return_index=True)
+
+    return {
+        "ids": ids,
+        "offsets": np.append(debuts, len(joueurs)).astype(np.int64),
+        "dates": dates[ordre],
+        "rangs": rangs[ordre]
+    }
+
+
+def serie_joueur(series, id_joueur):
+    """
+    Retourne l'historique de classement d'un joueur.
+
+    Les tableaux renvoyés sont des vues sur les séries (aucune copie).
+
+    Args:
+        series (dict):
+            Séries construites par `construire_series_classement`.
+        id_joueur (int):
+            Identifiant du joueur.
+
+    Returns:
+        tuple: (dates, rangs) du joueur, triés par date (vides si le
+        joueur n'a jamais été classé).
+    """
+    ids = series["ids"]
+    k = np.searchsorted(ids, id_joueur)
+    if k == len(ids) or ids[k] != id_joueur:
+        return series["dates"][:0], series["rangs"][:0]
+
+    debut, fin = series["offsets"][k], series["offsets"][k + 1]
+    return series["dates"][debut:fin], series["rangs"][debut:fin]
+
+
+def bornes_periode(dates, date_debut, date_fin):
+    """
+    Trouve par recherche dichotomique les positions d'une période dans
+    des dates triées.
+
+    Args:
+        dates (np.ndarray or pd.Series): Dates triées par ordre croissant.
+        date_debut: Première date incluse.
+        date_fin: Dernière date incluse.
+
+    Returns:
+        tuple: (début, fin) telles que dates[début:fin] soit la période.
+    """
+    dates = pd.DatetimeIndex(dates)
+    return (
+        dates.searchsorted(pd.Timestamp(date_debut), side="left"),
+        dates.searchsorted(pd.Timestamp(date_fin), side="right")
+    )
+
+
+def aligner_series(liste_series, asof=False):
+    """
+    Aligne plusieurs historiques de classement sur un même calendrier.
+
+    Le calendrier est l'union triée des dates de toutes les séries ; la
+    matrice est remplie en une seule passe par recherche dichotomique des
+    dates de chaque série dans ce calendrier.
+
+    Args:
+        liste_series (list):
+            Couples (dates, rangs) triés par date, un par joueur.
+        asof (bool, optional):
+            Si True, une semaine où un joueur n'a pas de classement reprend
+            son dernier rang connu (entre sa première et sa dernière
+            semaine classée). Sinon la case reste vide (NaN).
+
+    Returns:
+        tuple:
+            - dates (np.ndarray): calendrier commun (datetime64).
+            - matrice (np.ndarray): rangs, une ligne par date et une
+              colonne par joueur (float, NaN si absent).
+    """
+    toutes_dates = [dates for dates, _ in liste_series]
+    if toutes_dates:
+        calendrier = np.unique(np.concatenate(toutes_dates))
+    else:
+        calendrier = np.array([], dtype="datetime64[ns]")
+
+    matrice = np.full((len(calendrier), len(liste_series)), np.nan)
+
+    for k, (dates, rangs) in enumerate(liste_series):
+        if len(dates) == 0:
+            continue
+
+        if asof:
+            # Dernière semaine classée à ou avant chaque date du calendrier
+            debut, fin = np.searchsorted(calendrier, [dates[0], dates[-1]])
+            positions = np.searchsorted(
+                dates, calendrier[debut:fin + 1], side="right"
+                ) - 1
+            matrice[debut:fin + 1, k] = rangs[positions]
+        else:
+            matrice[np.searchsorted(calendrier, dates), k] = rangs
+
+    return calendrier, matrice
+
+
+def construire_instantanes(joueurs, dates, rangs):
+    """
+    Réorganise une table de classement hebdomadaire par date de classement.
+
+    Les lignes d'une même semaine sont contiguës et triées par rang : le
+    classement de la semaine `dates[k]` est
+    `joueurs[offsets[k]:offsets[k + 1]]` (et de même pour `rangs`).
+
+    Args:
+        joueurs (np.ndarray): Identifiant du joueur de chaque ligne.
+        dates (np.ndarray): Date de classement de chaque ligne
+            (datetime64).
+        rangs (np.ndarray): Rang de chaque ligne.
+
+    Returns:
+        dict:
+            - 'dates' : dates de classement distinctes, triées,
+            - 'offsets' : début de chaque semaine (avec la fin de la
+              dernière semaine en dernière position),
+            - 'joueurs' : identifiants, groupés par semaine puis triés
+              par rang,
+            - 'rangs' : rangs dans le même ordre.
+    """
+    ordre = np.lexsort((rangs, dates))
+    dates = dates[ordre]
+
+    dates_uniques, debuts = np.unique(dates, return_index=True)
+
+    return {
+        "dates": dates_uniques,
+        "offsets": np.append(debuts, len(dates)).astype(np.int64),
+        "joueurs": joueurs[ordre],
+        "rangs": rangs[ordre]
+    }
+
+
+def instantane(instantanes, date=None):
+    """
+    Retourne le dernier classement publié à une date donnée.
+
+    Args:
+        instantanes (dict):
+            Classements construits par `construire_instantanes`.
+        date (optional):
+            Date recherchée. Si None, le dernier classement publié.
+
+    Returns:
+        tuple:
+            (date du classement, joueurs, rangs). La date est None et les
+            tableaux sont vides si aucun classement n'a été publié avant
+            `date`.
+    """
+    dates = instantanes["dates"]
+    if date is None:
+        k = len(dates) - 1
+    else:
+        k = np.searchsorted(
+            dates, np.datetime64(pd.Timestamp(date), "ns"), side="right"
+            ) - 1
+
+    if k < 0:
+        return None, instantanes["joueurs"][:0], instantanes["rangs"][:0]
+
+    debut, fin = instantanes["offsets"][k], instantanes["offsets"][k + 1]
+    return (
+        dates[k],
+        instantanes["joueurs"][debut:fin],
+        instantanes["rangs"][debut:fin]
+    )
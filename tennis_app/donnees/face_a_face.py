@@ -0,0 +1,242 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .index import charger_tableaux, sauvegarder_tableaux
+
+
+def construire_face_a_face(id_gagnants, id_perdants, joueurs):
+    """
+    Construit les structures de face-à-face d'une table de matchs.
+
+    Args:
+        id_gagnants (np.ndarray):
+            Identifiants des vainqueurs, une valeur par ligne de la table.
+        id_perdants (np.ndarray):
+            Identifiants des perdants, une valeur par ligne de la table.
+        joueurs (np.ndarray):
+            Identifiants triés de tous les joueurs de la table (premier
+            tableau de l'index joueur).
+
+    Returns:
+        dict:
+            - 'joueurs' : identifiants triés des joueurs,
+            - 'victoires' : matrice creuse (joueur x joueur) où la case
+              (i, j) compte les victoires de i contre j,
+            - 'defaites' : sa transposée (défaites de i contre j),
+            - 'cles' : clés triées des paires de joueurs de chaque match,
+            - 'lignes' : positions des matchs dans l'ordre de 'cles'.
+    """
+    nb_joueurs = len(joueurs)
+    gagnants = np.searchsorted(joueurs, id_gagnants).astype(np.int64)
+    perdants = np.searchsorted(joueurs, id_perdants).astype(np.int64)
+
+    # Les doublons (plusieurs matchs entre deux joueurs) sont additionnés
+    victoires = sparse.csr_matrix(
+        (np.ones(len(gagnants), dtype=np.int32), (gagnants, perdants)),
+        shape=(nb_joueurs, nb_joueurs)
+        )
+
+    # Clé d'une paire indépendante de l'ordre vainqueur / perdant
+    cles = (
+        np.minimum(gagnants, perdants) * nb_joueurs
+        + np.maximum(gagnants, perdants)
+    )
+    ordre = np.argsort(cles, kind="stable")
+
+    return {
+        "joueurs": joueurs,
+        "victoires": victoires,
+        "defaites": victoires.T.tocsr(),
+        "cles": cles[ordre],
+        "lignes": ordre
+    }
+
+
+def sauvegarder_face_a_face(chemin, face_a_face, signature):
+    """
+    Enregistre les structures de face-à-face sur disque avec la signature
+    des fichiers de matchs.
+
+    Seule la matrice des victoires est enregistrée : celle des défaites
+    est sa transposée.
+
+    Args:
+        chemin (str): Chemin du fichier .npz.
+        face_a_face (dict): Structures construites par
+            `construire_face_a_face`.
+        signature (list): Signatures des fichiers de matchs utilisés.
+    """
+    victoires = face_a_face["victoires"]
+    sauvegarder_tableaux(
+        chemin,
+        {
+            "joueurs": face_a_face["joueurs"],
+            "victoires_data": victoires.data,
+            "victoires_indices": victoires.indices,
+            "victoires_indptr": victoires.indptr,
+            "cles": face_a_face["cles"],
+            "lignes": face_a_face["lignes"]
+        },
+        signature
+        )
+
+
+def charger_face_a_face(chemin, signature):
+    """
+    Recharge des structures de face-à-face enregistrées si elles
+    correspondent aux fichiers de matchs actuels.
+
+    Args:
+        chemin (str): Chemin du fichier .npz.
+        signature (list): Signatures actuelles des fichiers de matchs.
+
+    Returns:
+        dict or None:
+            Les structures (comme `construire_face_a_face`), ou None si le
+            fichier est absent ou construit à partir d'autres versions des
+            fichiers.
+    """
+    tableaux = charger_tableaux(chemin, signature)
+    if tableaux is None:
+        return None
+
+    nb_joueurs = len(tableaux["joueurs"])
+    victoires = sparse.csr_matrix(
+        (
+            tableaux["victoires_data"],
+            tableaux["victoires_indices"],
+            tableaux["victoires_indptr"]
+        ),
+        shape=(nb_joueurs, nb_joueurs)
+        )
+
+    return {
+        "joueurs": tableaux["joueurs"],
+        "victoires": victoires,
+        "defaites": victoires.T.tocsr(),
+        "cles": tableaux["cles"],
+        "lignes": tableaux["lignes"]
+    }
+
+
+def _position(face_a_face, id_joueur):
+    """
+    Retourne la position d'un joueur dans la matrice, ou None s'il n'a
+    joué aucun match.
+    """
+    joueurs = face_a_face["joueurs"]
+    k = np.searchsorted(joueurs, id_joueur)
+    if k == len(joueurs) or joueurs[k] != id_joueur:
+        return None
+    return k
+
+
+def adversaires_frequents(face_a_face, id_joueur, nb=10):
+    """
+    Retourne les adversaires les plus souvent rencontrés par un joueur.
+
+    Seules les lignes du joueur dans les deux matrices sont lues : le coût
+    dépend du nombre d'adversaires du joueur, pas de la taille de la table.
+
+    Args:
+        face_a_face (dict):
+            Structures construites par `construire_face_a_face`.
+        id_joueur (int):
+            Identifiant du joueur.
+        nb (int or None):
+            Nombre d'adversaires à garder (tous si None).
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'adversaire', 'nb_rencontres', 'victoires' et
+            'defaites', triées par nombre de rencontres décroissant.
+    """
+    k = _position(face_a_face, id_joueur)
+    if k is None:
+        return pd.DataFrame(
+            columns=["adversaire", "nb_rencontres", "victoires", "defaites"]
+            )
+
+    # Lignes creuses du joueur : une case par adversaire rencontré
+    victoires = face_a_face["victoires"][k]
+    defaites = face_a_face["defaites"][k]
+
+    data = pd.concat([
+        pd.DataFrame({
+            "position": victoires.indices,
+            "victoires": victoires.data,
+            "defaites": 0
+        }),
+        pd.DataFrame({
+            "position": defaites.indices,
+            "victoires": 0,
+            "defaites": defaites.data
+        })
+    ])
+    data = data.groupby("position", as_index=False).sum()
+
+    data["adversaire"] = face_a_face["joueurs"][data["position"].to_numpy()]
+    data["nb_rencontres"] = data["victoires"] + data["defaites"]
+    data = data[["adversaire", "nb_rencontres", "victoires", "defaites"]]
+    data = data.sort_values(
+        by=["nb_rencontres", "adversaire"],
+        ascending=[False, True],
+        ignore_index=True
+        )
+
+    return data if nb is None else data.head(nb)
+
+
+def bilan_face_a_face(face_a_face, id_joueur_1, id_joueur_2):
+    """
+    Retourne le bilan des confrontations entre deux joueurs.
+
+    Args:
+        face_a_face (dict):
+            Structures construites par `construire_face_a_face`.
+        id_joueur_1 (int):
+            Identifiant du premier joueur.
+        id_joueur_2 (int):
+            Identifiant du second joueur.
+
+    Returns:
+        tuple: (victoires du joueur 1, victoires du joueur 2).
+    """
+    k1 = _position(face_a_face, id_joueur_1)
+    k2 = _position(face_a_face, id_joueur_2)
+    if k1 is None or k2 is None:
+        return 0, 0
+
+    victoires = face_a_face["victoires"]
+    return int(victoires[k1, k2]), int(victoires[k2, k1])
+
+
+def lignes_face_a_face(face_a_face, id_joueur_1, id_joueur_2):
+    """
+    Retourne les lignes de la table des matchs opposant deux joueurs.
+
+    Args:
+        face_a_face (dict):
+            Structures construites par `construire_face_a_face`.
+        id_joueur_1 (int):
+            Identifiant du premier joueur.
+        id_joueur_2 (int):
+            Identifiant du second joueur.
+
+    Returns:
+        np.ndarray: Positions triées des matchs entre les deux joueurs.
+    """
+    k1 = _position(face_a_face, id_joueur_1)
+    k2 = _position(face_a_face, id_joueur_2)
+    if k1 is None or k2 is None:
+        return face_a_face["lignes"][:0]
+
+    nb_joueurs = len(face_a_face["joueurs"])
+    cle = min(k1, k2) * nb_joueurs + max(k1, k2)
+
+    cles = face_a_face["cles"]
+    debut = np.searchsorted(cles, cle, side="left")
+    fin = np.searchsorted(cles, cle, side="right")
+
+    return np.sort(face_a_face["lignes"][debut:fin])
@@ -0,0 +1,1097 @@
+import argparse
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from .cache import DOSSIER_DONNEES
+from .schemas import SCHEMA_MATCHS
+from .statistiques import FICHIERS_JOUEURS_BRUTS, calculer_statistiques
+from .stockage import (
+    FICHIERS_CLASSEMENTS,
+    FICHIERS_JOUEURS,
+    FICHIERS_MATCHS,
+    invalider_classements,
+    invalider_matchs
+)
+from .tournois import TAILLE_PAR_ROUND
+
+
+# Échelles acceptées, en multiple du volume des fichiers réels
+ECHELLE_MIN = 0.01
+ECHELLE_MAX = 10
+
+# Ordre de grandeur du nombre de joueurs et de lignes de classement des
+# fichiers réels (échelle 1)
+NB_JOUEURS = {"H": 66000, "F": 70000}
+NB_CLASSEMENTS = {"H": 3300000, "F": 2900000}
+
+# Première année de classement de chaque circuit
+PREMIERE_ANNEE_CLASSEMENT = {"H": 1973, "F": 1975}
+
+# Types de tournois de chaque fichier de matchs, avec l'ordre de grandeur
+# du nombre de matchs du fichier réel. Chaque type de tournoi est un
+# tuple (niveau, format, taille du tableau, sets gagnants, fenêtre du
+# classement de l'année où sont tirés les joueurs, part des matchs) ;
+# le format est 'KO' (élimination directe), 'RR' (Round Robin puis
+# demi-finales et finale, une fois par an, hors partage des matchs) ou
+# 'Q' (trois tours de qualification d'un tournoi de même niveau du
+# fichier principal, dont les matchs partagent le tourney_id)
+TOURNOIS = {
+    "Donnees/atp_matches_1968_2024.csv": (195000, [
+        ("G", "KO", 128, 3, (0.0, 0.15), 0.15),
+        ("M", "KO", 64, 2, (0.0, 0.08), 0.17),
+        ("A", "KO", 32, 2, (0.0, 0.25), 0.68),
+        ("F", "RR", 8, 2, (0.0, 0.0), 0.0)
+        ]),
+    "Donnees/atp_matches_futures_1992_2024.csv": (498000, [
+        ("15", "KO", 32, 2, (0.3, 1.0), 0.6),
+        ("25", "KO", 32, 2, (0.15, 0.8), 0.4)
+        ]),
+    "Donnees/atp_matches_qual_1978_2024.csv": (223000, [
+        ("C", "KO", 32, 2, (0.08, 0.5), 0.55),
+        ("A", "Q", 32, 2, (0.1, 0.4), 0.35),
+        ("G", "Q", 128, 2, (0.1, 0.5), 0.1)
+        ]),
+    "Donnees/wta_matches_1968_2024.csv": (158000, [
+        ("G", "KO", 128, 2, (0.0, 0.15), 0.2),
+        ("P", "KO", 64, 2, (0.0, 0.08), 0.2),
+        ("I", "KO", 32, 2, (0.0, 0.25), 0.6),
+        ("F", "RR", 8, 2, (0.0, 0.0), 0.0)
+        ]),
+    "Donnees/wta_matches_qual_1968_2024.csv": (594000, [
+        ("I", "Q", 32, 2, (0.1, 0.4), 0.2),
+        ("G", "Q", 128, 2, (0.1, 0.5), 0.05),
+        ("25", "KO", 32, 2, (0.3, 1.0), 0.5),
+        ("60", "KO", 32, 2, (0.1, 0.6), 0.25)
+        ])
+}
+
+# Préfixe des tourney_id de chaque fichier (un même identifiant ne doit
+# pas désigner deux tournois de fichiers différents). Les qualifications
+# reprennent l'identifiant de leur tableau principal.
+PREFIXES_TOURNOIS = {
+    "Donnees/atp_matches_1968_2024.csv": "",
+    "Donnees/atp_matches_futures_1992_2024.csv": "F",
+    "Donnees/atp_matches_qual_1978_2024.csv": "Q",
+    "Donnees/wta_matches_1968_2024.csv": "",
+    "Donnees/wta_matches_qual_1968_2024.csv": "Q"
+}
+
+# Niveaux des tournois précédés de qualifications
+NIVEAUX_QUALIFIES = {
+    type_[0]
+    for _, types in TOURNOIS.values()
+    for type_ in types
+    if type_[1] == "Q"
+}
+
+# Colonnes gardées des tableaux principaux pour leurs qualifications
+COLONNES_TABLEAUX = ["semaine", "tourney_name", "surface", "tourney_id"]
+
+# Nombre de tours d'un tableau de qualification
+NB_TOURS_QUALIFICATION = 3
+
+# Semaine (et nom, surface) des tournois du Grand Chelem
+GRANDS_CHELEMS = [
+    (3, "Australian Open", "Hard"),
+    (21, "Roland Garros", "Clay"),
+    (26, "Wimbledon", "Grass"),
+    (35, "US Open", "Hard")
+]
+
+# Semaine des Masters de fin de saison
+SEMAINE_MASTERS = 46
+
+# Surfaces des autres tournois et leur fréquence (le Carpet disparaît
+# du circuit en 2009)
+SURFACES = ["Hard", "Clay", "Grass", "Carpet"]
+FREQUENCES_SURFACES = [0.5, 0.33, 0.07, 0.1]
+DERNIERE_ANNEE_CARPET = 2008
+
+# Scores d'un set (jeux du gagnant du set, jeux du perdant) et fréquences
+SCORES_SETS = np.array(
+    [(6, 0), (6, 1), (6, 2), (6, 3), (6, 4), (7, 5), (7, 6)]
+    )
+FREQUENCES_SETS = [0.03, 0.08, 0.15, 0.2, 0.22, 0.12, 0.2]
+
+# Sets perdus par le vainqueur du match, selon le nombre de sets gagnants
+FREQUENCES_SETS_PERDUS = {2: [0.62, 0.38], 3: [0.45, 0.33, 0.22]}
+
+# Fréquence des abandons, des disqualifications et des forfaits
+FREQUENCE_ABANDON = 0.03
+FREQUENCE_DISQUALIFICATION = 0.001
+FREQUENCE_FORFAIT = 0.01
+
+# Première année où la durée et les balles de break sont renseignées
+PREMIERE_ANNEE_STATISTIQUES = 1991
+
+# Sensibilité du résultat d'un match à l'écart de niveau des joueurs
+SENSIBILITE_NIVEAU = 1.5
+
+# Colonnes des fichiers de joueurs bruts
+COLONNES_JOUEURS_BRUTS = [
+    "player_id", "name_first", "name_last", "hand", "dob", "ioc",
+    "height", "wikidata_id"
+]
+
+# Premier player_id de chaque circuit
+PREMIER_ID = {"H": 100001, "F": 200001}
+
+PRENOMS = {
+    "H": [
+        "Carlos", "Novak", "Rafael", "Roger", "Andy", "Daniil", "Stefan",
+        "Alexander", "Jannik", "Casper", "Holger", "Taylor", "Gael",
+        "Richard", "Arthur", "Ugo", "Lorenzo", "Matteo", "Felix", "Tommy",
+        "Hubert", "Grigor", "Diego", "Pablo", "Kei", "Marin", "Juan",
+        "Thomas", "Nicolas", "Pierre", "Lucas", "Hugo", "Ivan", "John"
+        ],
+    "F": [
+        "Iga", "Aryna", "Coco", "Elena", "Jessica", "Ons", "Maria",
+        "Caroline", "Jelena", "Karolina", "Petra", "Simona", "Naomi",
+        "Serena", "Venus", "Amelie", "Caroline", "Marion", "Alize",
+        "Kristina", "Ashleigh", "Barbora", "Madison", "Sloane", "Qinwen",
+        "Leylah", "Emma", "Belinda", "Daria", "Ekaterina", "Anna", "Mirra"
+        ]
+}
+
+NOMS = [
+    "Martin", "Bernard", "Dubois", "Garcia", "Lopez", "Rossi", "Bianchi",
+    "Muller", "Schmidt", "Smith", "Johnson", "Williams", "Brown", "Novak",
+    "Kovac", "Ivanov", "Petrov", "Sokolov", "Nowak", "Kowalski", "Jensen",
+    "Nielsen", "Hansen", "Tanaka", "Suzuki", "Wang", "Li", "Zhang", "Silva",
+    "Santos", "Fernandez", "Gonzalez", "Rodriguez", "Moreau", "Laurent",
+    "Fournier", "Girard", "Bonnet", "Dupont", "Lambert", "Fontaine",
+    "Rousseau", "Vincent", "Muller", "Lefevre", "Mercier", "Blanc",
+    "Guerin", "Boyer", "Garnier", "Chevalier", "Francois", "Legrand"
+]
+
+# Nationalités et leur fréquence
+NATIONALITES = [
+    "USA", "FRA", "ESP", "ITA", "ARG", "GER", "AUS", "GBR", "RUS", "CZE",
+    "SWE", "JPN", "BRA", "NED", "SUI", "CAN", "CHN", "SRB", "BEL", "AUT"
+]
+FREQUENCES_NATIONALITES = [
+    0.14, 0.09, 0.08, 0.07, 0.06, 0.06, 0.06, 0.06, 0.05, 0.04,
+    0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.02, 0.02, 0.02
+]
+
+VILLES = [
+    "Doha", "Brisbane", "Auckland", "Rotterdam", "Marseille", "Dubai",
+    "Acapulco", "Indian Wells", "Miami", "Monte Carlo", "Barcelona",
+    "Madrid", "Rome", "Lyon", "Halle", "Queen's Club", "Eastbourne",
+    "Gstaad", "Hamburg", "Kitzbuhel", "Washington", "Montreal",
+    "Cincinnati", "Winston-Salem", "Metz", "Tokyo", "Beijing", "Shanghai",
+    "Stockholm", "Antwerp", "Vienna", "Basel", "Paris", "Sofia", "Astana",
+    "Santiago", "Buenos Aires", "Rio de Janeiro", "Delray Beach", "Houston"
+]
+
+
+####################
+# Joueurs
+####################
+
+
+def creer_joueurs(sexe, nb_joueurs, premiere_annee, derniere_annee, rng):
+    """
+    Crée les joueurs d'un circuit et leur carrière.
+
+    Chaque joueur a une année de début et de fin de carrière et un niveau
+    de base ; son niveau d'une année (`forces_annee`) monte puis
+    redescend au fil de sa carrière.
+
+    Args:
+        sexe (str): 'H' (ATP) ou 'F' (WTA).
+        nb_joueurs (int): Nombre de joueurs.
+        premiere_annee (int): Première année de matchs du circuit.
+        derniere_annee (int): Dernière année de matchs du circuit.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        pd.DataFrame:
+            Colonnes `COLONNES_JOUEURS_BRUTS` puis 'debut', 'fin' et
+            'niveau' (carrière, non écrites dans les fichiers).
+    """
+    debut = rng.integers(premiere_annee - 5, derniere_annee + 1, nb_joueurs)
+    duree = np.minimum(rng.geometric(0.15, nb_joueurs) - 1, 20)
+    age_debut = rng.integers(16, 23, nb_joueurs)
+
+    naissance = pd.to_datetime(
+        pd.DataFrame({
+            "year": debut - age_debut,
+            "month": rng.integers(1, 13, nb_joueurs),
+            "day": rng.integers(1, 29, nb_joueurs)
+        })
+        )
+    dob = naissance.dt.strftime("%Y%m%d").astype(float)
+    dob[rng.random(nb_joueurs) < 0.1] = np.nan
+
+    taille_moyenne = 185 if sexe == "H" else 172
+    height = np.round(rng.normal(taille_moyenne, 7, nb_joueurs))
+    height[rng.random(nb_joueurs) < 0.8] = np.nan
+
+    prenoms = PRENOMS[sexe]
+    return pd.DataFrame({
+        "player_id": np.arange(nb_joueurs) + PREMIER_ID[sexe],
+        "name_first": np.array(prenoms)[
+            rng.integers(0, len(prenoms), nb_joueurs)
+            ],
+        "name_last": np.array(NOMS)[rng.integers(0, len(NOMS), nb_joueurs)],
+        "hand": rng.choice(["R", "L", "U"], nb_joueurs, p=[0.8, 0.12, 0.08]),
+        "dob": dob,
+        "ioc": rng.choice(
+            NATIONALITES, nb_joueurs, p=FREQUENCES_NATIONALITES
+            ),
+        "height": height,
+        "wikidata_id": np.nan,
+        "debut": debut,
+        "fin": debut + duree,
+        "niveau": rng.normal(0, 1, nb_joueurs)
+    })
+
+
+def forces_annee(joueurs, annee):
+    """
+    Niveau de chaque joueur une année donnée.
+
+    Args:
+        joueurs (pd.DataFrame): Résultat de `creer_joueurs`.
+        annee (int): Année.
+
+    Returns:
+        np.ndarray:
+            Niveau de chaque joueur (ligne de `joueurs`), NaN pour un
+            joueur qui ne joue pas cette année-là.
+    """
+    debut = joueurs["debut"].to_numpy()
+    fin = joueurs["fin"].to_numpy()
+    progression = (annee - debut + 0.5) / (fin - debut + 1)
+    forces = joueurs["niveau"].to_numpy() + 0.6 * np.sin(np.pi * progression)
+    return np.where((annee >= debut) & (annee <= fin), forces, np.nan)
+
+
+def ordre_annee(joueurs, annee):
+    """
+    Classe les joueurs actifs d'une année du plus fort au plus faible.
+
+    Args:
+        joueurs (pd.DataFrame): Résultat de `creer_joueurs`.
+        annee (int): Année.
+
+    Returns:
+        tuple:
+            - np.ndarray : lignes de `joueurs` des joueurs actifs, dans
+              l'ordre du classement de l'année,
+            - np.ndarray : niveau de ces joueurs, dans le même ordre.
+    """
+    forces = forces_annee(joueurs, annee)
+    actifs = np.flatnonzero(~np.isnan(forces))
+    ordre = actifs[np.argsort(-forces[actifs], kind="stable")]
+    return ordre, forces[ordre]
+
+
+####################
+# Tableaux
+####################
+
+
+def lundis(annee):
+    """Retourne les dates (datetime64) des lundis d'une année."""
+    premier = pd.Timestamp(annee, 1, 1)
+    premier += pd.Timedelta(days=(7 - premier.weekday()) % 7)
+    return pd.date_range(premier, pd.Timestamp(annee, 12, 31), freq="7D")
+
+
+def arrondi_aleatoire(valeur, rng):
+    """Arrondit un nombre positif à l'entier inférieur ou supérieur, avec
+    une probabilité qui conserve sa valeur en moyenne."""
+    entier = int(np.floor(valeur))
+    return entier + int(rng.random() < valeur - entier)
+
+
+def tirer_entrants(nb_actifs, nb_tournois, taille, fenetre, rng):
+    """
+    Tire les joueurs de plusieurs tournois de même taille.
+
+    Chaque tournoi attire des joueurs de niveau proche : ses joueurs sont
+    tirés sans remise dans une tranche du classement de l'année, elle
+    même prise au hasard dans la fenêtre du type de tournoi.
+
+    Args:
+        nb_actifs (int): Nombre de joueurs actifs dans l'année.
+        nb_tournois (int): Nombre de tournois.
+        taille (int): Nombre de joueurs de chaque tournoi.
+        fenetre (tuple): Début et fin de la fenêtre, en proportion du
+            classement de l'année.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        np.ndarray:
+            Tableau (nb_tournois, taille) des positions des joueurs dans
+            le classement de l'année.
+    """
+    largeur = min(
+        max(taille, int((fenetre[1] - fenetre[0]) * nb_actifs)), nb_actifs
+        )
+    debut = min(int(fenetre[0] * nb_actifs), nb_actifs - largeur)
+    tranche = min(largeur, 4 * taille)
+
+    departs = debut + rng.integers(0, largeur - tranche + 1, nb_tournois)
+    cles = rng.random((nb_tournois, tranche))
+    tirages = np.argpartition(cles, taille - 1, axis=1)[:, :taille]
+    return departs[:, None] + tirages
+
+
+def jouer(a, b, forces, rng):
+    """
+    Joue des matchs entre les joueurs `a` et `b` (positions dans le
+    classement de l'année).
+
+    Returns:
+        tuple: Positions des vainqueurs et des perdants.
+    """
+    ecart = forces[a] - forces[b]
+    proba_a = 1 / (1 + np.exp(-SENSIBILITE_NIVEAU * ecart))
+    gagne_a = rng.random(a.shape) < proba_a
+    return np.where(gagne_a, a, b), np.where(gagne_a, b, a)
+
+
+def tableau_eliminatoire(entrants, rounds, forces, rng):
+    """
+    Joue des tableaux à élimination directe.
+
+    Args:
+        entrants (np.ndarray): Tableau (nb_tournois, taille) des joueurs.
+        rounds (list): Nom de chaque tour joué, du premier au dernier.
+        forces (np.ndarray): Niveau des joueurs (par position).
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        list: Un tuple (tournois, round, vainqueurs, perdants) par tour.
+    """
+    tournois = np.arange(len(entrants))
+    tours = []
+    for round_ in rounds:
+        vainqueurs, perdants = jouer(
+            entrants[:, 0::2], entrants[:, 1::2], forces, rng
+            )
+        tours.append((
+            np.repeat(tournois, vainqueurs.shape[1]), round_,
+            vainqueurs.ravel(), perdants.ravel()
+        ))
+        entrants = vainqueurs
+    return tours
+
+
+def tableau_round_robin(entrants, forces, rng):
+    """
+    Joue des tournois de 8 joueurs au Round Robin : deux poules de 4,
+    puis demi-finales croisées entre les deux premiers de chaque poule et
+    finale.
+
+    Args:
+        entrants (np.ndarray): Tableau (nb_tournois, 8) des joueurs.
+        forces (np.ndarray): Niveau des joueurs (par position).
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        list: Un tuple (tournois, round, vainqueurs, perdants) par tour.
+    """
+    nb_tournois = len(entrants)
+    tournois = np.arange(nb_tournois)
+    paires = [(i, j) for i in range(4) for j in range(i + 1, 4)]
+
+    tours = []
+    qualifies = []
+    for poule in (entrants[:, :4], entrants[:, 4:]):
+        victoires = rng.random((nb_tournois, 4)) / 2
+        for i, j in paires:
+            vainqueurs, perdants = jouer(poule[:, i], poule[:, j], forces, rng)
+            victoires[:, i] += vainqueurs == poule[:, i]
+            victoires[:, j] += vainqueurs == poule[:, j]
+            tours.append((tournois, "RR", vainqueurs, perdants))
+        rangs = np.argsort(-victoires, axis=1)
+        qualifies.append(np.take_along_axis(poule, rangs[:, :2], axis=1))
+
+    premiers_a, deuxiemes_a = qualifies[0][:, 0], qualifies[0][:, 1]
+    premiers_b, deuxiemes_b = qualifies[1][:, 0], qualifies[1][:, 1]
+    demi_1 = jouer(premiers_a, deuxiemes_b, forces, rng)
+    demi_2 = jouer(premiers_b, deuxiemes_a, forces, rng)
+    finale = jouer(demi_1[0], demi_2[0], forces, rng)
+
+    for vainqueurs, perdants in (demi_1, demi_2):
+        tours.append((tournois, "SF", vainqueurs, perdants))
+    tours.append((tournois, "F", finale[0], finale[1]))
+    return tours
+
+
+def rounds_tableau(format_, taille):
+    """
+    Noms des tours d'un tableau.
+
+    Args:
+        format_ (str): 'KO' ou 'Q' (voir `TOURNOIS`).
+        taille (int): Nombre de joueurs (puissance de 2).
+
+    Returns:
+        list: Noms des tours, du premier au dernier.
+    """
+    if format_ == "Q":
+        nb_tours = min(NB_TOURS_QUALIFICATION, int(np.log2(taille)))
+        return [f"Q{i}" for i in range(1, nb_tours + 1)]
+
+    noms = {taille_: round_ for round_, taille_ in TAILLE_PAR_ROUND.items()}
+    rounds = []
+    while taille >= 2:
+        rounds.append(noms[taille])
+        taille //= 2
+    return rounds
+
+
+def matchs_par_tableau(format_, taille):
+    """Nombre de matchs d'un tableau complet."""
+    if format_ == "RR":
+        return 15
+    if format_ == "Q":
+        return taille - taille // 2 ** NB_TOURS_QUALIFICATION
+    return taille - 1
+
+
+####################
+# Scores
+####################
+
+
+def generer_scores(sets_gagnants, rng):
+    """
+    Tire le score de chaque match, du point de vue du vainqueur.
+
+    Args:
+        sets_gagnants (np.ndarray): Nombre de sets à gagner (2 ou 3) de
+            chaque match.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        tuple:
+            - np.ndarray : scores ("6-4 3-6 7-6(5)", "6-2 3-1 RET",
+              "W/O"...),
+            - np.ndarray : nombre de sets joués (0 pour un forfait).
+    """
+    nb = len(sets_gagnants)
+    sets_perdus = np.zeros(nb, dtype=np.int64)
+    for gagnants, frequences in FREQUENCES_SETS_PERDUS.items():
+        lignes = sets_gagnants == gagnants
+        sets_perdus[lignes] = rng.choice(
+            len(frequences), lignes.sum(), p=frequences
+            )
+    nb_sets = sets_gagnants + sets_perdus
+
+    # Le vainqueur gagne le dernier set ; ses sets perdus sont répartis
+    # au hasard parmi les précédents
+    colonnes = np.arange(5)
+    cles = np.where(
+        colonnes < (nb_sets - 1)[:, None], rng.random((nb, 5)), np.inf
+        )
+    rangs = np.argsort(np.argsort(cles, axis=1), axis=1)
+    set_perdu = rangs < sets_perdus[:, None]
+
+    tirages = rng.choice(len(SCORES_SETS), (nb, 5), p=FREQUENCES_SETS)
+    haut, bas = SCORES_SETS[tirages, 0], SCORES_SETS[tirages, 1]
+    jeux_v = np.where(set_perdu, bas, haut)
+    jeux_p = np.where(set_perdu, haut, bas)
+    tiebreaks = np.where(
+        bas == 6, np.minimum(rng.geometric(0.25, (nb, 5)) - 1, 20), -1
+        )
+
+    # Abandons et disqualifications en cours de set, forfaits
+    issue = rng.random(nb)
+    abandon = issue < FREQUENCE_ABANDON
+    disqualification = (
+        (issue >= FREQUENCE_ABANDON)
+        & (issue < FREQUENCE_ABANDON + FREQUENCE_DISQUALIFICATION)
+        )
+    forfait = issue > 1 - FREQUENCE_FORFAIT
+    interrompu = abandon | disqualification
+    dernier_set = np.where(
+        interrompu, (rng.random(nb) * nb_sets).astype(np.int64), nb_sets - 1
+        )
+    partiel = interrompu[:, None] & (colonnes == dernier_set[:, None])
+    jeux_v = np.where(partiel, rng.integers(0, 6, (nb, 5)), jeux_v)
+    jeux_p = np.where(partiel, rng.integers(0, 6, (nb, 5)), jeux_p)
+    tiebreaks = np.where(partiel, -1, tiebreaks)
+
+    scores = np.full(nb, "", dtype=object)
+    for i in range(5):
+        texte = (
+            jeux_v[:, i].astype(str).astype(object) + "-"
+            + jeux_p[:, i].astype(str).astype(object)
+            )
+        texte = np.where(
+            tiebreaks[:, i] >= 0,
+            texte + "(" + tiebreaks[:, i].astype(str).astype(object) + ")",
+            texte
+            )
+        joue = i <= dernier_set
+        scores = np.where(
+            joue, scores + np.where(i > 0, " ", "") + texte, scores
+            )
+
+    scores = np.where(abandon, scores + " RET", scores)
+    scores = np.where(disqualification, scores + " DEF", scores)
+    scores = np.where(forfait, "W/O", scores)
+    nb_joues = np.where(forfait, 0, dernier_set + 1)
+
+    return scores, nb_joues
+
+
+####################
+# Matchs
+####################
+
+
+def calendrier(types, matchs_annee, nb_actifs, rng, plafonds=None):
+    """
+    Tire les tournois d'une année d'un fichier de matchs.
+
+    Les tournois au Round Robin (Masters de fin de saison) ont lieu une
+    fois par an ; les autres types se partagent les matchs restants. Les
+    matchs des qualifications qui dépassent leur plafond reviennent aux
+    types sans qualification, au prorata de leur part.
+
+    Args:
+        types (list): Types de tournois du fichier (voir `TOURNOIS`).
+        matchs_annee (float): Nombre de matchs visé pour l'année.
+        nb_actifs (int): Nombre de joueurs actifs dans l'année.
+        rng (np.random.Generator): Générateur aléatoire.
+        plafonds (dict, optional): Niveau -> nombre maximal de tableaux
+            de qualification (le nombre de tableaux principaux).
+
+    Returns:
+        list:
+            Un tuple (type de tournoi, taille du tableau, nombre de
+            tournois) par type joué cette année-là. Les tableaux trop
+            grands pour le nombre de joueurs actifs sont réduits.
+    """
+    tournois = []
+    for type_ in types:
+        if type_[1] == "RR" and type_[2] <= nb_actifs:
+            tournois.append((type_, type_[2], 1))
+            matchs_annee -= matchs_par_tableau("RR", type_[2])
+    matchs_annee = max(matchs_annee, 0)
+
+    # Qualifications d'abord, pour connaître les matchs à reporter
+    nombres = {}
+    report = 0.0
+    for type_ in types:
+        niveau, format_, taille, _, _, part = type_
+        if format_ != "Q":
+            continue
+        nb_tournois = arrondi_aleatoire(
+            matchs_annee * part / matchs_par_tableau(format_, taille), rng
+            )
+        if plafonds is not None:
+            nb_tournois = min(nb_tournois, plafonds.get(niveau, 0))
+        nombres[type_] = nb_tournois
+        report += max(
+            matchs_annee * part
+            - nb_tournois * matchs_par_tableau(format_, taille),
+            0
+            )
+
+    parts_libres = sum(
+        type_[5] for type_ in types if type_[1] not in ("RR", "Q")
+        )
+    for type_ in types:
+        _, format_, taille, _, _, part = type_
+        if format_ == "RR":
+            continue
+        if format_ != "Q":
+            matchs = matchs_annee * part + report * part / parts_libres
+            nombres[type_] = arrondi_aleatoire(
+                matchs / matchs_par_tableau(format_, taille), rng
+                )
+        nb_tournois = nombres[type_]
+        if taille > nb_actifs:
+            taille = 2 ** int(np.log2(max(nb_actifs, 1)))
+        if nb_tournois > 0 and taille >= 2:
+            tournois.append((type_, taille, nb_tournois))
+    return tournois
+
+
+def infos_tournois(type_, nb_tournois, annee, nb_semaines, sexe, rng):
+    """
+    Tire la semaine, le nom et la surface de tournois d'un même type.
+
+    Args:
+        type_ (tuple): Type des tournois (voir `TOURNOIS`).
+        nb_tournois (int): Nombre de tournois.
+        annee (int): Année.
+        nb_semaines (int): Nombre de lundis de l'année.
+        sexe (str): 'H' ou 'F'.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'semaine' (numéro du lundi, à partir de 0),
+            'tourney_name', 'tourney_level', 'surface' et 'sets_gagnants'.
+    """
+    niveau, format_, _, sets_gagnants, _, _ = type_
+
+    if niveau == "G":
+        numeros = np.arange(nb_tournois) % len(GRANDS_CHELEMS)
+        semaine = np.array([GRANDS_CHELEMS[i][0] for i in numeros])
+        nom = np.array([GRANDS_CHELEMS[i][1] for i in numeros])
+        surface = np.array([GRANDS_CHELEMS[i][2] for i in numeros])
+    else:
+        villes = np.array(VILLES)[rng.integers(0, len(VILLES), nb_tournois)]
+        if format_ == "RR":
+            semaine = np.full(nb_tournois, SEMAINE_MASTERS)
+            nom = np.full(nb_tournois, "Tour Finals")
+        else:
+            semaine = rng.integers(1, SEMAINE_MASTERS, nb_tournois)
+            # Tournois ITF : dotation devant le nom de la ville
+            nom = villes if niveau.isalpha() else (
+                ("M" if sexe == "H" else "W") + niveau + " " + villes
+                )
+        frequences = np.array(FREQUENCES_SURFACES)
+        if annee > DERNIERE_ANNEE_CARPET:
+            frequences[SURFACES.index("Carpet")] = 0
+        surface = rng.choice(
+            SURFACES, nb_tournois, p=frequences / frequences.sum()
+            )
+
+    return pd.DataFrame({
+        "semaine": np.minimum(semaine, nb_semaines) - 1,
+        "tourney_name": nom,
+        "tourney_level": niveau,
+        "surface": surface,
+        "sets_gagnants": sets_gagnants
+    })
+
+
+def generer_matchs_annee(fichier, annee, matchs_annee, joueurs, nb_classes,
+                         sexe, rng, tableaux=None):
+    """
+    Génère les matchs d'une année d'un fichier de matchs.
+
+    Les qualifications (format 'Q') sont celles de tournois du tableau
+    principal de même niveau et de même année, déjà générés : elles
+    reprennent leur tourney_id, leur date, leur nom et leur surface. Il
+    n'y a pas plus de qualifications que de tableaux principaux (voir
+    `calendrier`).
+
+    Args:
+        fichier (str): Fichier de matchs (clé de `TOURNOIS`).
+        annee (int): Année.
+        matchs_annee (float): Nombre de matchs visé pour l'année.
+        joueurs (pd.DataFrame): Résultat de `creer_joueurs`.
+        nb_classes (int): Nombre de joueurs classés cette année-là (les
+            autres ont un rang manquant).
+        sexe (str): 'H' ou 'F'.
+        rng (np.random.Generator): Générateur aléatoire.
+        tableaux (dict, optional): (année, niveau) -> tournois du tableau
+            principal (colonnes `COLONNES_TABLEAUX`). Complété avec les
+            tournois générés dont le niveau a des qualifications, et lu
+            pour les qualifications.
+
+    Returns:
+        pd.DataFrame: Matchs, colonnes de `SCHEMA_MATCHS`.
+    """
+    if tableaux is None:
+        tableaux = {}
+
+    ordre, forces = ordre_annee(joueurs, annee)
+    _, types = TOURNOIS[fichier]
+    semaines = lundis(annee)
+
+    tours = []
+    infos = []
+    premier_tournoi = 0
+    plafonds = {
+        niveau: len(principaux)
+        for (annee_tableau, niveau), principaux in tableaux.items()
+        if annee_tableau == annee
+    }
+    for type_, taille, nb_tournois in calendrier(
+            types, matchs_annee, len(ordre), rng, plafonds):
+        niveau, format_, _, sets_gagnants, fenetre, _ = type_
+        if format_ == "Q":
+            # Qualifications de tableaux principaux tirés au hasard
+            principaux = tableaux[(annee, niveau)]
+            choisis = np.sort(
+                rng.choice(len(principaux), nb_tournois, replace=False)
+                )
+            infos_type = principaux.iloc[choisis].assign(
+                tourney_level=niveau, sets_gagnants=sets_gagnants
+                )
+        else:
+            infos_type = infos_tournois(
+                type_, nb_tournois, annee, len(semaines), sexe, rng
+                )
+
+        entrants = tirer_entrants(
+            len(ordre), nb_tournois, taille, fenetre, rng
+            )
+        if format_ == "RR":
+            tours_type = tableau_round_robin(entrants, forces, rng)
+        else:
+            tours_type = tableau_eliminatoire(
+                entrants, rounds_tableau(format_, taille), forces, rng
+                )
+        for tournois, round_, vainqueurs, perdants in tours_type:
+            tours.append((
+                tournois + premier_tournoi, round_, vainqueurs, perdants
+            ))
+
+        infos.append(infos_type)
+        premier_tournoi += nb_tournois
+
+    if not tours:
+        return pd.DataFrame(columns=list(SCHEMA_MATCHS))
+
+    infos = pd.concat(infos, ignore_index=True)
+    infos["tourney_date"] = (
+        semaines[infos["semaine"].to_numpy()].strftime("%Y-%m-%d")
+    )
+
+    # Identifiants des nouveaux tournois dans l'ordre du calendrier (les
+    # qualifications ont déjà celui de leur tableau principal)
+    calendrier_ = np.argsort(infos["semaine"].to_numpy(), kind="stable")
+    numeros = np.empty(len(infos), dtype=np.int64)
+    numeros[calendrier_] = np.arange(len(infos))
+    if "tourney_id" in infos:
+        ids = infos["tourney_id"].to_numpy(dtype=object)
+    else:
+        ids = np.full(len(infos), None, dtype=object)
+    nouveaux = pd.isna(ids)
+    ordre_nouveaux = calendrier_[nouveaux[calendrier_]]
+    ids[ordre_nouveaux] = [
+        f"{annee}-{PREFIXES_TOURNOIS[fichier]}{numero:04d}"
+        for numero in range(len(ordre_nouveaux))
+    ]
+    infos["tourney_id"] = ids
+
+    # Tableaux principaux repris par les qualifications
+    principaux = infos[
+        nouveaux & infos["tourney_level"].isin(NIVEAUX_QUALIFIES).to_numpy()
+        ]
+    for niveau, groupe in principaux.groupby("tourney_level"):
+        tableaux[(annee, niveau)] = groupe[COLONNES_TABLEAUX].reset_index(
+            drop=True
+            )
+
+    # Un match par ligne, tours dans l'ordre de jeu
+    tournois = np.concatenate([t[0] for t in tours])
+    vainqueurs = np.concatenate([t[2] for t in tours])
+    perdants = np.concatenate([t[3] for t in tours])
+    rounds = np.concatenate([np.full(len(t[0]), t[1]) for t in tours])
+    ordre_matchs = np.lexsort((np.arange(len(tournois)), numeros[tournois]))
+    tournois = tournois[ordre_matchs]
+    vainqueurs = vainqueurs[ordre_matchs]
+    perdants = perdants[ordre_matchs]
+    rounds = rounds[ordre_matchs]
+    _, premiers, nb_matchs = np.unique(
+        numeros[tournois], return_index=True, return_counts=True
+        )
+    debut_tournoi = np.repeat(premiers, nb_matchs)
+
+    info_matchs = infos.iloc[tournois].reset_index(drop=True)
+    scores, nb_sets = generer_scores(
+        info_matchs["sets_gagnants"].to_numpy(), rng
+        )
+
+    nb = len(tournois)
+    colonnes = {
+        "annee": np.full(nb, annee),
+        "tourney_date": info_matchs["tourney_date"].to_numpy(),
+        "tourney_id": info_matchs["tourney_id"].to_numpy(),
+        "tourney_name": info_matchs["tourney_name"].to_numpy(),
+        "tourney_level": info_matchs["tourney_level"].to_numpy(),
+        "surface": info_matchs["surface"].to_numpy(),
+        "score": scores,
+        "round": rounds,
+        "match_num": np.arange(nb) - debut_tournoi + 1
+    }
+
+    statistiques = annee >= PREMIERE_ANNEE_STATISTIQUES
+    connu = statistiques & (nb_sets > 0)
+    colonnes["minutes"] = np.where(
+        connu, np.round(nb_sets * rng.normal(40, 8, nb)).clip(min=1), np.nan
+        )
+
+    classe = annee >= PREMIERE_ANNEE_CLASSEMENT[sexe]
+    noms = (joueurs["name_first"] + " " + joueurs["name_last"]).to_numpy()
+    for role, positions in (("winner", vainqueurs), ("loser", perdants)):
+        lignes = ordre[positions]
+        colonnes[f"{role}_id"] = joueurs["player_id"].to_numpy()[lignes]
+        colonnes[f"{role}_rank"] = np.where(
+            classe & (positions < nb_classes), positions + 1.0, np.nan
+            )
+        colonnes[f"{role}_ioc"] = joueurs["ioc"].to_numpy()[lignes]
+        colonnes[f"{role}_name"] = noms[lignes]
+        colonnes[f"{role}_hand"] = joueurs["hand"].to_numpy()[lignes]
+
+    # Balles de break : le perdant en concède davantage
+    for prefixe, moyenne in (("w", 1.2), ("l", 2.4)):
+        occasions = rng.poisson(moyenne * nb_sets)
+        sauvees = rng.binomial(occasions, 0.6)
+        colonnes[f"{prefixe}_bpSaved"] = np.where(connu, sauvees, np.nan)
+        colonnes[f"{prefixe}_bpFaced"] = np.where(connu, occasions, np.nan)
+
+    return pd.DataFrame(colonnes, columns=list(SCHEMA_MATCHS))
+
+
+def poids_annees(premiere_annee, derniere_annee):
+    """Part de chaque année dans le volume d'un fichier : le nombre de
+    matchs et de classés triple entre la première et la dernière année."""
+    annees = np.arange(premiere_annee, derniere_annee + 1)
+    poids = 1 + 2 * (annees - premiere_annee) / max(len(annees) - 1, 1)
+    return dict(zip(annees, poids / poids.sum()))
+
+
+def annees_fichier(fichier):
+    """Première et dernière année d'un fichier d'après son nom (par
+    exemple 'atp_matches_qual_1978_2024.csv')."""
+    premiere, derniere = re.findall(r"_(\d{4})", os.path.basename(fichier))
+    return int(premiere), int(derniere)
+
+
+def nb_classes_annee(sexe, echelle, annee, poids):
+    """Nombre de joueurs classés chaque semaine d'une année."""
+    return int(NB_CLASSEMENTS[sexe] * echelle * poids.get(annee, 0) / 52)
+
+
+def ecrire_par_annee(chemin, generer, annees):
+    """
+    Écrit un fichier CSV année par année, pour ne garder en mémoire que
+    les lignes d'une année.
+
+    Args:
+        chemin (str): Fichier écrit.
+        generer (callable): Fonction annee -> pd.DataFrame.
+        annees (iterable): Années, dans l'ordre.
+
+    Returns:
+        int: Nombre de lignes écrites.
+    """
+    nb_lignes = 0
+    with open(chemin + ".tmp", "w", encoding="utf-8", newline="") as f:
+        for i, annee in enumerate(annees):
+            data = generer(annee)
+            data.to_csv(f, index=False, header=i == 0)
+            nb_lignes += len(data)
+    os.replace(chemin + ".tmp", chemin)
+    return nb_lignes
+
+
+####################
+# Classements
+####################
+
+
+def generer_classements_annee(joueurs, annee, nb_classes, rng):
+    """
+    Génère les classements hebdomadaires d'une année.
+
+    Le niveau de chaque joueur glisse d'une semaine à l'autre de son
+    niveau de l'année vers celui de l'année suivante, avec un léger bruit.
+
+    Args:
+        joueurs (pd.DataFrame): Résultat de `creer_joueurs`.
+        annee (int): Année.
+        nb_classes (int): Nombre de joueurs classés chaque semaine.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        pd.DataFrame: Colonnes 'annee', 'ranking_date', 'rank', 'player'.
+    """
+    debut = forces_annee(joueurs, annee)
+    actifs = np.flatnonzero(~np.isnan(debut))
+    nb_classes = min(nb_classes, len(actifs))
+    semaines = lundis(annee)
+    if nb_classes == 0:
+        return pd.DataFrame(columns=["annee", "ranking_date", "rank",
+                                     "player"])
+
+    debut = debut[actifs]
+    fin = forces_annee(joueurs, annee + 1)[actifs]
+    fin = np.where(np.isnan(fin), debut - 0.3, fin)
+    avancement = np.linspace(0, 1, len(semaines))[:, None]
+    forces = (
+        (1 - avancement) * debut + avancement * fin
+        + rng.normal(0, 0.05, (len(semaines), len(actifs)))
+    )
+    meilleurs = np.argpartition(-forces, nb_classes - 1, axis=1)
+    meilleurs = meilleurs[:, :nb_classes]
+    rangs = np.argsort(
+        -np.take_along_axis(forces, meilleurs, axis=1), axis=1
+        )
+    classes = np.take_along_axis(meilleurs, rangs, axis=1)
+
+    return pd.DataFrame({
+        "annee": annee,
+        "ranking_date": np.repeat(
+            semaines.strftime("%Y-%m-%d"), nb_classes
+            ),
+        "rank": np.tile(np.arange(1, nb_classes + 1), len(semaines)),
+        "player": joueurs["player_id"].to_numpy()[actifs[classes.ravel()]]
+    })
+
+
+####################
+# Jeu complet
+####################
+
+
+def generer_donnees(dossier, echelle=1.0, graine=0, sexes=("H", "F"),
+                    statistiques=True):
+    """
+    Écrit un jeu de données synthétique aux formats lus par
+    l'application : fichiers de matchs, fichiers de joueurs (bruts et
+    complétés) et classements hebdomadaires, dans `dossier`/Donnees.
+
+    Args:
+        dossier (str):
+            Dossier où créer le dossier `Donnees` (celui depuis lequel
+            lancer l'application ou les mesures de performance).
+        echelle (float, optional):
+            Volume en multiple de celui des fichiers réels, entre
+            `ECHELLE_MIN` et `ECHELLE_MAX`.
+        graine (int, optional):
+            Graine du générateur aléatoire (même graine et même échelle :
+            mêmes fichiers).
+        sexes (iterable, optional):
+            Circuits à générer ('H' et/ou 'F').
+        statistiques (bool, optional):
+            Calcule les colonnes dérivées des fichiers de joueurs avec
+            `calculer_statistiques`.
+
+    Returns:
+        dict: Nombre de lignes écrites par fichier.
+    """
+    if not ECHELLE_MIN <= echelle <= ECHELLE_MAX:
+        raise ValueError(
+            f"Échelle hors de [{ECHELLE_MIN}, {ECHELLE_MAX}] : {echelle}"
+            )
+
+    rng = np.random.default_rng(graine)
+    os.makedirs(os.path.join(dossier, DOSSIER_DONNEES), exist_ok=True)
+    lignes = {}
+
+    for sexe in sexes:
+        premiere = min(annees_fichier(f)[0] for f in FICHIERS_MATCHS[sexe])
+        derniere = max(annees_fichier(f)[1] for f in FICHIERS_MATCHS[sexe])
+        joueurs = creer_joueurs(
+            sexe, max(int(NB_JOUEURS[sexe] * echelle), 50),
+            premiere, derniere, rng
+            )
+
+        brut = FICHIERS_JOUEURS_BRUTS[sexe]
+        joueurs[COLONNES_JOUEURS_BRUTS].to_csv(
+            os.path.join(dossier, brut), index=False
+            )
+        lignes[brut] = len(joueurs)
+
+        poids_classements = poids_annees(
+            PREMIERE_ANNEE_CLASSEMENT[sexe], derniere
+            )
+
+        def nb_classes(annee):
+            return nb_classes_annee(sexe, echelle, annee, poids_classements)
+
+        # Tableaux principaux de chaque année et niveau, repris par les
+        # qualifications (le fichier principal est généré en premier)
+        tableaux = {}
+        for fichier in FICHIERS_MATCHS[sexe]:
+            volume, _ = TOURNOIS[fichier]
+            debut, fin = annees_fichier(fichier)
+            poids = poids_annees(debut, fin)
+            lignes[fichier] = ecrire_par_annee(
+                os.path.join(dossier, fichier),
+                lambda annee: generer_matchs_annee(
+                    fichier, annee, volume * echelle * poids[annee],
+                    joueurs, nb_classes(annee), sexe, rng, tableaux
+                    ),
+                range(debut, fin + 1)
+                )
+
+        fichier = FICHIERS_CLASSEMENTS[sexe]
+        lignes[fichier] = ecrire_par_annee(
+            os.path.join(dossier, fichier),
+            lambda annee: generer_classements_annee(
+                joueurs, annee, nb_classes(annee), rng
+                ),
+            range(PREMIERE_ANNEE_CLASSEMENT[sexe], derniere + 1)
+            )
+
+    # Les nouveaux fichiers remplacent les données gardées en mémoire
+    invalider_matchs()
+    invalider_classements()
+
+    if statistiques:
+        # Le calcul lit les fichiers relativement au dossier courant
+        dossier_courant = os.getcwd()
+        os.chdir(dossier)
+        try:
+            for sexe in sexes:
+                calculer_statistiques(
+                    sexe, FICHIERS_JOUEURS_BRUTS[sexe], FICHIERS_JOUEURS[sexe]
+                    )
+                lignes[FICHIERS_JOUEURS[sexe]] = lignes[
+                    FICHIERS_JOUEURS_BRUTS[sexe]
+                    ]
+        finally:
+            os.chdir(dossier_courant)
+
+    return lignes
+
+
+def main(arguments=None):
+    """
+    Point d'entrée en ligne de commande :
+    python -m tennis_app.donnees.generateur --dossier ... [--echelle 0.1]
+    [--graine 0] [--sexe H|F] [--sans-statistiques]
+    """
+    parser = argparse.ArgumentParser(
+        description="Génère un jeu de données synthétique ATP/WTA aux "
+                    "formats des fichiers de l'application."
+        )
+    parser.add_argument(
+        "--dossier", required=True,
+        help="Dossier où créer le dossier Donnees."
+        )
+    parser.add_argument(
+        "--echelle", type=float, default=1.0,
+        help="Volume en multiple de celui des fichiers réels "
+             f"(de {ECHELLE_MIN} à {ECHELLE_MAX}, par défaut 1)."
+        )
+    parser.add_argument(
+        "--graine", type=int, default=0, help="Graine aléatoire."
+        )
+    parser.add_argument(
+        "--sexe", choices=["H", "F"], action="append",
+        help="Circuit à générer (par défaut les deux)."
+        )
+    parser.add_argument(
+        "--sans-statistiques", action="store_true",
+        help="N'ajoute pas les colonnes calculées aux fichiers de joueurs."
+        )
+    arguments = parser.parse_args(arguments)
+
+    if not ECHELLE_MIN <= arguments.echelle <= ECHELLE_MAX:
+        parser.error(
+            f"l'échelle doit être comprise entre {ECHELLE_MIN} et "
+            f"{ECHELLE_MAX}"
+            )
+
+    lignes = generer_donnees(
+        arguments.dossier, arguments.echelle, arguments.graine,
+        arguments.sexe or ["H", "F"], not arguments.sans_statistiques
+        )
+    for fichier, nb_lignes in lignes.items():
+        print(f"✅ {fichier} : {nb_lignes} lignes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import json
+import os
+
+import numpy as np
+
+from .profilage import compter, profiler
+
+
+def construire_index_joueurs(id_gagnants, id_perdants):
+    """
+    Construit l'index inversé joueur -> lignes de la table des matchs.
+
+    L'index est stocké sous forme compacte (trois tableaux) : les lignes
+    où apparaît le joueur `joueurs[k]` (vainqueur ou perdant) sont
+    `lignes[offsets[k]:offsets[k + 1]]`, triées par ordre croissant.
+
+    Args:
+        id_gagnants (np.ndarray):
+            Identifiants des vainqueurs, une valeur par ligne de la table.
+        id_perdants (np.ndarray):
+            Identifiants des perdants, une valeur par ligne de la table.
+
+    Returns:
+        tuple:
+            - joueurs (np.ndarray): identifiants triés des joueurs,
+            - offsets (np.ndarray): début de chaque joueur dans `lignes`
+              (avec la fin du dernier joueur en dernière position),
+            - lignes (np.ndarray): positions des matchs, groupées par
+              joueur.
+    """
+    nb_matchs = len(id_gagnants)
+    ids = np.concatenate([id_gagnants, id_perdants])
+    positions = np.tile(np.arange(nb_matchs, dtype=np.int64), 2)
+
+    # Tri par joueur puis par position dans la table
+    ordre = np.lexsort((positions, ids))
+    ids = ids[ordre]
+    lignes = positions[ordre]
+
+    joueurs, debuts = np.unique(ids, return_index=True)
+    offsets = np.append(debuts, len(ids)).astype(np.int64)
+
+    return joueurs, offsets, lignes
+
+
+def chercher_lignes(index, id_joueur):
+    """
+    Retourne les lignes de la table des matchs où apparaît un joueur.
+
+    Args:
+        index (tuple):
+            Index construit par `construire_index_joueurs`.
+        id_joueur (int):
+            Identifiant du joueur.
+
+    Returns:
+        np.ndarray:
+            Positions triées des matchs du joueur (vide s'il n'a joué
+            aucun match).
+    """
+    joueurs, offsets, lignes = index
+
+    k = np.searchsorted(joueurs, id_joueur)
+    if k == len(joueurs) or joueurs[k] != id_joueur:
+        return lignes[:0]
+
+    return lignes[offsets[k]:offsets[k + 1]]
+
+
+def sauvegarder_tableaux(chemin, tableaux, signature):
+    """
+    Enregistre des tableaux NumPy sur disque avec la signature des
+    fichiers à partir desquels ils ont été calculés.
+
+    Args:
+        chemin (str): Chemin du fichier .npz.
+        tableaux (dict): Tableaux à enregistrer, par nom.
+        signature (list): Signatures des fichiers sources.
+    """
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+
+    with open(chemin + ".tmp", "wb") as f:
+        np.savez(f, signature=np.array(json.dumps(signature)), **tableaux)
+    os.replace(chemin + ".tmp", chemin)
+
+
+@profiler
+def charger_tableaux(chemin, signature):
+    """
+    Recharge des tableaux enregistrés s'ils correspondent aux fichiers
+    sources actuels.
+
+    Args:
+        chemin (str): Chemin du fichier .npz.
+        signature (list): Signatures actuelles des fichiers sources.
+
+    Returns:
+        dict or None:
+            Les tableaux par nom, ou None si le fichier est absent ou
+            calculé à partir d'autres versions des fichiers.
+    """
+    if not os.path.exists(chemin):
+        return None
+
+    with np.load(chemin) as fichier:
+        if json.loads(str(fichier["signature"])) != signature:
+            return None
+        tableaux = {
+            nom: fichier[nom] for nom in fichier.files if nom != "signature"
+        }
+
+    compter(octets=os.path.getsize(chemin))
+    return tableaux
+
+
+def sauvegarder_index(chemin, index, signature):
+    """
+    Enregistre un index joueur sur disque avec la signature des fichiers
+    de matchs.
+
+    Args:
+        chemin (str): Chemin du fichier .npz.
+        index (tuple): Tableaux de l'index.
+        signature (list): Signatures des fichiers de matchs utilisés.
+    """
+    joueurs, offsets, lignes = index
+    sauvegarder_tableaux(
+        chemin,
+        {"joueurs": joueurs, "offsets": offsets, "lignes": lignes},
+        signature
+        )
+
+
+def charger_index(chemin, signature):
+    """
+    Recharge un index joueur enregistré s'il correspond aux fichiers
+    actuels.
+
+    Args:
+        chemin (str): Chemin du fichier .npz.
+        signature (list): Signatures actuelles des fichiers de matchs.
+
+    Returns:
+        tuple or None:
+            Les tableaux de l'index, ou None si le fichier est absent ou
+            construit à partir d'autres versions des fichiers.
+    """
+    tableaux = charger_tableaux(chemin, signature)
+    if tableaux is None:
+        return None
+
+    return tableaux["joueurs"], tableaux["offsets"], tableaux["lignes"]
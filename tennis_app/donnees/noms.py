@@ -0,0 +1,63 @@
+import unicodedata
+
+import pandas as pd
+
+
+def normaliser_nom(texte):
+    """
+    Ramène un prénom ou un nom à une forme canonique pour la recherche.
+
+    Les accents sont retirés, la casse est ignorée et les espaces sont
+    réduits : "  Gaël ", "GAEL" et "gael" donnent tous "gael".
+
+    Args:
+        texte (str): Prénom ou nom (une valeur manquante donne "").
+
+    Returns:
+        str: Forme normalisée.
+    """
+    if texte is None or pd.isna(texte):
+        return ""
+
+    decompose = unicodedata.normalize("NFKD", str(texte))
+    sans_accent = "".join(
+        c for c in decompose if not unicodedata.combining(c)
+        )
+    return " ".join(sans_accent.casefold().split())
+
+
+def construire_index_noms(prenoms, noms):
+    """
+    Construit l'index (prénom, nom) normalisés -> positions des joueurs.
+
+    Args:
+        prenoms (iterable): Prénom de chaque joueur.
+        noms (iterable): Nom de chaque joueur, dans le même ordre.
+
+    Returns:
+        dict:
+            Clé (prénom, nom) normalisés, valeur liste des positions des
+            joueurs portant ce nom (plusieurs positions pour des
+            homonymes).
+    """
+    index = {}
+    for position, (prenom, nom) in enumerate(zip(prenoms, noms)):
+        cle = (normaliser_nom(prenom), normaliser_nom(nom))
+        index.setdefault(cle, []).append(position)
+
+    return index
+
+
+def chercher_positions(index, prenom, nom):
+    """
+    Retourne les positions des joueurs portant un prénom et un nom.
+
+    Args:
+        index (dict): Index construit par `construire_index_noms`.
+        prenom (str): Prénom recherché (tel que saisi).
+        nom (str): Nom recherché (tel que saisi).
+
+    Returns:
+        list: Positions des joueurs correspondants (vide si aucun).
+    """
+    return index.get((normaliser_nom(prenom), normaliser_nom(nom)), [])
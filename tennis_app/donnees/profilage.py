@@ -0,0 +1,241 @@
+import atexit
+import functools
+import json
+import os
+import time
+import tracemalloc
+
+
+# Variable d'environnement qui active le profilage : "1" (trace dans
+# `FICHIER_TRACE`) ou chemin du fichier de trace
+VARIABLE_PROFIL = "TENNIS_PROFIL"
+
+# Fichier de trace par défaut, dans le dossier courant
+FICHIER_TRACE = "profil_trace.json"
+
+# Nombre de fonctions affichées dans le rapport de fin
+NB_LIGNES_RAPPORT = 20
+
+# Configuration du profilage (vide tant qu'il n'est pas activé)
+_config = {}
+
+# Appels terminés, dans l'ordre de fin
+_appels = []
+
+# Appels en cours, du plus ancien au plus récent
+_pile = []
+
+
+def activer(fichier=FICHIER_TRACE):
+    """
+    Active le profilage pour le reste du processus.
+
+    À partir de cet appel, chaque fonction décorée par `profiler` relève
+    sa durée, son pic de mémoire (tracemalloc), les octets lus sur disque
+    et les lignes parcourues. À la fin du processus, un rapport est
+    affiché et la trace est écrite dans `fichier`.
+
+    tracemalloc ralentit les allocations : les durées relevées servent à
+    comparer les actions entre elles, pas à mesurer leur durée normale
+    (voir `benchmarks.suite` pour cela).
+
+    Args:
+        fichier (str, optional): Fichier JSON de la trace.
+    """
+    if not _config:
+        atexit.register(terminer)
+    _config["fichier"] = os.path.abspath(fichier)
+    _config["pid"] = os.getpid()
+    _config.setdefault("debut", time.perf_counter())
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def profilage_actif():
+    """Indique si le profilage est activé."""
+    return bool(_config)
+
+
+def profiler(fonction):
+    """
+    Décorateur : relève la durée, le pic de mémoire, les octets lus et les
+    lignes parcourues de chaque appel de la fonction quand le profilage
+    est activé. Sinon la fonction est appelée directement.
+
+    Les mesures d'un appel incluent celles des fonctions profilées qu'il
+    appelle.
+    """
+    nom = fonction.__qualname__
+
+    @functools.wraps(fonction)
+    def fonction_profilee(*args, **kwargs):
+        if not _config:
+            return fonction(*args, **kwargs)
+
+        # Le pic atteint jusqu'ici revient aux appels en cours, avant que
+        # la remise à zéro ne l'efface
+        memoire, pic = tracemalloc.get_traced_memory()
+        for appel in _pile:
+            appel["pic"] = max(appel["pic"], pic)
+        tracemalloc.reset_peak()
+
+        appel = {
+            "nom": nom,
+            "argument": " ".join(a for a in args if isinstance(a, str)),
+            "profondeur": len(_pile),
+            "memoire_debut": memoire,
+            "pic": memoire,
+            "octets": 0,
+            "lignes": 0
+        }
+        _pile.append(appel)
+        debut = time.perf_counter()
+        try:
+            return fonction(*args, **kwargs)
+        finally:
+            duree = time.perf_counter() - debut
+            _, pic = tracemalloc.get_traced_memory()
+            _pile.pop()
+            pic = max(appel["pic"], pic)
+            if _pile:
+                _pile[-1]["pic"] = max(_pile[-1]["pic"], pic)
+            _appels.append({
+                "nom": nom,
+                "argument": appel["argument"],
+                "profondeur": appel["profondeur"],
+                "debut_s": round(debut - _config["debut"], 6),
+                "duree_s": round(duree, 6),
+                "pic_memoire_mo": round(
+                    (pic - appel["memoire_debut"]) / 2**20, 3
+                    ),
+                "octets_lus": appel["octets"],
+                "lignes_parcourues": appel["lignes"]
+            })
+
+    return fonction_profilee
+
+
+def compter(octets=0, lignes=0):
+    """
+    Ajoute des octets lus sur disque et des lignes parcourues à tous les
+    appels profilés en cours.
+
+    Les lignes parcourues sont les lignes lues dans un fichier ou
+    extraites d'une table en mémoire et remises au code appelant.
+
+    Args:
+        octets (int, optional): Octets lus.
+        lignes (int, optional): Lignes parcourues.
+    """
+    for appel in _pile:
+        appel["octets"] += int(octets)
+        appel["lignes"] += int(lignes)
+
+
+def resumer(appels=None):
+    """
+    Regroupe les appels par fonction.
+
+    Args:
+        appels (list, optional): Appels relevés (par défaut ceux du
+            processus).
+
+    Returns:
+        list:
+            Un dictionnaire par fonction (nombre d'appels, durées totale
+            et maximale, pic de mémoire maximal, octets lus et lignes
+            parcourues au total), par durée totale décroissante.
+    """
+    if appels is None:
+        appels = _appels
+
+    fonctions = {}
+    for appel in appels:
+        resume = fonctions.setdefault(appel["nom"], {
+            "nom": appel["nom"],
+            "nb_appels": 0,
+            "duree_totale_s": 0.0,
+            "duree_max_s": 0.0,
+            "pic_memoire_mo": 0.0,
+            "octets_lus": 0,
+            "lignes_parcourues": 0
+        })
+        resume["nb_appels"] += 1
+        resume["duree_totale_s"] += appel["duree_s"]
+        resume["duree_max_s"] = max(resume["duree_max_s"], appel["duree_s"])
+        resume["pic_memoire_mo"] = max(
+            resume["pic_memoire_mo"], appel["pic_memoire_mo"]
+            )
+        resume["octets_lus"] += appel["octets_lus"]
+        resume["lignes_parcourues"] += appel["lignes_parcourues"]
+
+    return sorted(
+        fonctions.values(), key=lambda r: r["duree_totale_s"], reverse=True
+        )
+
+
+def afficher_rapport(resume, nb_lignes=NB_LIGNES_RAPPORT):
+    """
+    Affiche les fonctions les plus coûteuses.
+
+    Args:
+        resume (list): Résultat de `resumer`.
+        nb_lignes (int, optional): Nombre de fonctions affichées.
+    """
+    print("\n=== Profilage (durées et mesures incluant les appels "
+          "imbriqués) ===")
+    print(f"{'Fonction':<36}{'appels':>7}{'total (s)':>11}{'max (s)':>10}"
+          f"{'mémoire (Mo)':>14}{'lu (Mo)':>10}{'lignes':>12}")
+    for ligne in resume[:nb_lignes]:
+        print(
+            f"{ligne['nom'][:35]:<36}{ligne['nb_appels']:>7}"
+            f"{ligne['duree_totale_s']:>11.3f}{ligne['duree_max_s']:>10.3f}"
+            f"{ligne['pic_memoire_mo']:>14.1f}"
+            f"{ligne['octets_lus'] / 2**20:>10.1f}"
+            f"{ligne['lignes_parcourues']:>12}"
+            )
+
+
+def ecrire_trace(fichier, resume, appels=None):
+    """
+    Écrit la trace JSON : le résumé par fonction et tous les appels, du
+    plus long au plus court.
+
+    Args:
+        fichier (str): Fichier écrit.
+        resume (list): Résultat de `resumer`.
+        appels (list, optional): Appels relevés (par défaut ceux du
+            processus).
+    """
+    if appels is None:
+        appels = _appels
+
+    contenu = {
+        "fonctions": resume,
+        "appels": sorted(appels, key=lambda a: a["duree_s"], reverse=True)
+    }
+    with open(fichier, "w", encoding="utf-8") as f:
+        json.dump(contenu, f, ensure_ascii=False, indent=2)
+
+
+def terminer():
+    """Affiche le rapport et écrit la trace (appelée à la fin du
+    processus quand le profilage est activé)."""
+    # Les processus fils (calcul des statistiques) héritent de l'état
+    # du profilage mais n'écrivent pas la trace
+    if not _appels or os.getpid() != _config["pid"]:
+        return
+
+    resume = resumer()
+    afficher_rapport(resume)
+    ecrire_trace(_config["fichier"], resume)
+    print(f"Trace du profilage écrite dans : {_config['fichier']}")
+
+
+# Activation par variable d'environnement, dès l'import
+if os.environ.get(VARIABLE_PROFIL, "") not in ("", "0"):
+    activer(
+        FICHIER_TRACE if os.environ[VARIABLE_PROFIL] == "1"
+        else os.environ[VARIABLE_PROFIL]
+        )
@@ -0,0 +1,141 @@
+import os
+
+import pandas as pd
+
+from .tournois import TYPE_ROUND
+
+
+# Colonnes des fichiers de matchs et leur type en mémoire
+# (object = texte, category = petit nombre de valeurs répétées,
+# TYPE_ROUND = catégories ordonnées du premier tour à la finale)
+SCHEMA_MATCHS = {
+    "annee": "int16",
+    "tourney_date": "object",
+    "tourney_id": "object",
+    "tourney_name": "object",
+    "tourney_level": "category",
+    "surface": "category",
+    "score": "object",
+    "round": TYPE_ROUND,
+    "match_num": "int32",
+    "minutes": "float32",
+    "winner_id": "int32",
+    "winner_rank": "float32",
+    "winner_ioc": "category",
+    "winner_name": "object",
+    "winner_hand": "category",
+    "loser_id": "int32",
+    "loser_rank": "float32",
+    "loser_ioc": "category",
+    "loser_name": "object",
+    "loser_hand": "category",
+    "w_bpSaved": "float32",
+    "w_bpFaced": "float32",
+    "l_bpSaved": "float32",
+    "l_bpFaced": "float32"
+}
+
+# Colonnes des fichiers joueurs complétés (*_players.csv)
+SCHEMA_JOUEURS = {
+    "player_id": "int32",
+    "name_first": "object",
+    "name_last": "object",
+    "hand": "category",
+    "dob": "object",
+    "ioc": "category",
+    "first_match_date": "object",
+    "last_match_date": "object",
+    "nb_tournois_joue": "float32",
+    "nb_tournois_gagne": "float32",
+    "nb_matchs_joue": "float32",
+    "nb_matchs_gagne": "float32",
+    "prop_vic_set_1_perdu": "float32",
+    "prop_balle_break_sauvee": "float32",
+    "nb_sem_classe": "float32",
+    "nb_sem_1_10": "float32",
+    "nb_sem_11_50": "float32",
+    "nb_sem_51_100": "float32"
+}
+
+# Colonnes des fichiers de classement (*_rankings.csv)
+SCHEMA_CLASSEMENTS = {
+    "annee": "int16",
+    "ranking_date": "object",
+    "rank": "int32",
+    "player": "int32"
+}
+
+
+def schema_fichier(fichier):
+    """
+    Retourne le schéma correspondant à un fichier de données d'après
+    son nom.
+
+    Args:
+        fichier (str):
+            Chemin du fichier (par exemple 'Donnees/atp_rankings.csv').
+
+    Returns:
+        dict or None:
+            Dictionnaire colonne -> type, ou None si le fichier n'est pas
+            un fichier de matchs, de joueurs ou de classement.
+    """
+    nom = os.path.basename(fichier)
+
+    if "_matches_" in nom:
+        return SCHEMA_MATCHS
+    elif "_players" in nom:
+        return SCHEMA_JOUEURS
+    elif "_rankings" in nom:
+        return SCHEMA_CLASSEMENTS
+
+    return None
+
+
+def types_colonnes(schema, colonnes):
+    """
+    Restreint un schéma aux colonnes présentes.
+
+    Args:
+        schema (dict or None):
+            Dictionnaire colonne -> type.
+        colonnes (iterable):
+            Colonnes effectivement présentes ou demandées.
+
+    Returns:
+        dict: Types des colonnes du schéma présentes dans `colonnes`.
+    """
+    if schema is None:
+        return {}
+
+    return {
+        colonne: type_
+        for colonne, type_ in schema.items()
+        if colonne in colonnes
+    }
+
+
+def remettre_categories(data, schema):
+    """
+    Remet au type catégoriel du schéma les colonnes qui l'ont perdu, par
+    exemple après la concaténation de fichiers dont les catégories
+    diffèrent.
+
+    Args:
+        data (pd.DataFrame): Données à corriger.
+        schema (dict): Dictionnaire colonne -> type.
+
+    Returns:
+        pd.DataFrame: Données dont les colonnes catégorielles sont typées.
+    """
+    for colonne, type_ in schema.items():
+        if colonne not in data.columns:
+            continue
+
+        if isinstance(type_, pd.CategoricalDtype):
+            if data[colonne].dtype != type_:
+                data[colonne] = data[colonne].astype(type_)
+        elif type_ == "category" and data[colonne].dtype.name != "category":
+            data[colonne] = data[colonne].astype("category")
+
+    return data
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+
+
+# Nombre maximal de sets d'un match
+NB_SETS_MAX = 5
+
+# Un set : jeux du vainqueur du match, jeux du perdant, points du perdant
+# du tie-break entre parenthèses ; un super tie-break est noté entre
+# crochets, par exemple "6-4 3-6 [10-8]"
+MOTIF_SET = r"(?P<crochet>\[)?(?P<v>\d+)-(?P<p>\d+)(?:\((?P<tb>\d+)\))?"
+
+# Issue du match
+STATUT_COMPLET = 0
+STATUT_ABANDON = 1
+STATUT_DISQUALIFICATION = 2
+STATUT_FORFAIT = 3
+STATUT_INCONNU = 4
+
+# Libellé de chaque statut (indexé par le code)
+LIBELLES_STATUT = np.array(
+    ["", "abandon", "disqualification", "forfait", "score inconnu"],
+    dtype=object
+    )
+
+# Colonnes calculées à partir du score
+COLONNES_SCORE = (
+    [f"jeux_v{i}" for i in range(1, NB_SETS_MAX + 1)]
+    + [f"jeux_p{i}" for i in range(1, NB_SETS_MAX + 1)]
+    + [f"tiebreak{i}" for i in range(1, NB_SETS_MAX + 1)]
+    + ["super_tiebreak", "statut", "nb_sets", "sets_v", "sets_p",
+       "total_jeux_v", "total_jeux_p"]
+)
+
+
+def analyser_scores(scores):
+    """
+    Analyse d'un coup tous les scores d'une table de matchs.
+
+    Tous les sets de tous les scores sont extraits en une seule passe
+    (`str.extractall`), puis rangés dans des tableaux d'entiers : aucune
+    boucle sur les matchs.
+
+    Args:
+        scores (pd.Series):
+            Scores du point de vue du vainqueur, par exemple
+            "7-6(5) 3-6 6-2", "6-4 2-1 RET", "W/O" ou "6-3 4-6 [10-7]".
+
+    Returns:
+        pd.DataFrame:
+            Une ligne par score, dans le même ordre (index 0 à n - 1),
+            colonnes de `COLONNES_SCORE` :
+                - 'jeux_v1' à 'jeux_v5', 'jeux_p1' à 'jeux_p5' : jeux du
+                  vainqueur et du perdant du match dans chaque set (-1 si
+                  le set n'a pas été joué ; points pour un super
+                  tie-break),
+                - 'tiebreak1' à 'tiebreak5' : points du perdant du
+                  tie-break (-1 sans tie-break),
+                - 'super_tiebreak' : vrai si le dernier set est un super
+                  tie-break,
+                - 'statut' : issue du match (`STATUT_COMPLET`,
+                  `STATUT_ABANDON`, `STATUT_DISQUALIFICATION`,
+                  `STATUT_FORFAIT` ou `STATUT_INCONNU`),
+                - 'nb_sets' : nombre de sets (même commencés) du score,
+                - 'sets_v', 'sets_p' : sets terminés gagnés par le
+                  vainqueur et par le perdant,
+                - 'total_jeux_v', 'total_jeux_p' : jeux gagnés par chacun
+                  (super tie-break exclu).
+    """
+    scores = pd.Series(scores).astype("string").reset_index(drop=True)
+    n = len(scores)
+
+    # Un élément par set trouvé : (numéro du match, rang du set)
+    sets = scores.str.extractall(MOTIF_SET)
+    lignes = sets.index.get_level_values(0).to_numpy()
+    rangs = sets.index.get_level_values(1).to_numpy()
+    gardes = rangs < NB_SETS_MAX
+    sets, lignes, rangs = sets[gardes], lignes[gardes], rangs[gardes]
+
+    jeux_v = np.full((n, NB_SETS_MAX), -1, dtype=np.int16)
+    jeux_p = np.full((n, NB_SETS_MAX), -1, dtype=np.int16)
+    tiebreaks = np.full((n, NB_SETS_MAX), -1, dtype=np.int16)
+    crochets = np.zeros((n, NB_SETS_MAX), dtype=bool)
+
+    jeux_v[lignes, rangs] = sets["v"].to_numpy(dtype=np.int16)
+    jeux_p[lignes, rangs] = sets["p"].to_numpy(dtype=np.int16)
+    tiebreaks[lignes, rangs] = (
+        pd.to_numeric(sets["tb"]).fillna(-1).to_numpy(dtype=np.int16)
+    )
+    crochets[lignes, rangs] = sets["crochet"].notna().to_numpy()
+
+    nb_sets = np.bincount(lignes, minlength=n).astype(np.int8)
+
+    # Sets terminés : 6 jeux avec 2 d'écart, tie-break (7-6), ou super
+    # tie-break à 10 points avec 2 d'écart
+    haut = np.maximum(jeux_v, jeux_p)
+    ecart = np.abs(jeux_v - jeux_p)
+    normal = (jeux_v >= 0) & ~crochets
+    termine = (
+        (normal & (haut >= 6) & ((ecart >= 2) | (haut == 7)))
+        | (crochets & (haut >= 10) & (ecart >= 2))
+    )
+
+    # Issue du match, d'après les mentions du score
+    texte = scores.str.upper()
+    statut = np.full(n, STATUT_COMPLET, dtype=np.int8)
+    statut[(nb_sets == 0) | scores.isna().to_numpy()] = STATUT_INCONNU
+    for motif, code in [
+            (r"RET|ABN|ABD", STATUT_ABANDON),
+            (r"DEF", STATUT_DISQUALIFICATION),
+            (r"W/O|WALKOVER|\bWO\b", STATUT_FORFAIT)]:
+        statut[texte.str.contains(motif).fillna(False).to_numpy(bool)] = code
+
+    colonnes = {}
+    for i in range(NB_SETS_MAX):
+        colonnes[f"jeux_v{i + 1}"] = jeux_v[:, i]
+    for i in range(NB_SETS_MAX):
+        colonnes[f"jeux_p{i + 1}"] = jeux_p[:, i]
+    for i in range(NB_SETS_MAX):
+        colonnes[f"tiebreak{i + 1}"] = tiebreaks[:, i]
+    colonnes["super_tiebreak"] = crochets.any(axis=1)
+    colonnes["statut"] = statut
+    colonnes["nb_sets"] = nb_sets
+    colonnes["sets_v"] = (
+        (termine & (jeux_v > jeux_p)).sum(axis=1).astype(np.int8)
+    )
+    colonnes["sets_p"] = (
+        (termine & (jeux_p > jeux_v)).sum(axis=1).astype(np.int8)
+    )
+    colonnes["total_jeux_v"] = (
+        np.where(normal, jeux_v, 0).sum(axis=1).astype(np.int16)
+    )
+    colonnes["total_jeux_p"] = (
+        np.where(normal, jeux_p, 0).sum(axis=1).astype(np.int16)
+    )
+
+    return pd.DataFrame(colonnes)
+
+
+def matchs_termines(scores):
+    """
+    Sélectionne les matchs joués jusqu'au bout, sans super tie-break.
+
+    Args:
+        scores (pd.DataFrame): Résultat de `analyser_scores`.
+
+    Returns:
+        np.ndarray: Masque booléen, un élément par match.
+    """
+    return (
+        (scores["statut"].to_numpy() == STATUT_COMPLET)
+        & ~scores["super_tiebreak"].to_numpy()
+    )
+
+
+def libeller_statuts(statuts):
+    """
+    Traduit des codes de statut en libellés.
+
+    Args:
+        statuts (array-like): Codes de statut (colonne 'statut').
+
+    Returns:
+        np.ndarray: Libellés ('' pour un match complet).
+    """
+    return LIBELLES_STATUT[np.asarray(statuts, dtype=np.int64)]
@@ -0,0 +1,847 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .cache import (
+    DOSSIER_CACHE,
+    charger_derive,
+    lire_donnees,
+    lire_par_morceaux,
+    sauvegarder_derive
+)
+from .schemas import schema_fichier, types_colonnes
+from .scores import analyser_scores
+from .stockage import (
+    FICHIERS_JOUEURS,
+    fichiers_classements,
+    fichiers_matchs,
+    invalider_classements,
+    invalider_joueurs,
+    invalider_matchs
+)
+
+
+# Fichiers des joueurs avant ajout des statistiques
+FICHIERS_JOUEURS_BRUTS = {
+    "H": "Donnees/atp_players_comp.csv",
+    "F": "Donnees/wta_players_comp.csv"
+}
+
+# Colonnes d'identité gardées du fichier brut
+COLONNES_IDENTITE = [
+    "player_id", "name_first", "name_last", "hand", "dob", "ioc"
+]
+
+# Colonnes calculées, dans l'ordre des fichiers de joueurs
+COLONNES_STATISTIQUES = [
+    "first_match_date", "last_match_date",
+    "nb_tournois_joue", "nb_tournois_gagne",
+    "nb_matchs_joue", "nb_matchs_gagne",
+    "nb_sem_classe", "nb_sem_1_10", "nb_sem_11_50", "nb_sem_51_100",
+    "prop_vic_set_1_perdu", "prop_balle_break_sauvee"
+]
+
+# Colonnes des matchs utilisées par le calcul
+COLONNES_MATCHS = [
+    "tourney_id", "tourney_date", "round", "score",
+    "winner_id", "loser_id",
+    "w_bpSaved", "w_bpFaced", "l_bpSaved", "l_bpFaced"
+]
+
+# Colonnes des classements utilisées par le calcul
+COLONNES_CLASSEMENTS = ["rank", "player"]
+
+# Mémoire maximale par défaut de chaque processus de calcul, en Mo
+MEMOIRE_MAX_PROCESSUS = 512
+
+# Mémoire de travail d'un morceau, en multiple de la mémoire de ses lignes
+# (table longue vainqueurs + perdants, colonnes intermédiaires)
+FACTEUR_MEMOIRE = 8
+
+# Nombre d'octets de fin de fichier gardés dans l'état d'un fichier déjà
+# traité, pour vérifier qu'il n'a été modifié que par ajout de lignes
+TAILLE_EMPREINTE = 4096
+
+
+####################
+# Agrégats bruts (sommes et comptes, avant les proportions)
+####################
+
+
+def _indicatrice(condition, connu):
+    """Retourne 1.0 / 0.0 selon `condition`, NaN là où `connu` est faux."""
+    return np.where(connu, condition.astype(float), np.nan)
+
+
+def lignes_joueurs_matchs(data):
+    """
+    Réorganise les matchs en une ligne par joueur et par match.
+
+    Args:
+        data (pd.DataFrame): Matchs (colonnes de `COLONNES_MATCHS`).
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'player_id', 'tourney_id', 'tourney_date', 'gagne',
+            'titre', 'set_1_perdu' (1, 0 ou NaN), 'balles_break' et
+            'balles_break_sauvees'.
+    """
+    scores = analyser_scores(data["score"])
+    jeux_vainqueur = scores["jeux_v1"].to_numpy()
+    jeux_perdant = scores["jeux_p1"].to_numpy()
+    connu = jeux_vainqueur >= 0
+    finale = (data["round"].astype(object) == "F").to_numpy()
+
+    commun = {
+        "tourney_id": data["tourney_id"].to_numpy(),
+        "tourney_date": data["tourney_date"].to_numpy()
+    }
+    vainqueurs = pd.DataFrame({
+        "player_id": data["winner_id"].to_numpy(),
+        **commun,
+        "gagne": 1,
+        "titre": finale,
+        "set_1_perdu": _indicatrice(jeux_vainqueur < jeux_perdant, connu),
+        "balles_break": data["w_bpFaced"].to_numpy(dtype=float),
+        "balles_break_sauvees": data["w_bpSaved"].to_numpy(dtype=float)
+    })
+    perdants = pd.DataFrame({
+        "player_id": data["loser_id"].to_numpy(),
+        **commun,
+        "gagne": 0,
+        "titre": False,
+        # Le perdant a perdu le premier set si le vainqueur l'a gagné
+        "set_1_perdu": _indicatrice(jeux_vainqueur > jeux_perdant, connu),
+        "balles_break": data["l_bpFaced"].to_numpy(dtype=float),
+        "balles_break_sauvees": data["l_bpSaved"].to_numpy(dtype=float)
+    })
+
+    return pd.concat([vainqueurs, perdants], ignore_index=True)
+
+
+def agreger_matchs(data):
+    """
+    Calcule les agrégats bruts de matchs de chaque joueur, en une passe
+    groupée sur toute la table.
+
+    Les agrégats de plusieurs morceaux de matchs se combinent avec
+    `fusionner_matchs` : le résultat est le même que sur la table entière.
+
+    Args:
+        data (pd.DataFrame): Matchs (colonnes de `COLONNES_MATCHS`).
+
+    Returns:
+        dict:
+            - 'joueurs' : DataFrame indexée par 'player_id' (dates du
+              premier et du dernier match, nombres de matchs joués et
+              gagnés, de matchs avec premier set perdu et gagnés malgré
+              tout, de balles de break concédées et sauvées),
+            - 'tournois' : DataFrame des couples distincts ('player_id',
+              'tourney_id'), avec 'titre' vrai si le joueur a gagné la
+              finale.
+    """
+    lignes = lignes_joueurs_matchs(data)
+    lignes["vic_set_1_perdu"] = lignes["set_1_perdu"] * lignes["gagne"]
+
+    joueurs = lignes.groupby("player_id").agg(
+        first_match_date=("tourney_date", "min"),
+        last_match_date=("tourney_date", "max"),
+        nb_matchs_joue=("gagne", "size"),
+        nb_matchs_gagne=("gagne", "sum"),
+        nb_matchs_set_1_perdu=("set_1_perdu", "sum"),
+        nb_vic_set_1_perdu=("vic_set_1_perdu", "sum"),
+        nb_balles_break=("balles_break", "sum"),
+        nb_balles_break_sauvees=("balles_break_sauvees", "sum")
+    )
+    tournois = lignes.groupby(
+        ["player_id", "tourney_id"], as_index=False
+        )["titre"].max()
+
+    return {"joueurs": joueurs, "tournois": tournois}
+
+
+def fusionner_matchs(agregats):
+    """
+    Combine les agrégats de matchs de plusieurs morceaux.
+
+    Le résultat ne dépend que de l'ordre de la liste, pas de la façon
+    dont les morceaux ont été calculés (même processus ou non).
+
+    Args:
+        agregats (list): Résultats de `agreger_matchs`.
+
+    Returns:
+        dict: Agrégats combinés, au format de `agreger_matchs`.
+    """
+    joueurs = pd.concat([agregat["joueurs"] for agregat in agregats])
+    fonctions = {
+        colonne: "sum" for colonne in joueurs.columns
+    }
+    fonctions["first_match_date"] = "min"
+    fonctions["last_match_date"] = "max"
+
+    tournois = pd.concat([agregat["tournois"] for agregat in agregats])
+
+    return {
+        "joueurs": joueurs.groupby(level=0).agg(fonctions),
+        "tournois": tournois.groupby(
+            ["player_id", "tourney_id"], as_index=False
+            )["titre"].max()
+    }
+
+
+def agreger_classements(data):
+    """
+    Compte les semaines de classement de chaque joueur, par palier.
+
+    Args:
+        data (pd.DataFrame): Classements (colonnes 'rank' et 'player').
+
+    Returns:
+        pd.DataFrame:
+            Indexée par 'player_id' : 'nb_sem_classe', 'nb_sem_1_10',
+            'nb_sem_11_50' et 'nb_sem_51_100'.
+    """
+    rang = data["rank"]
+    paliers = pd.DataFrame({
+        "player_id": data["player"].to_numpy(),
+        "nb_sem_classe": (rang >= 0).to_numpy(),
+        "nb_sem_1_10": ((rang >= 1) & (rang <= 10)).to_numpy(),
+        "nb_sem_11_50": ((rang >= 11) & (rang <= 50)).to_numpy(),
+        "nb_sem_51_100": ((rang >= 51) & (rang <= 100)).to_numpy()
+    })
+
+    return paliers.groupby("player_id").sum()
+
+
+def fusionner_classements(agregats):
+    """
+    Combine les agrégats de classement de plusieurs morceaux.
+
+    Args:
+        agregats (list): Résultats de `agreger_classements`.
+
+    Returns:
+        pd.DataFrame: Agrégats combinés.
+    """
+    return pd.concat(agregats).groupby(level=0).sum()
+
+
+####################
+# Calcul parallèle, par fichier et par morceaux
+####################
+
+
+def lignes_par_morceau(fichier, colonnes, memoire_max):
+    """
+    Estime le nombre de lignes d'un fichier qu'un processus peut traiter
+    d'un coup sans dépasser sa mémoire maximale.
+
+    Args:
+        fichier (str): Fichier de matchs ou de classements.
+        colonnes (list): Colonnes lues.
+        memoire_max (float): Mémoire maximale d'un processus, en Mo.
+
+    Returns:
+        int: Nombre de lignes par morceau.
+    """
+    echantillon = pd.read_csv(
+        fichier, usecols=colonnes, nrows=1000, low_memory=False
+        )
+    if echantillon.empty:
+        return 1000
+
+    octets = (
+        echantillon.memory_usage(index=False, deep=True).sum()
+        / len(echantillon)
+    )
+    return max(1000, int(memoire_max * 2**20 / (octets * FACTEUR_MEMOIRE)))
+
+
+def _traitement(fichier):
+    """
+    Retourne les colonnes lues et les fonctions d'agrégation et de fusion
+    d'un fichier de matchs ou de classements.
+    """
+    if "_matches_" in os.path.basename(fichier):
+        return COLONNES_MATCHS, agreger_matchs, fusionner_matchs
+    return COLONNES_CLASSEMENTS, agreger_classements, fusionner_classements
+
+
+def agreger_fichier(fichier, memoire_max=MEMOIRE_MAX_PROCESSUS):
+    """
+    Calcule les agrégats bruts d'un fichier de matchs ou de classements,
+    morceau par morceau.
+
+    Args:
+        fichier (str): Fichier de matchs ou de classements.
+        memoire_max (float, optional): Mémoire maximale, en Mo.
+
+    Returns:
+        dict or pd.DataFrame:
+            Résultat de `agreger_matchs` (fichier de matchs) ou de
+            `agreger_classements` (fichier de classements).
+    """
+    colonnes, agreger, fusionner = _traitement(fichier)
+    nb_lignes = lignes_par_morceau(fichier, colonnes, memoire_max)
+
+    # Les agrégats sont combinés au fil de la lecture : seuls un morceau
+    # et les agrégats déjà calculés sont en mémoire
+    agregat = None
+    for morceau in lire_par_morceaux(fichier, colonnes, nb_lignes):
+        partiel = agreger(morceau)
+        agregat = partiel if agregat is None else fusionner([agregat, partiel])
+
+    if agregat is None:
+        agregat = agreger(pd.DataFrame(columns=colonnes))
+
+    return agregat
+
+
+def calculer_agregats(sexe, nb_processus=None,
+                      memoire_max=MEMOIRE_MAX_PROCESSUS):
+    """
+    Calcule les agrégats bruts de tous les joueurs d'un circuit.
+
+    Chaque fichier (matchs du circuit principal, des qualifications, des
+    futures, des nouvelles saisons, classements) est traité par un
+    processus, morceau par morceau ; les agrégats partiels sont ensuite
+    combinés dans l'ordre des fichiers, ce qui rend le résultat
+    indépendant du nombre de processus.
+
+    Args:
+        sexe (str):
+            'H' (ATP) ou 'F' (WTA).
+        nb_processus (int, optional):
+            Nombre de processus. Si None, un par cœur disponible (sans
+            dépasser le nombre de fichiers).
+        memoire_max (float, optional):
+            Mémoire maximale de chaque processus, en Mo.
+
+    Returns:
+        tuple:
+            (agrégats de matchs, agrégats de classement), aux formats de
+            `agreger_matchs` et `agreger_classements`.
+    """
+    fichiers_m = fichiers_matchs(sexe)
+    fichiers = fichiers_m + fichiers_classements(sexe)
+    if nb_processus is None:
+        nb_processus = min(len(fichiers), os.cpu_count() or 1)
+
+    if nb_processus <= 1:
+        agregats = [
+            agreger_fichier(fichier, memoire_max) for fichier in fichiers
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+            agregats = list(executeur.map(
+                agreger_fichier, fichiers, [memoire_max] * len(fichiers)
+                ))
+
+    return (
+        fusionner_matchs(agregats[:len(fichiers_m)]),
+        fusionner_classements(agregats[len(fichiers_m):])
+    )
+
+
+####################
+# Statistiques finales
+####################
+
+
+def _proportion(numerateur, denominateur):
+    """Retourne numerateur / denominateur * 100, 0 si le dénominateur
+    est nul."""
+    resultat = np.zeros(len(numerateur))
+    np.divide(
+        numerateur.to_numpy(dtype=float) * 100,
+        denominateur.to_numpy(dtype=float),
+        out=resultat,
+        where=denominateur.to_numpy() > 0
+        )
+    return resultat
+
+
+def finaliser_statistiques(agregats_matchs, agregats_classements):
+    """
+    Calcule les statistiques des joueurs à partir des agrégats bruts.
+
+    Args:
+        agregats_matchs (dict): Résultat de `agreger_matchs`.
+        agregats_classements (pd.DataFrame):
+            Résultat de `agreger_classements`.
+
+    Returns:
+        pd.DataFrame:
+            Indexée par 'player_id', colonnes de `COLONNES_STATISTIQUES`.
+    """
+    matchs = agregats_matchs["joueurs"].copy()
+
+    tournois = agregats_matchs["tournois"].groupby("player_id")["titre"]
+    matchs["nb_tournois_joue"] = (
+        tournois.size().reindex(matchs.index, fill_value=0)
+    )
+    matchs["nb_tournois_gagne"] = (
+        tournois.sum().reindex(matchs.index, fill_value=0)
+    )
+
+    matchs["prop_vic_set_1_perdu"] = _proportion(
+        matchs["nb_vic_set_1_perdu"], matchs["nb_matchs_set_1_perdu"]
+        )
+    matchs["prop_balle_break_sauvee"] = _proportion(
+        matchs["nb_balles_break_sauvees"], matchs["nb_balles_break"]
+        )
+
+    statistiques = matchs.join(agregats_classements, how="outer")
+    return statistiques.reindex(columns=COLONNES_STATISTIQUES)
+
+
+def convertir_dob(dob):
+    """
+    Met les dates de naissance au format AAAA-MM-JJ.
+
+    Args:
+        dob (pd.Series):
+            Dates au format AAAAMMJJ (éventuellement lues comme des
+            nombres, par exemple "19870522.0") ou déjà au format
+            AAAA-MM-JJ.
+
+    Returns:
+        pd.Series: Dates au format AAAA-MM-JJ (NaN si invalides).
+    """
+    texte = dob.astype("string").str.replace(r"\.0$", "", regex=True)
+    dates = pd.to_datetime(texte, format="%Y%m%d", errors="coerce")
+    iso = pd.to_datetime(texte, format="%Y-%m-%d", errors="coerce")
+    return dates.fillna(iso).dt.strftime("%Y-%m-%d")
+
+
+def completer_joueurs(joueurs, statistiques):
+    """
+    Ajoute les statistiques à la table des joueurs.
+
+    Les colonnes calculées déjà présentes sont remplacées : le calcul peut
+    être relancé sur un fichier déjà complété.
+
+    Args:
+        joueurs (pd.DataFrame): Table des joueurs (au moins
+            `COLONNES_IDENTITE`).
+        statistiques (pd.DataFrame): Résultat de `finaliser_statistiques`.
+
+    Returns:
+        pd.DataFrame:
+            Colonnes `COLONNES_IDENTITE` puis `COLONNES_STATISTIQUES`.
+    """
+    joueurs = joueurs[COLONNES_IDENTITE].copy()
+    joueurs["dob"] = convertir_dob(joueurs["dob"])
+
+    return joueurs.merge(
+        statistiques, left_on="player_id", right_index=True, how="left"
+        )
+
+
+####################
+# Pipeline complet
+####################
+
+
+def calculer_statistiques(sexe, source=None, sortie=None,
+                          nb_processus=None,
+                          memoire_max=MEMOIRE_MAX_PROCESSUS):
+    """
+    Calcule les statistiques de tous les joueurs d'un circuit et écrit le
+    fichier de joueurs complété.
+
+    Args:
+        sexe (str):
+            'H' (ATP) ou 'F' (WTA).
+        source (str, optional):
+            Fichier des joueurs à compléter. Par défaut le fichier brut
+            (`FICHIERS_JOUEURS_BRUTS`) s'il existe, sinon le fichier de
+            joueurs actuel.
+        sortie (str, optional):
+            Fichier écrit. Par défaut le fichier de joueurs de
+            l'application (`FICHIERS_JOUEURS`).
+        nb_processus (int, optional):
+            Nombre de processus (voir `calculer_agregats`).
+        memoire_max (float, optional):
+            Mémoire maximale de chaque processus, en Mo.
+
+    Returns:
+        pd.DataFrame: Table des joueurs complétée.
+    """
+    if source is None:
+        source = FICHIERS_JOUEURS_BRUTS[sexe]
+        if not os.path.exists(source):
+            source = FICHIERS_JOUEURS[sexe]
+    if sortie is None:
+        sortie = FICHIERS_JOUEURS[sexe]
+
+    # État des fichiers relevé avant leur lecture : une ligne ajoutée
+    # pendant le calcul sera prise en compte par la prochaine mise à jour
+    etat = etat_sources(sexe, sortie)
+
+    agregats_matchs, agregats_classements = calculer_agregats(
+        sexe, nb_processus, memoire_max
+        )
+    statistiques = finaliser_statistiques(
+        agregats_matchs, agregats_classements
+        )
+    joueurs = completer_joueurs(lire_donnees(source), statistiques)
+
+    _ecrire_joueurs(joueurs, sortie)
+    sauvegarder_etat(sexe, etat, agregats_matchs, agregats_classements)
+
+    return joueurs
+
+
+def _ecrire_joueurs(joueurs, sortie):
+    """Écrit un fichier de joueurs (écriture atomique, sans colonne
+    d'index) et oublie les tables de joueurs gardées en mémoire."""
+    joueurs.to_csv(sortie + ".tmp", index=False)
+    os.replace(sortie + ".tmp", sortie)
+    invalider_joueurs()
+
+
+####################
+# Mise à jour incrémentale
+####################
+
+
+def etat_fichier(fichier, taille=None):
+    """
+    Relève l'état d'un fichier source : sa taille et une empreinte de ses
+    derniers octets.
+
+    Args:
+        fichier (str): Chemin du fichier.
+        taille (int, optional): Taille à considérer (par défaut la taille
+            actuelle) : l'empreinte porte sur les octets qui la précèdent.
+
+    Returns:
+        dict: 'taille' et 'fin'.
+    """
+    if taille is None:
+        taille = os.path.getsize(fichier)
+
+    debut = max(0, taille - TAILLE_EMPREINTE)
+    with open(fichier, "rb") as f:
+        f.seek(debut)
+        fin = f.read(taille - debut)
+
+    return {"taille": taille, "fin": hashlib.sha1(fin).hexdigest()}
+
+
+def etat_sources(sexe, sortie):
+    """
+    Relève l'état de tous les fichiers de matchs et de classement d'un
+    circuit.
+
+    Args:
+        sexe (str): 'H' (ATP) ou 'F' (WTA).
+        sortie (str): Fichier de joueurs complété à partir de ces fichiers.
+
+    Returns:
+        dict: 'sortie' et 'fichiers' (chemin -> état du fichier).
+    """
+    return {
+        "sortie": os.path.normpath(sortie),
+        "fichiers": {
+            fichier: etat_fichier(fichier)
+            for fichier in fichiers_matchs(sexe) + fichiers_classements(sexe)
+        }
+    }
+
+
+def _chemin_etat(sexe):
+    """Retourne le chemin du fichier d'état des statistiques d'un
+    circuit."""
+    return os.path.join(DOSSIER_CACHE, f"statistiques_{sexe}.json")
+
+
+def sauvegarder_etat(sexe, etat, agregats_matchs, agregats_classements):
+    """
+    Enregistre les agrégats bruts d'un circuit et l'état des fichiers à
+    partir desquels ils ont été calculés.
+
+    Args:
+        sexe (str): 'H' (ATP) ou 'F' (WTA).
+        etat (dict): Résultat de `etat_sources`.
+        agregats_matchs (dict): Agrégats de matchs (`agreger_matchs`).
+        agregats_classements (pd.DataFrame):
+            Agrégats de classement (`agreger_classements`).
+    """
+    sauvegarder_derive(
+        f"statistiques_joueurs_{sexe}", agregats_matchs["joueurs"], etat
+        )
+    sauvegarder_derive(
+        f"statistiques_tournois_{sexe}", agregats_matchs["tournois"], etat
+        )
+    sauvegarder_derive(
+        f"statistiques_classements_{sexe}", agregats_classements, etat
+        )
+
+    # L'état est écrit en dernier : il n'existe que si les agrégats
+    # correspondants sont complets
+    if os.path.isdir(DOSSIER_CACHE):
+        chemin = _chemin_etat(sexe)
+        with open(chemin + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(etat, f)
+        os.replace(chemin + ".tmp", chemin)
+
+
+def charger_etat(sexe):
+    """
+    Recharge les agrégats bruts d'un circuit et l'état des fichiers à
+    partir desquels ils ont été calculés.
+
+    Args:
+        sexe (str): 'H' (ATP) ou 'F' (WTA).
+
+    Returns:
+        tuple or None:
+            (état, agrégats de matchs, agrégats de classement), ou None si
+            aucun calcul complet n'a été enregistré.
+    """
+    chemin = _chemin_etat(sexe)
+    if not os.path.exists(chemin):
+        return None
+
+    with open(chemin, encoding="utf-8") as f:
+        etat = json.load(f)
+
+    joueurs = charger_derive(f"statistiques_joueurs_{sexe}", etat)
+    tournois = charger_derive(f"statistiques_tournois_{sexe}", etat)
+    classements = charger_derive(f"statistiques_classements_{sexe}", etat)
+    if joueurs is None or tournois is None or classements is None:
+        return None
+
+    return etat, {"joueurs": joueurs, "tournois": tournois}, classements
+
+
+def lire_lignes_ajoutees(fichier, debut):
+    """
+    Lit les lignes ajoutées à la fin d'un fichier CSV, sans relire les
+    précédentes.
+
+    Args:
+        fichier (str): Fichier de matchs ou de classements.
+        debut (int): Taille du fichier avant l'ajout, en octets.
+
+    Returns:
+        pd.DataFrame: Lignes ajoutées, colonnes utiles au calcul.
+    """
+    colonnes, _, _ = _traitement(fichier)
+    with open(fichier, "rb") as f:
+        entete = f.readline()
+        f.seek(debut)
+        ajout = f.read()
+
+    data = pd.read_csv(
+        io.BytesIO(entete + ajout), usecols=colonnes, low_memory=False
+        )
+    return data.astype(types_colonnes(schema_fichier(fichier), data.columns))
+
+
+def agregats_ajouts(etat, fichiers):
+    """
+    Calcule les agrégats des lignes ajoutées depuis le dernier calcul.
+
+    Args:
+        etat (dict): État enregistré (voir `etat_sources`).
+        fichiers (list): Fichiers de matchs ou de classements actuels.
+
+    Returns:
+        list or None:
+            Agrégats des lignes ajoutées (un par fichier modifié), ou None
+            si un fichier déjà traité a été modifié autrement que par un
+            ajout de lignes.
+    """
+    connus = etat["fichiers"]
+    agregats = []
+    for fichier in fichiers:
+        ancien = connus.get(fichier)
+        taille = os.path.getsize(fichier)
+
+        if ancien is None:
+            # Nouveau fichier (nouvelle saison) : lu en entier
+            agregats.append(agreger_fichier(fichier))
+        elif taille == ancien["taille"]:
+            if etat_fichier(fichier) != ancien:
+                return None
+        elif (taille > ancien["taille"]
+              and etat_fichier(fichier, ancien["taille"]) == ancien):
+            _, agreger, _ = _traitement(fichier)
+            agregats.append(
+                agreger(lire_lignes_ajoutees(fichier, ancien["taille"]))
+                )
+        else:
+            return None
+
+    return agregats
+
+
+def mettre_a_jour_statistiques(sexe, sortie=None,
+                               memoire_max=MEMOIRE_MAX_PROCESSUS):
+    """
+    Met à jour les statistiques d'un circuit après l'arrivée de nouveaux
+    matchs ou de nouvelles semaines de classement.
+
+    Seules les lignes ajoutées aux fichiers (ou les nouveaux fichiers de
+    saison) sont lues ; elles sont agrégées puis combinées aux agrégats
+    enregistrés par le calcul précédent, et seules les lignes des joueurs
+    concernés sont modifiées dans le fichier de joueurs. Sans calcul
+    précédent enregistré, ou si un fichier déjà traité a été modifié
+    autrement que par un ajout, tout est recalculé.
+
+    Args:
+        sexe (str):
+            'H' (ATP) ou 'F' (WTA).
+        sortie (str, optional):
+            Fichier de joueurs mis à jour. Par défaut le fichier de
+            joueurs de l'application (`FICHIERS_JOUEURS`).
+        memoire_max (float, optional):
+            Mémoire maximale, en Mo, pour la lecture des nouveaux fichiers.
+
+    Returns:
+        pd.DataFrame:
+            Lignes des joueurs mises à jour (toute la table en cas de
+            recalcul complet).
+    """
+    if sortie is None:
+        sortie = FICHIERS_JOUEURS[sexe]
+
+    nouvel_etat = etat_sources(sexe, sortie)
+    enregistre = charger_etat(sexe)
+    if (enregistre is None
+            or enregistre[0]["sortie"] != nouvel_etat["sortie"]
+            or not os.path.exists(sortie)):
+        print("Aucun calcul précédent utilisable : recalcul complet.")
+        return calculer_statistiques(sexe, sortie=sortie,
+                                     memoire_max=memoire_max)
+
+    etat, agregats_matchs, agregats_classements = enregistre
+    if set(etat["fichiers"]) - set(nouvel_etat["fichiers"]):
+        print("Fichiers supprimés depuis le dernier calcul : "
+              "recalcul complet.")
+        return calculer_statistiques(sexe, sortie=sortie,
+                                     memoire_max=memoire_max)
+
+    ajouts_matchs = agregats_ajouts(etat, fichiers_matchs(sexe))
+    ajouts_classements = agregats_ajouts(etat, fichiers_classements(sexe))
+    if ajouts_matchs is None or ajouts_classements is None:
+        print("Fichiers modifiés (pas seulement complétés) : "
+              "recalcul complet.")
+        return calculer_statistiques(sexe, sortie=sortie,
+                                     memoire_max=memoire_max)
+
+    if not ajouts_matchs and not ajouts_classements:
+        return pd.DataFrame(columns=["player_id"] + COLONNES_STATISTIQUES)
+
+    # Joueurs dont au moins un agrégat change
+    concernes = pd.Index(np.unique(np.concatenate(
+        [ajout["joueurs"].index.to_numpy() for ajout in ajouts_matchs]
+        + [ajout.index.to_numpy() for ajout in ajouts_classements]
+        )))
+
+    agregats_matchs = fusionner_matchs([agregats_matchs] + ajouts_matchs)
+    agregats_classements = fusionner_classements(
+        [agregats_classements] + ajouts_classements
+        )
+
+    tournois = agregats_matchs["tournois"]
+    statistiques = finaliser_statistiques(
+        {
+            "joueurs": agregats_matchs["joueurs"].loc[
+                agregats_matchs["joueurs"].index.intersection(concernes)
+                ],
+            "tournois": tournois[tournois["player_id"].isin(concernes)]
+        },
+        agregats_classements.loc[
+            agregats_classements.index.intersection(concernes)
+            ]
+        )
+
+    joueurs = pd.read_csv(sortie, low_memory=False)
+    lignes = joueurs["player_id"].isin(statistiques.index).to_numpy()
+    for colonne in COLONNES_STATISTIQUES:
+        valeurs = statistiques[colonne].reindex(joueurs["player_id"])
+        joueurs[colonne] = pd.Series(
+            valeurs.to_numpy(), index=joueurs.index
+            ).where(lignes, joueurs[colonne])
+
+    _ecrire_joueurs(joueurs, sortie)
+    sauvegarder_etat(sexe, nouvel_etat, agregats_matchs,
+                     agregats_classements)
+
+    # Les nouveaux matchs et classements doivent être relus par
+    # l'application
+    invalider_matchs(sexe)
+    invalider_classements(sexe)
+
+    return joueurs[lignes].reset_index(drop=True)
+
+
+def main(arguments=None):
+    """
+    Point d'entrée en ligne de commande :
+    python -m tennis_app.donnees.statistiques [--sexe H|F] [--source ...]
+    [--sortie ...] [--processus N] [--memoire Mo] [--incremental]
+    """
+    parser = argparse.ArgumentParser(
+        description="Calcule les statistiques des joueurs et écrit les "
+                    "fichiers de joueurs complétés."
+        )
+    parser.add_argument(
+        "--sexe", choices=["H", "F"], action="append",
+        help="Circuit à traiter (par défaut les deux)."
+        )
+    parser.add_argument("--source", help="Fichier des joueurs à compléter.")
+    parser.add_argument("--sortie", help="Fichier de joueurs écrit.")
+    parser.add_argument(
+        "--processus", type=int,
+        help="Nombre de processus (par défaut un par cœur)."
+        )
+    parser.add_argument(
+        "--memoire", type=float, default=MEMOIRE_MAX_PROCESSUS,
+        help="Mémoire maximale de chaque processus, en Mo "
+             f"(par défaut {MEMOIRE_MAX_PROCESSUS})."
+        )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Ne traite que les matchs et classements ajoutés depuis le "
+             "dernier calcul (sans --source)."
+        )
+    arguments = parser.parse_args(arguments)
+
+    # La mise à jour part du fichier de joueurs déjà complété (--sortie)
+    if arguments.incremental and arguments.source is not None:
+        parser.error(
+            "--source ne s'utilise pas avec --incremental : la mise à jour "
+            "modifie le fichier --sortie"
+            )
+
+    for sexe in arguments.sexe or ["H", "F"]:
+        if arguments.incremental:
+            print(f"Mise à jour des statistiques ({sexe})...")
+            joueurs = mettre_a_jour_statistiques(
+                sexe, arguments.sortie, arguments.memoire
+                )
+            print(f"✅ {len(joueurs)} joueurs mis à jour.")
+            continue
+
+        print(f"Calcul des statistiques ({sexe})...")
+        joueurs = calculer_statistiques(
+            sexe, arguments.source, arguments.sortie,
+            arguments.processus, arguments.memoire
+            )
+        print(f"✅ {len(joueurs)} joueurs complétés.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,916 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from .cache import (
+    DOSSIER_CACHE,
+    DOSSIER_DONNEES,
+    charger_derive,
+    lire_donnees,
+    sauvegarder_derive,
+    signature_source
+)
+from .classements import (
+    aligner_series,
+    construire_instantanes,
+    construire_series_classement,
+    instantane,
+    serie_joueur
+)
+from .face_a_face import (
+    charger_face_a_face,
+    construire_face_a_face,
+    sauvegarder_face_a_face
+)
+from .index import (
+    charger_index,
+    charger_tableaux,
+    chercher_lignes,
+    construire_index_joueurs,
+    sauvegarder_index,
+    sauvegarder_tableaux
+)
+from .noms import chercher_positions, construire_index_noms
+from .profilage import compter, profiler
+from .schemas import SCHEMA_JOUEURS, SCHEMA_MATCHS, remettre_categories
+from .scores import COLONNES_SCORE, analyser_scores
+from .tournois import construire_table_tournois
+
+
+FICHIERS_MATCHS = {
+    "H": [
+        "Donnees/atp_matches_1968_2024.csv",
+        "Donnees/atp_matches_futures_1992_2024.csv",
+        "Donnees/atp_matches_qual_1978_2024.csv"
+        ],
+    "F": [
+        "Donnees/wta_matches_1968_2024.csv",
+        "Donnees/wta_matches_qual_1968_2024.csv"
+        ]
+}
+
+FICHIERS_JOUEURS = {
+    "H": "Donnees/atp_players.csv",
+    "F": "Donnees/wta_players.csv"
+}
+
+FICHIERS_CLASSEMENTS = {
+    "H": "Donnees/atp_rankings.csv",
+    "F": "Donnees/wta_rankings.csv"
+}
+
+# Tables de matchs déjà chargées, partagées par tout le processus
+_matchs = {}
+
+# Index joueur -> lignes de chaque table de matchs
+_index_joueurs = {}
+
+# Table des formats de tournoi (une ligne par tourney_id)
+_tournois = {}
+
+# Matrices de face-à-face et index des paires de joueurs
+_face_a_face = {}
+
+# Classements hebdomadaires rangés en séries par joueur
+_classements = {}
+
+# Classements hebdomadaires rangés par date de classement
+_instantanes = {}
+
+# Couples (saison, joueur) des joueurs ayant joué au moins un match
+_actifs = {}
+
+# Scores analysés (jeux par set, tie-breaks, statut...) de chaque match
+_scores = {}
+
+# Tables de joueurs et index player_id -> ligne
+_joueurs = {}
+
+# Annuaire ATP + WTA et index des noms normalisés
+_noms = {}
+
+
+def cle_sexe(sexe):
+    """
+    Ramène le sexe d'un joueur à la clé utilisée par le stockage.
+
+    Args:
+        sexe (str):
+            Sexe du joueur ('H' pour homme, toute autre valeur pour femme).
+
+    Returns:
+        str: 'H' ou 'F'.
+    """
+    return "H" if sexe == "H" else "F"
+
+
+def _fichiers_supplementaires(fichiers, motif):
+    """
+    Ajoute à une liste de fichiers ceux du dossier de données qui
+    correspondent à un motif et n'y sont pas encore (nouvelles saisons).
+
+    Args:
+        fichiers (list): Fichiers connus.
+        motif (str): Motif des noms de fichiers (par exemple
+            'atp_matches_*.csv').
+
+    Returns:
+        list: Fichiers connus, puis nouveaux fichiers triés par nom.
+    """
+    connus = {os.path.normpath(fichier) for fichier in fichiers}
+    nouveaux = [
+        fichier
+        for fichier in sorted(glob.glob(os.path.join(DOSSIER_DONNEES, motif)))
+        if os.path.normpath(fichier) not in connus
+    ]
+    return list(fichiers) + nouveaux
+
+
+def fichiers_matchs(cle):
+    """
+    Retourne tous les fichiers de matchs d'un sexe : ceux de
+    `FICHIERS_MATCHS` puis les fichiers de nouvelles saisons déposés dans
+    le dossier de données (par exemple 'Donnees/atp_matches_2025.csv').
+
+    Args:
+        cle (str): 'H' ou 'F'.
+
+    Returns:
+        list: Chemins des fichiers de matchs.
+    """
+    prefixe = "atp" if cle == "H" else "wta"
+    return _fichiers_supplementaires(
+        FICHIERS_MATCHS[cle], f"{prefixe}_matches_*.csv"
+        )
+
+
+def fichiers_classements(cle):
+    """
+    Retourne tous les fichiers de classement d'un sexe : celui de
+    `FICHIERS_CLASSEMENTS` puis les fichiers de nouvelles semaines
+    déposés dans le dossier de données (par exemple
+    'Donnees/atp_rankings_2025.csv').
+
+    Args:
+        cle (str): 'H' ou 'F'.
+
+    Returns:
+        list: Chemins des fichiers de classement.
+    """
+    prefixe = "atp" if cle == "H" else "wta"
+    return _fichiers_supplementaires(
+        [FICHIERS_CLASSEMENTS[cle]], f"{prefixe}_rankings_*.csv"
+        )
+
+
+def signature_matchs(cle):
+    """
+    Retourne la signature de tous les fichiers de matchs d'un sexe.
+
+    Args:
+        cle (str): 'H' ou 'F'.
+
+    Returns:
+        list: Taille et date de modification de chaque fichier.
+    """
+    return [signature_source(fichier) for fichier in fichiers_matchs(cle)]
+
+
+def signature_classements(cle):
+    """
+    Retourne la signature de tous les fichiers de classement d'un sexe.
+
+    Args:
+        cle (str): 'H' ou 'F'.
+
+    Returns:
+        list: Taille et date de modification de chaque fichier.
+    """
+    return [
+        signature_source(fichier) for fichier in fichiers_classements(cle)
+    ]
+
+
+def _lire_classements(cle):
+    """
+    Lit les classements hebdomadaires d'un sexe (tous les fichiers).
+
+    Args:
+        cle (str): 'H' ou 'F'.
+
+    Returns:
+        pd.DataFrame: Colonnes 'ranking_date', 'rank' et 'player'.
+    """
+    return pd.concat(
+        [lire_donnees(fichier, ["ranking_date", "rank", "player"])
+         for fichier in fichiers_classements(cle)],
+        ignore_index=True
+        )
+
+
+def _table_matchs(cle, colonnes):
+    """
+    Retourne la table des matchs en mémoire après y avoir ajouté les
+    colonnes demandées qui n'étaient pas encore chargées.
+
+    Les colonnes calculées à partir du score (`COLONNES_SCORE`) sont
+    prises dans la table des scores analysés (voir `scores_matchs`).
+
+    Args:
+        cle (str): 'H' ou 'F'.
+        colonnes (list): Colonnes nécessaires.
+
+    Returns:
+        pd.DataFrame: Table partagée, avec au moins les colonnes demandées.
+    """
+    data = _matchs.get(cle)
+    if data is None:
+        manquantes = list(colonnes)
+    else:
+        manquantes = [col for col in colonnes if col not in data.columns]
+
+    manquantes_score = [col for col in manquantes if col in COLONNES_SCORE]
+    manquantes = [col for col in manquantes if col not in COLONNES_SCORE]
+
+    if manquantes:
+        liste_data = [
+            lire_donnees(fichier, manquantes)
+            for fichier in fichiers_matchs(cle)
+            ]
+        data_temp = pd.concat(liste_data, axis=0, ignore_index=True)
+        data_temp = remettre_categories(data_temp, SCHEMA_MATCHS)
+
+        if data is None:
+            data = data_temp
+        else:
+            data = pd.concat([data, data_temp], axis=1)
+        _matchs[cle] = data
+
+    if manquantes_score:
+        scores = scores_matchs(cle)[manquantes_score]
+        # Le calcul des scores a pu charger la colonne 'score' ; sinon
+        # (scores relus du cache) la table part des seuls scores
+        data = _matchs.get(cle)
+        if data is None:
+            data = scores.reset_index(drop=True)
+        else:
+            data = pd.concat([data, scores.set_axis(data.index)], axis=1)
+        _matchs[cle] = data
+
+    return data
+
+
+@profiler
+def charger_matchs(sexe, colonnes=None):
+    """
+    Retourne la table des matchs (ATP ou WTA) partagée par l'application.
+
+    Seules les colonnes demandées sont lues (via le cache colonne) ; les
+    colonnes déjà chargées restent en mémoire et les appels suivants ne
+    lisent que les colonnes manquantes. La table renvoyée est partagée :
+    elle ne doit pas être modifiée en place.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+        colonnes (list, optional):
+            Colonnes nécessaires (voir `SCHEMA_MATCHS`). Si None, toutes
+            les colonnes du schéma sont chargées.
+
+    Returns:
+        pd.DataFrame:
+            Données de matchs concaténées, réduites aux colonnes demandées.
+    """
+    if colonnes is None:
+        colonnes = list(SCHEMA_MATCHS)
+
+    data = _table_matchs(cle_sexe(sexe), colonnes)
+    compter(lignes=len(data))
+    return data[colonnes]
+
+
+@profiler
+def index_joueurs(sexe):
+    """
+    Retourne l'index joueur -> lignes de la table des matchs d'un sexe.
+
+    L'index est construit une seule fois par table et enregistré dans le
+    dossier de cache ; il est reconstruit si l'un des fichiers de matchs
+    a changé.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        tuple:
+            Index construit par
+            `tennis_app.donnees.index.construire_index_joueurs`.
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _index_joueurs:
+        chemin = os.path.join(DOSSIER_CACHE, f"index_joueurs_{cle}.npz")
+        signature = signature_matchs(cle)
+
+        index = charger_index(chemin, signature)
+        if index is None:
+            data = _table_matchs(cle, ["winner_id", "loser_id"])
+            index = construire_index_joueurs(
+                data["winner_id"].to_numpy(),
+                data["loser_id"].to_numpy()
+                )
+            sauvegarder_index(chemin, index, signature)
+
+        _index_joueurs[cle] = index
+
+    return _index_joueurs[cle]
+
+
+@profiler
+def matchs_joueur(sexe, id_joueur, colonnes):
+    """
+    Retourne les matchs d'un joueur sans parcourir toute la table.
+
+    Les lignes sont trouvées grâce à l'index joueur, puis seules ces
+    lignes et les colonnes demandées sont extraites.
+
+    Args:
+        sexe (str):
+            Sexe du joueur ('H' pour ATP, 'F' pour WTA).
+        id_joueur (int):
+            Identifiant du joueur.
+        colonnes (list):
+            Colonnes à extraire.
+
+    Returns:
+        pd.DataFrame:
+            Matchs (gagnés ou perdus) du joueur, dans l'ordre de la table.
+            Le tableau renvoyé est une copie et peut être modifié.
+    """
+    cle = cle_sexe(sexe)
+    lignes = chercher_lignes(index_joueurs(cle), id_joueur)
+
+    return matchs_lignes(cle, lignes, colonnes)
+
+
+@profiler
+def matchs_lignes(sexe, lignes, colonnes):
+    """
+    Extrait certaines lignes et colonnes de la table des matchs.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+        lignes (np.ndarray):
+            Positions des matchs dans la table.
+        colonnes (list):
+            Colonnes à extraire.
+
+    Returns:
+        pd.DataFrame: Copie modifiable des matchs demandés.
+    """
+    data = _table_matchs(cle_sexe(sexe), colonnes)
+    compter(lignes=len(lignes))
+    return data.iloc[lignes, data.columns.get_indexer(colonnes)]
+
+
+@profiler
+def face_a_face(sexe):
+    """
+    Retourne les structures de face-à-face de la table des matchs d'un
+    sexe (matrice creuse des victoires et index des paires de joueurs).
+
+    Elles sont construites une seule fois, à partir de l'index joueur,
+    puis enregistrées dans le dossier de cache ; elles sont reconstruites
+    si l'un des fichiers de matchs a changé.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        dict:
+            Structures construites par
+            `tennis_app.donnees.face_a_face.construire_face_a_face`.
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _face_a_face:
+        chemin = os.path.join(DOSSIER_CACHE, f"face_a_face_{cle}.npz")
+        signature = signature_matchs(cle)
+
+        structures = charger_face_a_face(chemin, signature)
+        if structures is None:
+            data = _table_matchs(cle, ["winner_id", "loser_id"])
+            structures = construire_face_a_face(
+                data["winner_id"].to_numpy(),
+                data["loser_id"].to_numpy(),
+                index_joueurs(cle)[0]
+                )
+            sauvegarder_face_a_face(chemin, structures, signature)
+
+        _face_a_face[cle] = structures
+
+    return _face_a_face[cle]
+
+
+@profiler
+def table_tournois(sexe):
+    """
+    Retourne la table des formats de tournoi d'un sexe.
+
+    La table (format Round Robin ou élimination, taille du tableau,
+    nombre de matchs et de joueurs, premier round) est calculée une seule
+    fois à partir de la table des matchs puis enregistrée dans le dossier
+    de cache ; elle est recalculée si l'un des fichiers de matchs a changé.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        pd.DataFrame:
+            Table indexée par 'tourney_id' (voir
+            `tennis_app.donnees.tournois.construire_table_tournois`).
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _tournois:
+        nom = f"tournois_{cle}"
+        signature = signature_matchs(cle)
+
+        tournois = charger_derive(nom, signature)
+        if tournois is None:
+            data = _table_matchs(
+                cle, ["tourney_id", "round", "winner_id", "loser_id"]
+                )
+            tournois = construire_table_tournois(data)
+            sauvegarder_derive(nom, tournois, signature)
+
+        _tournois[cle] = tournois
+
+    return _tournois[cle]
+
+
+@profiler
+def scores_matchs(sexe):
+    """
+    Retourne les scores analysés de la table des matchs d'un sexe (jeux
+    de chaque set, tie-breaks, super tie-break, statut, sets gagnés).
+
+    La table est calculée une seule fois à partir de la colonne 'score'
+    puis enregistrée dans le dossier de cache ; elle est recalculée si
+    l'un des fichiers de matchs a changé. Ses colonnes peuvent aussi être
+    demandées directement à `charger_matchs` ou `matchs_joueur`.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        pd.DataFrame:
+            Une ligne par match, dans l'ordre de la table des matchs
+            (voir `tennis_app.donnees.scores.analyser_scores`).
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _scores:
+        nom = f"scores_{cle}"
+        signature = signature_matchs(cle)
+
+        scores = charger_derive(nom, signature)
+        if scores is None:
+            scores = analyser_scores(_table_matchs(cle, ["score"])["score"])
+            sauvegarder_derive(nom, scores, signature)
+
+        _scores[cle] = scores
+
+    return _scores[cle]
+
+
+@profiler
+def joueurs_actifs(sexe):
+    """
+    Retourne les joueurs ayant joué au moins un match, saison par saison.
+
+    La table est calculée une seule fois à partir de la table des matchs
+    puis enregistrée dans le dossier de cache ; elle est recalculée si
+    l'un des fichiers de matchs a changé.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'annee' et 'player_id', un couple distinct par ligne,
+            triés par saison puis par joueur.
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _actifs:
+        nom = f"actifs_{cle}"
+        signature = signature_matchs(cle)
+
+        actifs = charger_derive(nom, signature)
+        if actifs is None:
+            data = _table_matchs(cle, ["annee", "winner_id", "loser_id"])
+            actifs = pd.DataFrame({
+                "annee": np.concatenate(
+                    [data["annee"].to_numpy(), data["annee"].to_numpy()]
+                    ),
+                "player_id": np.concatenate(
+                    [data["winner_id"].to_numpy(), data["loser_id"].to_numpy()]
+                    )
+            })
+            actifs = (
+                actifs.drop_duplicates()
+                .sort_values(["annee", "player_id"])
+                .reset_index(drop=True)
+            )
+            sauvegarder_derive(nom, actifs, signature)
+
+        _actifs[cle] = actifs
+
+    return _actifs[cle]
+
+
+def ids_actifs(sexe, saison):
+    """
+    Retourne les identifiants des joueurs ayant joué pendant une saison.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+        saison (int):
+            Année recherchée.
+
+    Returns:
+        np.ndarray: Identifiants distincts, triés.
+    """
+    actifs = joueurs_actifs(sexe)
+    annees = actifs["annee"].to_numpy()
+    debut = np.searchsorted(annees, saison, side="left")
+    fin = np.searchsorted(annees, saison, side="right")
+    return actifs["player_id"].to_numpy()[debut:fin]
+
+
+def invalider_matchs(sexe=None):
+    """
+    Oublie la ou les tables de matchs gardées en mémoire, ainsi que leur
+    index joueur, leur table des tournois, leurs structures de
+    face-à-face, leurs joueurs actifs par saison et leurs scores analysés.
+
+    Le prochain appel à `charger_matchs` relira les fichiers.
+
+    Args:
+        sexe (str, optional):
+            Sexe dont la table doit être oubliée. Si None, toutes les
+            tables sont oubliées.
+    """
+    if sexe is None:
+        _matchs.clear()
+        _index_joueurs.clear()
+        _tournois.clear()
+        _face_a_face.clear()
+        _actifs.clear()
+        _scores.clear()
+    else:
+        _matchs.pop(cle_sexe(sexe), None)
+        _index_joueurs.pop(cle_sexe(sexe), None)
+        _tournois.pop(cle_sexe(sexe), None)
+        _face_a_face.pop(cle_sexe(sexe), None)
+        _actifs.pop(cle_sexe(sexe), None)
+        _scores.pop(cle_sexe(sexe), None)
+
+
+def recharger_matchs(sexe):
+    """
+    Relit immédiatement toutes les colonnes des fichiers de matchs
+    d'un sexe.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        pd.DataFrame:
+            Nouvelle table de matchs.
+    """
+    invalider_matchs(sexe)
+    return charger_matchs(sexe)
+
+
+@profiler
+def series_classement(sexe):
+    """
+    Retourne les classements hebdomadaires d'un sexe, rangés en séries
+    contiguës par joueur et triées par date.
+
+    Les séries sont construites une seule fois à partir des fichiers de
+    classement puis enregistrées dans le dossier de cache ; elles sont
+    reconstruites si l'un de ces fichiers a changé.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        dict:
+            Séries construites par
+            `tennis_app.donnees.classements.construire_series_classement`.
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _classements:
+        chemin = os.path.join(DOSSIER_CACHE, f"classements_{cle}.npz")
+        signature = signature_classements(cle)
+
+        series = charger_tableaux(chemin, signature)
+        if series is None:
+            data = _lire_classements(cle)
+            series = construire_series_classement(
+                data["player"].to_numpy(),
+                pd.to_datetime(data["ranking_date"]).to_numpy(),
+                data["rank"].to_numpy()
+                )
+            sauvegarder_tableaux(chemin, series, signature)
+
+        _classements[cle] = series
+
+    return _classements[cle]
+
+
+@profiler
+def classement_joueur(sexe, id_joueur):
+    """
+    Retourne l'historique de classement d'un joueur, trié par date.
+
+    Args:
+        sexe (str):
+            Sexe du joueur ('H' pour ATP, 'F' pour WTA).
+        id_joueur (int):
+            Identifiant du joueur.
+
+    Returns:
+        pd.DataFrame: Colonnes 'ranking_date' (datetime) et 'rank'.
+    """
+    dates, rangs = serie_joueur(series_classement(sexe), id_joueur)
+    compter(lignes=len(dates))
+    return pd.DataFrame({"ranking_date": dates, "rank": rangs})
+
+
+@profiler
+def matrice_classements(joueurs, asof=False):
+    """
+    Construit la matrice date × joueur des classements de plusieurs joueurs.
+
+    Args:
+        joueurs (list):
+            Couples (sexe, id_joueur) des joueurs à comparer.
+        asof (bool, optional):
+            Si True, les semaines manquantes d'un joueur reprennent son
+            dernier rang connu (voir
+            `tennis_app.donnees.classements.aligner_series`).
+
+    Returns:
+        pd.DataFrame:
+            Colonne 'ranking_date' puis une colonne 'rankjoueur{k}' par
+            joueur (k commence à 1, dans l'ordre de `joueurs`).
+    """
+    liste_series = [
+        serie_joueur(series_classement(sexe), id_joueur)
+        for sexe, id_joueur in joueurs
+    ]
+    dates, matrice = aligner_series(liste_series, asof)
+    compter(lignes=sum(len(serie[0]) for serie in liste_series))
+
+    data = pd.DataFrame(
+        matrice,
+        columns=[f"rankjoueur{k}" for k in range(1, len(joueurs) + 1)]
+        )
+    data.insert(0, "ranking_date", dates)
+
+    return data
+
+
+@profiler
+def instantanes_classement(sexe):
+    """
+    Retourne les classements hebdomadaires d'un sexe, rangés par date de
+    classement.
+
+    Comme les séries par joueur, ils sont construits une seule fois puis
+    enregistrés dans le dossier de cache.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        dict:
+            Classements construits par
+            `tennis_app.donnees.classements.construire_instantanes`.
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _instantanes:
+        chemin = os.path.join(DOSSIER_CACHE, f"instantanes_{cle}.npz")
+        signature = signature_classements(cle)
+
+        instantanes = charger_tableaux(chemin, signature)
+        if instantanes is None:
+            data = _lire_classements(cle)
+            instantanes = construire_instantanes(
+                data["player"].to_numpy(),
+                pd.to_datetime(data["ranking_date"]).to_numpy(),
+                data["rank"].to_numpy()
+                )
+            sauvegarder_tableaux(chemin, instantanes, signature)
+
+        _instantanes[cle] = instantanes
+
+    return _instantanes[cle]
+
+
+@profiler
+def classement_a_date(sexe, date=None):
+    """
+    Retourne le dernier classement publié à une date donnée.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+        date (optional):
+            Date recherchée. Si None, le dernier classement publié.
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'ranking_date', 'rank' et 'player', triées par rang
+            (vide si aucun classement n'a été publié avant `date`).
+    """
+    date_classement, joueurs, rangs = instantane(
+        instantanes_classement(sexe), date
+        )
+    compter(lignes=len(joueurs))
+    return pd.DataFrame({
+        "ranking_date": pd.to_datetime(
+            np.full(len(joueurs), date_classement, dtype="datetime64[ns]")
+            ),
+        "rank": rangs,
+        "player": joueurs
+    })
+
+
+def invalider_classements(sexe=None):
+    """
+    Oublie la ou les séries de classement gardées en mémoire, ainsi que
+    les classements rangés par date.
+
+    Args:
+        sexe (str, optional):
+            Sexe dont les séries doivent être oubliées. Si None, toutes
+            les séries sont oubliées.
+    """
+    if sexe is None:
+        _classements.clear()
+        _instantanes.clear()
+    else:
+        _classements.pop(cle_sexe(sexe), None)
+        _instantanes.pop(cle_sexe(sexe), None)
+
+
+@profiler
+def table_joueurs(sexe):
+    """
+    Retourne la table des joueurs d'un sexe, chargée une seule fois par
+    processus.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        pd.DataFrame:
+            Table des joueurs (colonnes de `SCHEMA_JOUEURS`). Cette table
+            est partagée et ne doit pas être modifiée en place.
+    """
+    return _charger_joueurs(sexe)[0]
+
+
+def _charger_joueurs(sexe):
+    """
+    Charge la table des joueurs d'un sexe et son index player_id -> ligne.
+
+    Si un identifiant apparaît plusieurs fois, seule sa première ligne est
+    indexée.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+
+    Returns:
+        tuple: (table, index des identifiants, lignes correspondantes).
+    """
+    cle = cle_sexe(sexe)
+
+    if cle not in _joueurs:
+        table = lire_donnees(FICHIERS_JOUEURS[cle], list(SCHEMA_JOUEURS))
+        premieres = ~table["player_id"].duplicated().to_numpy()
+        _joueurs[cle] = (
+            table,
+            pd.Index(table["player_id"].to_numpy()[premieres]),
+            np.flatnonzero(premieres)
+            )
+
+    return _joueurs[cle]
+
+
+@profiler
+def lignes_joueurs(sexe, ids):
+    """
+    Retourne la ligne de chaque identifiant dans la table des joueurs.
+
+    Args:
+        sexe (str):
+            Sexe des joueurs ('H' pour ATP, 'F' pour WTA).
+        ids (list or np.ndarray):
+            Identifiants recherchés.
+
+    Returns:
+        np.ndarray:
+            Position de chaque identifiant dans `table_joueurs(sexe)`, -1
+            pour un identifiant inconnu.
+    """
+    _, index, lignes = _charger_joueurs(sexe)
+
+    positions = index.get_indexer(np.asarray(ids))
+    compter(lignes=len(positions))
+    return np.where(positions >= 0, lignes[positions], -1)
+
+
+@profiler
+def index_noms():
+    """
+    Retourne l'annuaire des joueurs ATP et WTA et son index par nom.
+
+    L'annuaire est construit une seule fois par processus à partir des
+    colonnes d'identité des deux fichiers de joueurs.
+
+    Returns:
+        tuple:
+            - annuaire (pd.DataFrame): colonnes 'sexe', 'player_id',
+              'name_first', 'name_last', 'dob' et 'ioc'.
+            - index (dict): (prénom, nom) normalisés -> positions dans
+              l'annuaire (voir `tennis_app.donnees.noms`).
+    """
+    if "annuaire" not in _noms:
+        colonnes = ["player_id", "name_first", "name_last", "dob", "ioc"]
+        tables = []
+        for cle in FICHIERS_JOUEURS:
+            data = table_joueurs(cle)[colonnes].copy()
+            data.insert(0, "sexe", cle)
+            tables.append(data)
+        annuaire = pd.concat(tables, ignore_index=True)
+
+        _noms["annuaire"] = annuaire
+        _noms["index"] = construire_index_noms(
+            annuaire["name_first"], annuaire["name_last"]
+            )
+
+    return _noms["annuaire"], _noms["index"]
+
+
+@profiler
+def chercher_candidats(prenom, nom):
+    """
+    Retourne les joueurs (ATP et WTA) portant un prénom et un nom.
+
+    La comparaison ignore la casse, les accents et les espaces superflus.
+
+    Args:
+        prenom (str): Prénom recherché.
+        nom (str): Nom recherché.
+
+    Returns:
+        pd.DataFrame:
+            Une ligne par joueur correspondant (plusieurs en cas
+            d'homonymes, aucune si le nom est inconnu), avec les colonnes
+            de l'annuaire.
+    """
+    annuaire, index = index_noms()
+    positions = chercher_positions(index, prenom, nom)
+    compter(lignes=len(positions))
+    return annuaire.iloc[positions].reset_index(drop=True)
+
+
+def invalider_joueurs():
+    """
+    Oublie les tables de joueurs, leur index par identifiant ainsi que
+    l'annuaire et son index par nom.
+    """
+    _joueurs.clear()
+    _noms.clear()
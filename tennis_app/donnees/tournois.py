@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+
+
+# Tous les rounds connus, du plus précoce au plus avancé
+ORDRE_ROUNDS = [
+    'Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'ER', 'RR', 'R128', 'R64', 'R32',
+    'R16', 'QF', 'SF', 'BR', 'F'
+]
+TYPE_ROUND = pd.CategoricalDtype(ORDRE_ROUNDS, ordered=True)
+
+# Priorité (1 = finale, plus grand = plus tôt) et libellé de chaque round,
+# selon que le tournoi se joue au Round Robin ou par élimination directe
+ROUNDS_ROUND_ROBIN = {
+    'RR': (5, 'Tour de Ronde'),
+    'QF': (4, 'Quart de final'),
+    'SF': (3, 'Demi finale'),
+    'BR': (2, 'Petite finale'),
+    'F': (1, 'Finale')
+}
+ROUNDS_ELIMINATOIRE = {
+    'Q1': (13, '1er tour'),
+    'Q2': (12, '2ème tour'),
+    'Q3': (11, '3ème tour'),
+    'Q4': (10, '4ème tour'),
+    'Q5': (9, '5ème tour'),
+    'R128': (8, '128ème de finale'),
+    'R64': (7, '64ème de finale'),
+    'R32': (6, '32ème de finale'),
+    'R16': (5, '16ème de finale'),
+    'QF': (4, 'Quart de finale'),
+    'SF': (3, 'Demi-finale'),
+    'BR': (2, 'Petite finale'),
+    'F': (1, 'Finale')
+}
+
+# Taille du tableau final déduite du premier tour du tableau principal
+TAILLE_PAR_ROUND = {
+    'R128': 128, 'R64': 64, 'R32': 32, 'R16': 16, 'QF': 8, 'SF': 4, 'F': 2
+}
+
+
+def _tableau_par_code(rounds, position, defaut):
+    """
+    Transforme un dictionnaire round -> valeurs en tableau indexé par le
+    code du round dans `ORDRE_ROUNDS`.
+
+    Une case supplémentaire contenant `defaut` est ajoutée à la fin : le
+    code -1 (round manquant ou inconnu) y est donc envoyé directement.
+
+    Args:
+        rounds (dict): Dictionnaire round -> valeurs.
+        position (int or None): Position de la valeur dans le tuple
+            (None si la valeur n'est pas un tuple).
+        defaut: Valeur des rounds absents du dictionnaire.
+
+    Returns:
+        np.ndarray: Tableau de taille len(ORDRE_ROUNDS) + 1.
+    """
+    valeurs = []
+    for round_ in ORDRE_ROUNDS + [None]:
+        if round_ not in rounds:
+            valeurs.append(defaut)
+        elif position is None:
+            valeurs.append(rounds[round_])
+        else:
+            valeurs.append(rounds[round_][position])
+    return np.array(valeurs, dtype=object if defaut is None else None)
+
+
+PRIORITE_RR = _tableau_par_code(ROUNDS_ROUND_ROBIN, 0, 0).astype(np.int8)
+LABEL_RR = _tableau_par_code(ROUNDS_ROUND_ROBIN, 1, None)
+PRIORITE_ELIMINATOIRE = (
+    _tableau_par_code(ROUNDS_ELIMINATOIRE, 0, 0).astype(np.int8)
+)
+LABEL_ELIMINATOIRE = _tableau_par_code(ROUNDS_ELIMINATOIRE, 1, None)
+TAILLE_TABLEAU = _tableau_par_code(TAILLE_PAR_ROUND, None, 0)
+
+
+def codes_rounds(rounds):
+    """
+    Retourne le code entier de chaque round dans `ORDRE_ROUNDS`.
+
+    Args:
+        rounds (pd.Series): Colonne 'round' de la table des matchs.
+
+    Returns:
+        np.ndarray: Codes des rounds (-1 pour un round manquant ou inconnu).
+    """
+    if rounds.dtype != TYPE_ROUND:
+        rounds = rounds.astype(TYPE_ROUND)
+    return rounds.cat.codes.to_numpy()
+
+
+def construire_table_tournois(data):
+    """
+    Construit la table des formats de tournoi, une ligne par tourney_id.
+
+    Args:
+        data (pd.DataFrame):
+            Matchs avec les colonnes 'tourney_id', 'round', 'winner_id'
+            et 'loser_id'.
+
+    Returns:
+        pd.DataFrame:
+            Table indexée par 'tourney_id' avec les colonnes :
+            - 'format' : 'RR' (Round Robin) ou 'KO' (élimination directe),
+            - 'taille_tableau' : taille du tableau final (nombre de
+              joueurs pour un Round Robin ou des qualifications seules),
+            - 'nb_matchs' : nombre de matchs joués,
+            - 'nb_joueurs' : nombre de joueurs différents,
+            - 'premier_round' : round le plus précoce joué.
+    """
+    tournois = data["tourney_id"].to_numpy()
+    codes = codes_rounds(data["round"])
+
+    # Toutes les agrégations se font en une passe groupée par tournoi
+    matchs = pd.DataFrame({
+        "tourney_id": tournois,
+        "est_rr": codes == ORDRE_ROUNDS.index('RR'),
+        "taille": TAILLE_TABLEAU[codes].astype(np.int16),
+        "code": np.where(codes < 0, len(ORDRE_ROUNDS), codes)
+    })
+    groupes = matchs.groupby("tourney_id", sort=True)
+    table = pd.DataFrame({
+        "est_rr": groupes["est_rr"].any(),
+        "taille_tableau": groupes["taille"].max(),
+        "nb_matchs": groupes.size().astype(np.int32),
+        "premier_code": groupes["code"].min()
+    })
+
+    joueurs = pd.DataFrame({
+        "tourney_id": np.concatenate([tournois, tournois]),
+        "joueur": np.concatenate([
+            data["winner_id"].to_numpy(),
+            data["loser_id"].to_numpy()
+        ])
+    })
+    table["nb_joueurs"] = (
+        joueurs.groupby("tourney_id")["joueur"].nunique().astype(np.int32)
+    )
+
+    table["format"] = np.where(table["est_rr"], 'RR', 'KO')
+    table["format"] = table["format"].astype("category")
+
+    # Sans tableau principal identifiable, on garde le nombre de joueurs
+    table["taille_tableau"] = np.where(
+        table["est_rr"] | (table["taille_tableau"] == 0),
+        table["nb_joueurs"],
+        table["taille_tableau"]
+        ).astype(np.int16)
+
+    premier_code = table["premier_code"].to_numpy()
+    table["premier_round"] = pd.Categorical.from_codes(
+        np.where(premier_code == len(ORDRE_ROUNDS), -1, premier_code),
+        dtype=TYPE_ROUND
+        )
+
+    return table[[
+        "format", "taille_tableau", "nb_matchs", "nb_joueurs",
+        "premier_round"
+    ]]
+
+
+def ajouter_priorite_round(data, tournois):
+    """
+    Ajoute à des matchs la priorité et le libellé de leur round.
+
+    Le format de chaque tournoi (Round Robin ou élimination) est lu dans
+    la table des tournois par jointure sur 'tourney_id' ; la priorité est
+    ensuite un simple accès par code de round. Les rounds inconnus
+    reçoivent la priorité 0 et un libellé manquant.
+
+    Args:
+        data (pd.DataFrame):
+            Matchs avec au moins les colonnes 'tourney_id' et 'round'.
+        tournois (pd.DataFrame):
+            Table construite par `construire_table_tournois`.
+
+    Returns:
+        pd.DataFrame:
+            Les mêmes matchs avec les colonnes 'round_priority' et
+            'round_label'.
+    """
+    codes = codes_rounds(data["round"])
+    est_rr = (data["tourney_id"].map(tournois["format"]) == 'RR').to_numpy()
+
+    data["round_priority"] = np.where(
+        est_rr, PRIORITE_RR[codes], PRIORITE_ELIMINATOIRE[codes]
+        )
+    data["round_label"] = np.where(
+        est_rr, LABEL_RR[codes], LABEL_ELIMINATOIRE[codes]
+        )
+
+    return data
@@ -1,12 +1,71 @@
-import pandas as pd
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+from ..donnees.face_a_face import (
+    adversaires_frequents,
+    bilan_face_a_face,
+    lignes_face_a_face
+)
+from ..donnees.profilage import profiler
+from ..donnees.scores import libeller_statuts
+from ..donnees.stockage import (
+    charger_matchs,
+    classement_joueur,
+    matrice_classements,
+    face_a_face,
+    lignes_joueurs,
+    matchs_joueur,
+    matchs_lignes,
+    table_joueurs,
+    table_tournois
+)
+from ..donnees.tournois import ajouter_priorite_round
+from .table_joueurs import ATTRIBUTS_JOUEUR
+
+
+def _attribut(nom):
+    """
+    Crée la propriété d'un attribut du joueur.
+
+    Un joueur créé par son constructeur garde ses valeurs dans un tuple ;
+    une vue les lit dans sa ligne de table. Modifier l'attribut d'une vue
+    copie d'abord sa ligne dans le joueur (copie à l'écriture) : la table
+    partagée n'est jamais modifiée.
+
+    Args:
+        nom (str): Nom de l'attribut (colonne de TableJoueurs).
+
+    Returns:
+        property: Propriété de l'attribut.
+    """
+    position = ATTRIBUTS_JOUEUR.index(nom)
+
+    def lire(self):
+        if self._ligne is None:
+            return self._table[position]
+        return self._table.colonnes[nom][self._ligne]
+
+    def ecrire(self, valeur):
+        valeurs = list(self._valeurs())
+        valeurs[position] = valeur
+        self._table = tuple(valeurs)
+        self._ligne = None
+
+    return property(lire, ecrire)
+
 
 class Joueur:
     """
     Classe représentant un joueur de tennis, ses caractéristiques
     et ses performances.
 
+    Un joueur créé par son constructeur garde ses propres valeurs. Les
+    joueurs créés en nombre sont des vues sur une ligne d'une
+    `TableJoueurs` : leurs attributs sont lus dans les colonnes de la
+    table.
+
     Attributs :
         id_joueur (int):
             Identifiant unique du joueur.
@@ -45,6 +104,8 @@ class Joueur:
         der_match (datetime):
             Date du dernier match.
     """
+    __slots__ = ("_table", "_ligne")
+
     def __init__(
             self, id_joueur: int, prenom: str, nom: str, sexe: str,
             date_nais: datetime, main: str, nb_tournois_joue: int,
@@ -54,25 +115,73 @@ class Joueur:
             nb_sem_1_10: int, nb_sem_11_50: int, nb_sem_51_100: int,
             date1: datetime, date2: datetime
             ):
-        """Initialise un objet Joueur avec toutes ses caractéristiques."""
-        self.id_joueur = id_joueur
-        self.prenom = prenom
-        self.nom = nom
-        self.sexe = sexe
-        self.date_nais = date_nais
-        self.main = main
-        self.nb_tournois_joue = nb_tournois_joue
-        self.nb_tournois_gagne = nb_tournois_gagne
-        self.nb_matchs_joue = nb_matchs_joue
-        self.nb_matchs_gagne = nb_matchs_gagne
-        self.prop_vic_set_1_perdu = prop_vic_set_1_perdu
-        self.prop_balle_break_sauvee = prop_balle_break_sauvee
-        self.nb_sem_classe = nb_sem_classe
-        self.nb_sem_1_10 = nb_sem_1_10
-        self.nb_sem_11_50 = nb_sem_11_50
-        self.nb_sem_51_100 = nb_sem_51_100
-        self.pre_match = date1
-        self.der_match = date2
+        """
+        Initialise un objet Joueur avec toutes ses caractéristiques.
+
+        Les valeurs sont gardées telles quelles dans le joueur ; les
+        joueurs créés en nombre sont plutôt des vues sur une table
+        partagée (voir `Joueur.vue`).
+        """
+        self._table = (
+            id_joueur, prenom, nom, sexe, date_nais, main,
+            nb_tournois_joue, nb_tournois_gagne, nb_matchs_joue,
+            nb_matchs_gagne, prop_vic_set_1_perdu, prop_balle_break_sauvee,
+            nb_sem_classe, nb_sem_1_10, nb_sem_11_50, nb_sem_51_100,
+            date1, date2
+        )
+        self._ligne = None
+
+    @classmethod
+    def vue(cls, table, ligne):
+        """
+        Crée un joueur qui lit ses attributs dans une ligne d'une table.
+
+        Args:
+            table (TableJoueurs): Table des joueurs.
+            ligne (int): Position du joueur dans la table.
+
+        Returns:
+            Joueur: Vue sur la ligne (aucune copie des attributs tant
+            qu'ils ne sont pas modifiés).
+        """
+        joueur = cls.__new__(cls)
+        joueur._table = table
+        joueur._ligne = ligne
+        return joueur
+
+    def _valeurs(self):
+        """
+        Retourne les attributs du joueur, dans l'ordre de
+        `ATTRIBUTS_JOUEUR`.
+
+        Returns:
+            tuple: Valeurs des attributs.
+        """
+        if self._ligne is None:
+            return self._table
+        return tuple(
+            self._table.colonnes[attribut][self._ligne]
+            for attribut in ATTRIBUTS_JOUEUR
+        )
+
+    id_joueur = _attribut("id_joueur")
+    prenom = _attribut("prenom")
+    nom = _attribut("nom")
+    sexe = _attribut("sexe")
+    date_nais = _attribut("date_nais")
+    main = _attribut("main")
+    nb_tournois_joue = _attribut("nb_tournois_joue")
+    nb_tournois_gagne = _attribut("nb_tournois_gagne")
+    nb_matchs_joue = _attribut("nb_matchs_joue")
+    nb_matchs_gagne = _attribut("nb_matchs_gagne")
+    prop_vic_set_1_perdu = _attribut("prop_vic_set_1_perdu")
+    prop_balle_break_sauvee = _attribut("prop_balle_break_sauvee")
+    nb_sem_classe = _attribut("nb_sem_classe")
+    nb_sem_1_10 = _attribut("nb_sem_1_10")
+    nb_sem_11_50 = _attribut("nb_sem_11_50")
+    nb_sem_51_100 = _attribut("nb_sem_51_100")
+    pre_match = _attribut("pre_match")
+    der_match = _attribut("der_match")
 
     def __str__(self):
         """
@@ -87,72 +196,66 @@ class Joueur:
         texte += f"carrière de {self.pre_match} à {self.der_match}"
         return texte
 
-    def data_match(self):
+    @profiler
+    def data_match(self, colonnes=None):
         """
         Charge les données de matchs (ATP ou WTA) selon le sexe du joueur.
 
-        Essaie de charger les fichiers CSV associés aux matchs, et fusionne
-        les données provenant des différents fichiers.
+        Les fichiers ne sont lus qu'une seule fois par processus : la
+        table est ensuite partagée par tous les objets Joueur (voir
+        `tennis_app.donnees.stockage`).
+
+        Args:
+            colonnes (list, optional):
+                Colonnes utiles. Si None, toutes les colonnes sont chargées.
 
         Returns:
             pd.DataFrame:
-                Données de matchs concaténées. Si les fichiers sont manquants
-                ou si l'accès aux fichiers échoue, cela pourrait entraîner
-                une erreur.
+                Données de matchs concaténées. Cette table est partagée et
+                ne doit pas être modifiée en place.
         """
-        if self.sexe == 'H':
-            liste_fichier = [
-                "Donnees/atp_matches_1968_2024.csv",
-                "Donnees/atp_matches_futures_1992_2024.csv",
-                "Donnees/atp_matches_qual_1978_2024.csv"
-                ]
-        else:
-            liste_fichier = [
-                "Donnees/wta_matches_1968_2024.csv",
-                "Donnees/wta_matches_qual_1968_2024.csv"
-                ]
+        return charger_matchs(self.sexe, colonnes)
 
-        data_match = pd.DataFrame()
-        for fichier in liste_fichier:
-            data_temp = pd.read_csv(fichier, low_memory=False)
-            data_match = pd.concat([data_match, data_temp], axis=0)
+    @profiler
+    def data_match_joueur(self, colonnes):
+        """
+        Charge uniquement les matchs joués (gagnés ou perdus) par le joueur.
 
-        return data_match
+        Les lignes sont obtenues par l'index joueur de la table des matchs,
+        sans parcourir les matchs des autres joueurs.
 
-    def data_players(self):
-        """
-        Charge les données des joueurs (ATP ou WTA).
+        Args:
+            colonnes (list):
+                Colonnes utiles.
 
         Returns:
             pd.DataFrame:
-                Données des joueurs.
+                Matchs du joueur (copie modifiable).
         """
-        if self.sexe == 'H':
-            fichier = "Donnees/atp_players.csv"
+        return matchs_joueur(self.sexe, self.id_joueur, colonnes)
 
-        else:
-            fichier = "Donnees/wta_players.csv"
+    @profiler
+    def data_players(self, colonnes=None):
+        """
+        Retourne la table des joueurs (ATP ou WTA) du sexe du joueur.
 
-        data_players = pd.read_csv(fichier, low_memory=False)
-        return data_players
+        Le fichier n'est lu qu'une seule fois par processus : la table est
+        ensuite partagée (voir `tennis_app.donnees.stockage.table_joueurs`).
 
-    def data_rankings(self):
-        """
-        Charge les données de classement du joueur (ATP ou WTA).
+        Args:
+            colonnes (list, optional):
+                Colonnes utiles (parmi celles de `SCHEMA_JOUEURS`). Si None,
+                toutes les colonnes de la table sont renvoyées.
 
         Returns:
             pd.DataFrame:
-                Données de classement.
+                Données des joueurs. Sans `colonnes`, la table partagée est
+                renvoyée et ne doit pas être modifiée en place.
         """
-        if self.sexe == 'H':
-            fichier = "Donnees/atp_rankings.csv"
-
-        else:
-            fichier = "Donnees/wta_rankings.csv"
-
-        data_rangs = pd.read_csv(fichier, low_memory=False)
-        return data_rangs
+        data_players = table_joueurs(self.sexe)
+        return data_players if colonnes is None else data_players[colonnes]
 
+    @profiler
     def chercher_resultat(self, victoire=False):
         """
         Récupère les résultats d'un joueur pour ses tournois.
@@ -168,7 +271,6 @@ class Joueur:
                 'annee', 'tourney_id', 'tourney_date', 'tourney_name', etc.
         """
         player_id = self.id_joueur
-        data = self.data_match()
 
         # Selection des variables intérets
         ####################################################
@@ -177,10 +279,9 @@ class Joueur:
             'tourney_level', "surface", "round", 'winner_id', 'loser_id'
             ]
 
-        data = data[var_interet]
-
-        # selection des lignes ou le joueur à joué
+        # Lignes où le joueur a joué, obtenues par l'index joueur
         ####################################################
+        data = self.data_match_joueur(var_interet)
 
         if victoire:
             data = data[
@@ -194,15 +295,9 @@ class Joueur:
             ]]
 
         else:
-            data = data[
-                (data["winner_id"] == player_id) |
-                (data["loser_id"] == player_id)
-                ]
-
             # Création d'une variables resultat qui vaut 1(gagné) 0(perdu)
             ####################################################
-            data['resultat'] = 0
-            data.loc[data['winner_id'] == player_id, 'resultat'] = 1
+            data['resultat'] = (data['winner_id'] == player_id).astype(int)
 
             # Suppression des colonnes inutiles
             ####################################################
@@ -211,82 +306,19 @@ class Joueur:
             # Travail sur les tournois
             ####################################################
 
-            # Parcours des différents tournois
-            liste_tournoi = data["tourney_name"].unique()
-
-            data_result = pd.DataFrame()
-
-            for tournoi in liste_tournoi:
-                data_tournoi = data[data["tourney_name"] == tournoi].copy()
-
-                rounds = data_tournoi["round"].unique()
-
-                # Type de tournois
-                ####################################################
-
-                # Tournoi au Round Robin
-                if 'RR' in rounds:
-                    liste_round_complet = ['RR', 'QF', 'SF', 'BR', 'F']
-                    liste_mapping = [
-                        [5, 'Tour de Ronde'], [4, 'Quart de final'],
-                        [3, 'Demi finale'], [2, 'Petite finale'], [1, 'Finale']
-                    ]
-
-                # Eliminatoire
-                else:
-                    liste_round_complet = [
-                        'Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'R128', 'R64',
-                        'R32', 'R16', 'QF', 'SF', 'BR', 'F'
-                        ]
-                    liste_mapping = [
-                        [13, ' 1er tour'], [12, '2ème tour'],
-                        [11, '3ème tour'], [10, '4ème tour'],
-                        [9, '5ème tour'], [8, '128ème de finale'],
-                        [7, '64ème de finale'], [6, '32ème de finale'],
-                        [5, '16ème de finale'], [4, 'Quart de finale'],
-                        [3, 'Demi-finale'], [2, 'Petite finale'],
-                        [1, 'Finale']
-                        ]
-
-                # Construire les dictionnaires à partir du mapping
-                ####################################################
-                round_priority = dict(
-                    zip(
-                        liste_round_complet,
-                        [item[0] for item in liste_mapping])
-                    )
-                round_label = dict(
-                    zip(
-                        liste_round_complet,
-                        [item[1] for item in liste_mapping])
-                    )
-
-                # Ajouter les colonnes de priorité et de label
-                ####################################################
-                data_tournoi.loc[:, "round_priority"] = (
-                    data_tournoi["round"].map(round_priority)
-                )
-                data_tournoi.loc[:, "round_label"] = (
-                    data_tournoi["round"].map(round_label)
-                )
+            # Priorité et libellé du round de chaque match, d'après le
+            # format du tournoi (table des tournois, jointure sur l'id)
+            data = ajouter_priorite_round(data, table_tournois(self.sexe))
+            data = data[data["round_priority"] > 0]
 
-                # Garder uniquement le match le plus avancé par joueur
-                ####################################################
-                min = data_tournoi["round_priority"].min()
-                match_best = (
-                    data_tournoi[data_tournoi["round_priority"] == min]
+            # Garder uniquement le match le plus avancé par tournoi
+            ####################################################
+            meilleurs = data.groupby("tourney_id")["round_priority"].idxmin()
+            data_result = data.loc[meilleurs.values]
+            data_result = data_result.sort_values(
+                by="tourney_date", kind="stable"
                 )
 
-                # Néttoyage
-                ####################################################
-                match_best = match_best.drop(
-                    columns=["round_priority", "round"]
-                    )
-
-                # Ajout au tableau des dataframe
-                ####################################################
-                data_result = pd.concat([data_result, match_best], axis=0)
-
             # Réordonner les colonnes
             # Liste des colonnes dans l'ordre souhaité
             colonnes_souhaitees = [
@@ -303,6 +335,7 @@ class Joueur:
 
         return data_result
 
+    @profiler
     def chercher_parcours_tournoi(self, id_tournoi):
         """
         Retourne le parcours du joueur dans un tournoi donné.
@@ -318,68 +351,33 @@ class Joueur:
                 informations comme l'année, le nom du tournoi, le niveau
                 du tournoi, le résultat, etc.
         """
-        data = self.data_match()
-
-        data = data[data['tourney_id'] == id_tournoi]
-        data = data[
-            (data["winner_id"] == self.id_joueur) |
-            (data["loser_id"] == self.id_joueur)
+        var_interet = [
+            'annee', "winner_name", "loser_name", "winner_ioc", 'loser_ioc',
+            "winner_rank", "loser_rank", 'round_label', 'round_priority',
+            'score', 'statut', 'round', 'minutes', 'w_bpSaved', 'w_bpFaced',
+            'l_bpSaved', 'l_bpFaced'
             ]
+        colonnes = [
+            col for col in var_interet
+            if col not in ('round_label', 'round_priority')
+            ]
+        data = self.data_match_joueur(colonnes + ['tourney_id'])
 
-        rounds = data["round"].unique()
-
-        # Type de tournois
-        ####################################################
-
-        # Tournoi au Round Robin
-        if 'RR' in rounds:
-            liste_round_complet = ['RR', 'QF', 'SF', 'BR', 'F']
-            liste_mapping = [
-                [5, 'Tour de Ronde'], [4, 'Quart de final'],
-                [3, 'Demi finale'], [2, 'Petite finale'], [1, 'Finale']
-                ]
-
-        # Eliminatoire
-        else:
-            liste_round_complet = [
-                'Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'R128', 'R64',
-                'R32', 'R16', 'QF', 'SF', 'BR', 'F'
-                ]
-            liste_mapping = [
-                [13, '1er tour'], [12, '2ème tour'], [11, '3ème tour'],
-                [10, '4ème tour'], [9, '5ème tour'], [8, '128ème de finale'],
-                [7, '64ème de finale'], [6, '32ème de finale'],
-                [5, '16ème de finale'], [4, 'Quart de finale'],
-                [3, 'Demi-finale'], [2, 'Petite finale'], [1, 'Finale']
-                ]
-
-        # Construire les dictionnaires à partir du mapping
-        ####################################################
-        round_priority = dict(
-            zip(liste_round_complet, [item[0] for item in liste_mapping])
-            )
-        round_label = dict(
-            zip(liste_round_complet, [item[1] for item in liste_mapping])
-            )
+        data = data[data['tourney_id'] == id_tournoi].copy()
+        data['statut'] = libeller_statuts(data['statut'])
 
         # Ajouter les colonnes de priorité et de label
         ####################################################
-        data.loc[:, "round_priority"] = data["round"].map(round_priority)
-        data.loc[:, "round_label"] = data["round"].map(round_label)
+        data = ajouter_priorite_round(data, table_tournois(self.sexe))
 
         # Trier par ordre croissant le niveau des matchs
         data = data.sort_values(by='round_priority', ascending=False)
 
-        var_interet = [
-            'annee', "winner_name", "loser_name", "winner_ioc", 'loser_ioc',
-            "winner_rank", "loser_rank", 'round_label', 'round_priority',
-            'score', 'round', 'minutes', 'w_bpSaved', 'w_bpFaced', 'l_bpSaved',
-            'l_bpFaced'
-            ]
         data = data[var_interet]
 
         return data
 
+    @profiler
     def cherche_10_joueur(self):
         """
         Trouve les 10 joueurs les plus souvent affrontés.
@@ -388,50 +386,53 @@ class Joueur:
             pd.DataFrame: Liste des 10 adversaires les plus fréquents.
         """
 
-        id_joueur = self.id_joueur
-
-        data = self.data_match()
-        data = data[["winner_id", "loser_id"]]
-
-        data_temp_win = data[data["winner_id"] == id_joueur].copy()
-        data_temp_loser = data[data["loser_id"] == id_joueur].copy()
-
-        data_temp_win.rename(
-            columns={"winner_id": "joueur", "loser_id": "adversaire"},
-            inplace=True
-            )
-        data_temp_loser.rename(
-            columns={"winner_id": "adversaire", "loser_id": "joueur"},
-            inplace=True
+        # Lecture de la ligne du joueur dans la matrice des face-à-face
+        par_adversaire = adversaires_frequents(
+            face_a_face(self.sexe),
+            self.id_joueur,
+            nb=10
             )
 
-        data = pd.concat([data_temp_win, data_temp_loser])
-
-        par_adversaire = (
-            data.groupby("adversaire")["joueur"]
-            .count()
-            .rename("nb_rencontres")
+        # Noms des adversaires, lus par l'index player_id -> ligne de la
+        # table des joueurs partagée (vides pour un identifiant inconnu)
+        positions = lignes_joueurs(
+            self.sexe, par_adversaire["adversaire"].to_numpy()
             )
-        par_adversaire = par_adversaire.sort_values(ascending=False)
-
-        par_adversaire = par_adversaire.to_frame()
+        noms = self.data_players(["name_first", "name_last"])
+        noms = noms.iloc[np.maximum(positions, 0)].reset_index(drop=True)
+        noms = noms.where(pd.Series(positions >= 0))
 
-        player = self.data_players()
-
-        fusion = par_adversaire.merge(
-            player,
-            left_on='adversaire',
-            right_on='player_id',
-            how='left'
-        )
+        fusion = pd.concat(
+            [noms, par_adversaire.reset_index(drop=True)], axis=1
+            )
 
         fusion = fusion[["name_first", "name_last", "nb_rencontres"]]
         fusion.rename(
             columns={"name_first": "prénom", "name_last": "nom"},
             inplace=True)
 
-        return fusion.head(10)
+        return fusion
 
+    @profiler
+    def bilan_adversaire(self, joueur):
+        """
+        Donne le bilan des confrontations avec un autre joueur.
+
+        Args:
+            joueur (Joueur):
+                Un autre joueur.
+
+        Returns:
+            tuple: (nombre de victoires, nombre de défaites) de ce joueur
+            contre l'autre.
+        """
+        return bilan_face_a_face(
+            face_a_face(self.sexe),
+            self.id_joueur,
+            joueur.id_joueur
+            )
+
+    @profiler
     def chercher_match_adversaire(self, joueur):
         """
         Récupère tous les matchs entre ce joueur et un adversaire donné.
@@ -445,79 +446,90 @@ class Joueur:
                 Historique des confrontations entre les deux joueurs.
         """
 
-        player_id_1 = self.id_joueur
-        player_id_2 = joueur.id_joueur
-
-        data = self.data_match()
-
-        data1 = data[
-            (data['winner_id'] == player_id_1) &
-            (data['loser_id'] == player_id_2)
-            ]
-        data2 = data[
-            (data['loser_id'] == player_id_1) &
-            (data['winner_id'] == player_id_2)
+        var_interet = [
+            "tourney_date", "tourney_name", "winner_name", "loser_name",
+            'round', 'score', 'statut', 'minutes', 'w_bpSaved', 'w_bpFaced',
+            'l_bpSaved', 'l_bpFaced'
             ]
 
-        data_result = pd.concat([data1, data2], axis=0)
+        # Lignes des matchs de la paire, lues dans l'index des paires
+        lignes = lignes_face_a_face(
+            face_a_face(self.sexe),
+            self.id_joueur,
+            joueur.id_joueur
+            )
+        data_result = matchs_lignes(self.sexe, lignes, var_interet)
+        data_result['statut'] = libeller_statuts(data_result['statut'])
 
         # Trier par ordre croissant le niveau des matchs
         data_result = data_result.sort_values(
             by='tourney_date',
             ascending=True)
 
-        var_interet = [
-            "tourney_date", "tourney_name", "winner_name", "loser_name",
-            'round', 'score', 'minutes', 'w_bpSaved', 'w_bpFaced',
-            'l_bpSaved', 'l_bpFaced'
-            ]
         data_result = data_result[var_interet]
 
         return data_result
 
+    @profiler
     def chercher_rang(self):
         """
         Récupère l'historique des classements de ce joueur.
 
+        La série est lue directement dans les classements rangés par
+        joueur (voir `tennis_app.donnees.stockage.series_classement`).
+
         Returns:
             pd.DataFrame:
-                Données de classement dans le temps.
+                Données de classement dans le temps, triées par date.
         """
+        return classement_joueur(self.sexe, self.id_joueur)
 
-        data = self.data_rankings()
-
-        data = data[data["player"] == self.id_joueur]
-        data = data[['ranking_date', 'rank']]
-
-        return data
-
-    def comparer_rang(self, joueur):
+    @profiler
+    def comparer_rang(self, joueur, asof=False):
         """
         Compare les classements de ce joueur avec un autre joueur.
 
         Compare l'évolution des classements de deux joueurs à travers le temps,
-        en renvoyant une fusion des classements des deux joueurs sur
-        les mêmes dates.
+        en renvoyant les classements des deux joueurs alignés sur les mêmes
+        dates.
 
         Args:
             joueur (Joueur):
                 Autre joueur à comparer.
+            asof (bool, optional):
+                Si True, une semaine sans classement reprend le dernier rang
+                connu du joueur.
 
         Returns:
             pd.DataFrame:
-                Fusion des classements des deux joueurs avec les dates
-                de classement, les classements respectifs de chaque joueur
+                Classements des deux joueurs avec les dates de classement,
+                les classements respectifs de chaque joueur
                 (colonnes 'rankjoueur1' et 'rankjoueur2').
-    """
-
-        rang1 = self.chercher_rang()
-        rang2 = joueur.chercher_rang()
+        """
+        return comparer_rangs([self, joueur], asof)
 
-        fusion = pd.merge(
-            rang1,
-            rang2,
-            on='ranking_date',
-            how='outer',
-            suffixes=('joueur1', 'joueur2'))
 
-        return fusion
+@profiler
+def comparer_rangs(joueurs, asof=False):
+    """
+    Compare les classements d'un nombre quelconque de joueurs.
+
+    Les historiques sont lus dans les séries de classement et alignés sur
+    un calendrier commun en une seule passe.
+
+    Args:
+        joueurs (list):
+            Objets Joueur à comparer (hommes et femmes peuvent être mêlés).
+        asof (bool, optional):
+            Si True, une semaine sans classement reprend le dernier rang
+            connu du joueur.
+
+    Returns:
+        pd.DataFrame:
+            Colonne 'ranking_date' puis une colonne 'rankjoueur{k}' par
+            joueur, dans l'ordre de la liste (k commence à 1).
+    """
+    return matrice_classements(
+        [(joueur.sexe, joueur.id_joueur) for joueur in joueurs],
+        asof
+        )
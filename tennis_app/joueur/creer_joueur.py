@@ -1,8 +1,30 @@
-import pandas as pd
-from .class_joueur import Joueur
+import numpy as np
 
+from ..donnees.profilage import profiler
+from ..donnees.stockage import chercher_candidats, cle_sexe, lignes_joueurs
+from .table_joueurs import table_circuit
 
-def creer_joueur(*, id=None, prenom=None, nom=None, data=None, info=None):
+
+class JoueurAmbigu(LookupError):
+    """
+    Erreur levée quand plusieurs joueurs portent le prénom et le nom
+    recherchés : le choix revient à l'appelant.
+
+    Attributs :
+        candidats (pd.DataFrame):
+            Joueurs portant ce nom (colonnes de l'annuaire, voir
+            `tennis_app.donnees.stockage.chercher_candidats`).
+    """
+    def __init__(self, candidats):
+        """Initialise l'erreur avec les joueurs portant ce nom."""
+        super().__init__(f"{len(candidats)} joueurs portent ce nom")
+        self.candidats = candidats
+
+
+@profiler
+def creer_joueur(
+        *, id=None, prenom=None, nom=None, data=None, info=None, sexe=None
+        ):
     """
     Crée un objet Joueur à partir de son ID, ou de son prénom et nom.
     Si les informations sont manquantes, la fonction effectue une recherche
@@ -26,111 +48,117 @@ def creer_joueur(*, id=None, prenom=None, nom=None, data=None, info=None):
             version de la fonction.
         info (tuple, optional):
             Un tuple contenant des données supplémentaires, sous forme de
-            liste de DataFrames et du sexe ('H' ou 'F').
+            liste de DataFrames et du sexe ('H' ou 'F'). Seul le sexe est
+            utilisé (avec une seule table, la recherche se limite à ce
+            sexe) : les lignes sont lues dans les tables partagées.
+        sexe (str, optional):
+            Sexe du joueur ('H' ou 'F') s'il est connu. Les identifiants
+            ATP et WTA pouvant se recouper, il précise la table où
+            chercher l'identifiant.
 
     Returns:
         Joueur or None:
             Retourne un objet Joueur si les informations sont trouvées et
             valides, sinon None si aucune correspondance n'est trouvée.
 
+    Raises:
+        JoueurAmbigu:
+            Si plusieurs joueurs portent le prénom et le nom recherchés.
+
     Notes:
-        - Si un `id` est fourni, la fonction recherche dans les fichiers CSV
-        des joueurs ATP/WTA pour récupérer les données correspondantes.
+        - Si un `id` est fourni, la ligne du joueur est trouvée par
+        l'index player_id -> ligne des tables ATP/WTA (voir
+        `tennis_app.donnees.stockage.lignes_joueurs`).
         - Si ni l'ID, ni le prénom/nom ne sont fournis,
         la fonction retourne `None`.
         - La fonction peut rechercher un joueur parmi deux DataFrames,
         un pour les hommes et un pour les femmes (ATP/WTA).
+        - La recherche par prénom et nom ignore la casse, les accents et
+        les espaces superflus. Si plusieurs joueurs portent ce nom,
+        `JoueurAmbigu` est levée avec les candidats : l'appelant choisit
+        parmi eux (voir `joueur_par_nom`).
     """
 
     if id is None and (prenom is None or nom is None):
         return None
 
-    ligne_joueur = None
-
-    # Récupération de la bonne ligne
+    # Sexes dans lesquels chercher l'identifiant
     if id is not None:
-        if info is None:
+        if sexe is not None:
+            liste_sexe = [cle_sexe(sexe)]
+        elif info is None:
             print("Chargement des données.")
-            # Chargement des joueurs ATP/WTA
-            data_homme = pd.read_csv(
-                "Donnees/atp_players.csv", low_memory=False
-                )
-            data_femme = pd.read_csv(
-                "Donnees/wta_players.csv", low_memory=False
-                )
-
-            if id in data_homme["player_id"].values:
-                ligne_joueur = data_homme[data_homme["player_id"] == id]
-                genre = "H"
-            elif id in data_femme["player_id"].values:
-                ligne_joueur = data_femme[data_femme["player_id"] == id]
-                genre = "F"
-            else:
-                genre = None
-
+            liste_sexe = ["H", "F"]
         else:
             liste_data, genre = info
             if len(liste_data) == 1:
-                data = liste_data[0]
-                ligne_joueur = data[data["player_id"] == id]
+                liste_sexe = [cle_sexe(genre)]
             else:
-                dataH = liste_data[0]
-                dataF = liste_data[1]
-                if id in list(dataH["player_id"].unique()):
-                    genre = "H"
-                    ligne_joueur = dataH[dataH["player_id"] == id]
-                elif id in list(dataF["player_id"].unique()):
-                    genre = "F"
-                    ligne_joueur = dataF[dataF["player_id"] == id]
-
-    elif (prenom is not None) and (nom is not None):
-
-        data_homme = pd.read_csv("Donnees/atp_players.csv", low_memory=False)
-        data_femme = pd.read_csv("Donnees/wta_players.csv", low_memory=False)
-
-        # Recherche chez les hommes
-        ligne_joueur = data_homme[
-            (data_homme["name_last"] == nom) &
-            (data_homme["name_first"] == prenom)
-        ]
-
-        if not ligne_joueur.empty:
-            genre = "H"
-        else:
-            # Recherche chez les femmes
-            ligne_joueur = data_femme[
-                (data_femme["name_last"] == nom) &
-                (data_femme["name_first"] == prenom)
-            ]
-            if not ligne_joueur.empty:
-                genre = "F"
-
-    # Création du joueur
-    if not ligne_joueur.empty:
-        joueur = Joueur(
-            id_joueur=ligne_joueur["player_id"].values[0],
-            prenom=ligne_joueur["name_first"].values[0],
-            nom=ligne_joueur["name_last"].values[0],
-            sexe=genre,
-            date_nais=ligne_joueur['dob'].values[0],
-            main=ligne_joueur['hand'].values[0],
-            nb_tournois_joue=ligne_joueur['nb_tournois_joue'].values[0],
-            nb_tournois_gagne=ligne_joueur['nb_tournois_gagne'].values[0],
-            nb_matchs_joue=ligne_joueur['nb_matchs_joue'].values[0],
-            nb_matchs_gagne=ligne_joueur['nb_matchs_gagne'].values[0],
-            prop_vic_set_1_perdu=(
-                ligne_joueur["prop_vic_set_1_perdu"].values[0]
-            ),
-            prop_balle_break_sauvee=(
-                ligne_joueur["prop_balle_break_sauvee"].values[0]
-            ),
-            nb_sem_classe=ligne_joueur["nb_sem_classe"].values[0],
-            nb_sem_1_10=ligne_joueur["nb_sem_1_10"].values[0],
-            nb_sem_11_50=ligne_joueur["nb_sem_11_50"].values[0],
-            nb_sem_51_100=ligne_joueur["nb_sem_51_100"].values[0],
-            date1=ligne_joueur['first_match_date'].values[0],
-            date2=ligne_joueur['last_match_date'].values[0])
+                liste_sexe = ["H", "F"]
+
     else:
-        joueur = None
+        # Recherche dans l'index des noms (ATP et WTA)
+        candidats = chercher_candidats(prenom, nom)
+
+        if len(candidats) > 1:
+            # Homonymes : on ne choisit pas à la place de l'utilisateur
+            raise JoueurAmbigu(candidats)
 
-    return joueur
+        if len(candidats) == 0:
+            return None
+
+        id = candidats["player_id"].iloc[0]
+        liste_sexe = [candidats["sexe"].iloc[0]]
+
+    # Création du joueur (les hommes d'abord, comme avant)
+    for genre in liste_sexe:
+        joueur = creer_joueurs([id], genre)[0]
+        if joueur is not None:
+            return joueur
+
+    return None
+
+
+@profiler
+def creer_joueurs(ids, sexe=None):
+    """
+    Crée en une fois les objets Joueur de plusieurs identifiants.
+
+    Les lignes sont trouvées par l'index player_id -> ligne ; chaque
+    joueur est une vue sur la table de son circuit (voir
+    `tennis_app.joueur.table_joueurs.table_circuit`), sans copie de ses
+    attributs.
+
+    Args:
+        ids (list or np.ndarray):
+            Identifiants des joueurs.
+        sexe (str, optional):
+            'H' ou 'F' pour ne chercher que dans une table. Sinon (None ou
+            'M'), les identifiants sont cherchés chez les hommes puis chez
+            les femmes.
+
+    Returns:
+        list:
+            Un objet Joueur par identifiant, dans l'ordre de `ids` (None
+            pour un identifiant inconnu).
+    """
+    ids = np.asarray(ids)
+    joueurs = [None] * len(ids)
+
+    liste_sexe = [sexe] if sexe in ("H", "F") else ["H", "F"]
+
+    for genre in liste_sexe:
+        restants = np.array(
+            [i for i, joueur in enumerate(joueurs) if joueur is None],
+            dtype=np.int64
+            )
+        if len(restants) == 0:
+            break
+
+        positions = lignes_joueurs(genre, ids[restants])
+        table = table_circuit(genre)
+        for i, position in zip(restants, positions):
+            if position >= 0:
+                joueurs[i] = table[position]
+
+    return joueurs
@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+from ..donnees.stockage import cle_sexe, table_joueurs
+
+
+# Attribut de Joueur -> colonne de la table des joueurs
+COLONNES_JOUEUR = {
+    "id_joueur": "player_id",
+    "prenom": "name_first",
+    "nom": "name_last",
+    "date_nais": "dob",
+    "main": "hand",
+    "nb_tournois_joue": "nb_tournois_joue",
+    "nb_tournois_gagne": "nb_tournois_gagne",
+    "nb_matchs_joue": "nb_matchs_joue",
+    "nb_matchs_gagne": "nb_matchs_gagne",
+    "prop_vic_set_1_perdu": "prop_vic_set_1_perdu",
+    "prop_balle_break_sauvee": "prop_balle_break_sauvee",
+    "nb_sem_classe": "nb_sem_classe",
+    "nb_sem_1_10": "nb_sem_1_10",
+    "nb_sem_11_50": "nb_sem_11_50",
+    "nb_sem_51_100": "nb_sem_51_100",
+    "pre_match": "first_match_date",
+    "der_match": "last_match_date"
+}
+
+# Tous les attributs d'un Joueur, dans l'ordre du constructeur
+ATTRIBUTS_JOUEUR = [
+    "id_joueur", "prenom", "nom", "sexe", "date_nais", "main",
+    "nb_tournois_joue", "nb_tournois_gagne", "nb_matchs_joue",
+    "nb_matchs_gagne", "prop_vic_set_1_perdu", "prop_balle_break_sauvee",
+    "nb_sem_classe", "nb_sem_1_10", "nb_sem_11_50", "nb_sem_51_100",
+    "pre_match", "der_match"
+]
+
+# Table de chaque circuit et table des joueurs dont elle est issue
+_tables = {}
+
+
+def _tableau(serie):
+    """
+    Retourne une colonne sous forme de tableau NumPy propre à la table
+    (les catégories sont ramenées à leurs valeurs).
+    """
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return serie.astype(object).to_numpy()
+    return serie.to_numpy(copy=True)
+
+
+class TableJoueurs:
+    """
+    Table de joueurs rangée en colonnes : un tableau NumPy par attribut.
+
+    Un objet Joueur n'est qu'une vue sur une ligne de cette table : les
+    attributs ne sont stockés qu'une fois, dans les colonnes, et les
+    opérations sur tous les joueurs se font directement sur les tableaux.
+
+    Attributs :
+        colonnes (dict):
+            Attribut de Joueur -> tableau NumPy (une valeur par joueur).
+    """
+    def __init__(self, colonnes):
+        """Initialise une table à partir de ses colonnes."""
+        self.colonnes = colonnes
+
+    @classmethod
+    def depuis_dataframe(cls, data, sexe):
+        """
+        Construit une table à partir des lignes d'une table des joueurs.
+
+        Args:
+            data (pd.DataFrame):
+                Lignes de la table des joueurs (colonnes du fichier).
+            sexe (str or array-like):
+                Sexe de tous les joueurs ('H' ou 'F'), ou de chacun.
+
+        Returns:
+            TableJoueurs: Table des joueurs.
+        """
+        colonnes = {
+            attribut: _tableau(data[colonne])
+            for attribut, colonne in COLONNES_JOUEUR.items()
+        }
+        colonnes["sexe"] = np.broadcast_to(
+            np.asarray(sexe, dtype=object), len(data)
+            ).copy()
+
+        return cls(colonnes)
+
+    def __len__(self):
+        """Retourne le nombre de joueurs de la table."""
+        return len(self.colonnes["id_joueur"])
+
+    def __getitem__(self, ligne):
+        """
+        Retourne le joueur d'une ligne de la table.
+
+        Args:
+            ligne (int): Position du joueur dans la table.
+
+        Returns:
+            Joueur: Vue sur la ligne (aucune copie des attributs).
+        """
+        from .class_joueur import Joueur
+
+        if not -len(self) <= ligne < len(self):
+            raise IndexError(f"Ligne {ligne} hors de la table")
+        return Joueur.vue(self, ligne % len(self))
+
+    def __iter__(self):
+        """Parcourt les joueurs de la table."""
+        for ligne in range(len(self)):
+            yield self[ligne]
+
+    def selection(self, lignes):
+        """
+        Extrait plusieurs joueurs dans une nouvelle table.
+
+        Args:
+            lignes (array-like): Positions (ou masque booléen) des joueurs.
+
+        Returns:
+            TableJoueurs: Nouvelle table, avec ses propres colonnes.
+        """
+        return TableJoueurs({
+            attribut: valeurs[lignes]
+            for attribut, valeurs in self.colonnes.items()
+        })
+
+    def vers_dataframe(self):
+        """
+        Retourne la table sous forme de DataFrame.
+
+        Returns:
+            pd.DataFrame: Une colonne par attribut de Joueur.
+        """
+        return pd.DataFrame({
+            attribut: self.colonnes[attribut]
+            for attribut in ATTRIBUTS_JOUEUR
+        })
+
+
+def table_circuit(sexe):
+    """
+    Retourne la table de tous les joueurs d'un circuit.
+
+    La table est construite une seule fois à partir de la table des
+    joueurs partagée (voir `tennis_app.donnees.stockage.table_joueurs`) ;
+    ses lignes sont dans le même ordre.
+
+    Args:
+        sexe (str): Sexe des joueurs ('H' ou 'F').
+
+    Returns:
+        TableJoueurs: Table des joueurs du circuit.
+    """
+    cle = cle_sexe(sexe)
+    source = table_joueurs(cle)
+
+    # Reconstruite si la table des joueurs a été rechargée
+    if cle not in _tables or _tables[cle][0] is not source:
+        _tables[cle] = (source, TableJoueurs.depuis_dataframe(source, cle))
+
+    return _tables[cle][1]
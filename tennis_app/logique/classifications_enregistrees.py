@@ -0,0 +1,164 @@
+import datetime
+import glob
+import hashlib
+import json
+import os
+
+import joblib
+import pandas as pd
+
+
+# Dossier des classifications enregistrées (un sous-dossier par run)
+DOSSIER_RUNS = os.path.join("enregistrement", "runs")
+
+
+def cle_configuration(genre, type_, rang_max, saison, features, joueurs,
+                      graine):
+    """
+    Calcule la clé d'une configuration de classification.
+
+    Deux classifications de même clé portent sur les mêmes joueurs et les
+    mêmes caractéristiques : seul le nombre de clusters peut les
+    distinguer.
+
+    Args:
+        genre (str): Genre des joueurs ('H', 'F' ou 'M').
+        type_ (str or None): Type de groupe ('classe' ou None).
+        rang_max (int or None): Rang maximal des joueurs classés.
+        saison (int): Saison considérée.
+        features (list): Caractéristiques utilisées.
+        joueurs (pd.DataFrame): Joueurs tirés (colonnes 'sexe' et
+            'player_id').
+        graine (int): Graine du tirage.
+
+    Returns:
+        str: Clé hexadécimale.
+    """
+    configuration = {
+        "genre": genre,
+        "type": type_,
+        "rang_max": rang_max,
+        "saison": saison,
+        "features": list(features),
+        "joueurs": sorted(
+            f"{sexe}{id_joueur}"
+            for sexe, id_joueur in zip(joueurs["sexe"], joueurs["player_id"])
+        ),
+        "graine": graine
+    }
+    texte = json.dumps(configuration, sort_keys=True, default=int)
+    return hashlib.sha1(texte.encode("utf-8")).hexdigest()[:16]
+
+
+def dossier_run(cle, k):
+    """
+    Retourne le dossier d'une classification enregistrée.
+
+    Args:
+        cle (str): Clé de la configuration.
+        k (int): Nombre de clusters.
+
+    Returns:
+        str: Chemin du dossier.
+    """
+    return os.path.join(DOSSIER_RUNS, f"{cle}_k{k}")
+
+
+def k_enregistres(cle):
+    """
+    Retourne les nombres de clusters déjà enregistrés pour une
+    configuration.
+
+    Args:
+        cle (str): Clé de la configuration.
+
+    Returns:
+        list: Nombres de clusters, triés.
+    """
+    liste_k = []
+    for chemin in glob.glob(os.path.join(DOSSIER_RUNS, f"{cle}_k*")):
+        if os.path.exists(os.path.join(chemin, "modeles.joblib")):
+            liste_k.append(int(chemin.rsplit("_k", 1)[1]))
+
+    return sorted(liste_k)
+
+
+def sauvegarder_run(cle, configuration, resultats):
+    """
+    Enregistre une classification : modèles entraînés et tableaux de
+    résultats.
+
+    Args:
+        cle (str):
+            Clé de la configuration.
+        configuration (dict):
+            Description de la classification (genre, type, rang_max,
+            saison, features, graine, k...), enregistrée en JSON.
+        resultats (dict):
+            'kmeans', 'pca', 'df_result' et 'df_centroids'.
+    """
+    dossier = dossier_run(cle, configuration["k"])
+    os.makedirs(dossier, exist_ok=True)
+
+    configuration = dict(
+        configuration,
+        cle=cle,
+        date=datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        )
+    with open(os.path.join(dossier, "configuration.json"), "w",
+              encoding="utf-8") as f:
+        json.dump(configuration, f, ensure_ascii=False, indent=2, default=int)
+
+    # Les modèles sont écrits en dernier : leur présence signale un run
+    # complet (voir `k_enregistres`)
+    chemin = os.path.join(dossier, "modeles.joblib")
+    joblib.dump(resultats, chemin + ".tmp")
+    os.replace(chemin + ".tmp", chemin)
+
+
+def charger_run(cle, k):
+    """
+    Recharge une classification enregistrée.
+
+    Args:
+        cle (str): Clé de la configuration.
+        k (int): Nombre de clusters.
+
+    Returns:
+        tuple:
+            (configuration, résultats) : la description de la
+            classification et le dictionnaire 'kmeans', 'pca',
+            'df_result', 'df_centroids'.
+    """
+    dossier = dossier_run(cle, k)
+
+    with open(os.path.join(dossier, "configuration.json"),
+              encoding="utf-8") as f:
+        configuration = json.load(f)
+
+    return configuration, joblib.load(os.path.join(dossier, "modeles.joblib"))
+
+
+def lister_runs():
+    """
+    Liste les classifications enregistrées.
+
+    Returns:
+        pd.DataFrame:
+            Une ligne par classification (colonnes de sa configuration),
+            de la plus récente à la plus ancienne.
+    """
+    configurations = []
+    for chemin in glob.glob(os.path.join(DOSSIER_RUNS, "*",
+                                         "configuration.json")):
+        with open(chemin, encoding="utf-8") as f:
+            configurations.append(json.load(f))
+
+    if not configurations:
+        return pd.DataFrame()
+
+    return (
+        pd.DataFrame(configurations)
+        .sort_values("date", ascending=False)
+        .reset_index(drop=True)
+    )
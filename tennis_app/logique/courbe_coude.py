@@ -0,0 +1,133 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ..donnees.profilage import profiler
+from .moteur_clustering import choisir_moteur, entrainer_kmeans
+
+
+# Nombre maximal de joueurs utilisés pour le score de silhouette
+TAILLE_ECHANTILLON_SILHOUETTE = 5000
+
+# Scores déjà calculés, par empreinte de (X, plage de k)
+_scores = {}
+
+
+def empreinte(X, K_range):
+    """
+    Calcule une empreinte d'une matrice et d'une plage de nombres de
+    clusters.
+
+    Args:
+        X (np.ndarray): Matrice des caractéristiques des joueurs.
+        K_range (iterable): Nombres de clusters testés.
+
+    Returns:
+        str: Empreinte hexadécimale.
+    """
+    X = np.ascontiguousarray(X)
+    h = hashlib.sha1()
+    h.update(str((X.shape, X.dtype.str, tuple(K_range))).encode())
+    h.update(X.tobytes())
+    return h.hexdigest()
+
+
+def scores_k(X, k):
+    """
+    Entraîne un K-Means à k clusters et calcule ses scores.
+
+    Le moteur (complet ou par lots) dépend du nombre de joueurs, comme
+    pour le clustering final.
+
+    Args:
+        X (np.ndarray): Matrice des caractéristiques des joueurs.
+        k (int): Nombre de clusters.
+
+    Returns:
+        tuple:
+            (k, inertie, silhouette). La silhouette vaut NaN pour k = 1 ou
+            si chaque joueur forme son propre cluster.
+    """
+    from sklearn.metrics import silhouette_score
+
+    kmeans, labels = entrainer_kmeans(X, k, choisir_moteur(len(X)))
+
+    if 2 <= len(np.unique(labels)) < len(X):
+        silhouette = silhouette_score(
+            X,
+            labels,
+            sample_size=min(len(X), TAILLE_ECHANTILLON_SILHOUETTE),
+            random_state=42
+            )
+    else:
+        silhouette = np.nan
+
+    return k, kmeans.inertia_, silhouette
+
+
+@profiler
+def calculer_coude(X, K_range=range(1, 11), nb_processus=None):
+    """
+    Calcule l'inertie et le score de silhouette pour chaque nombre de
+    clusters (méthode du coude).
+
+    Les K-Means sont entraînés en parallèle, un par processus. Les
+    résultats sont gardés en mémoire : relancer l'analyse sur les mêmes
+    données ne refait aucun calcul.
+
+    Args:
+        X (np.ndarray):
+            Matrice des caractéristiques des joueurs.
+        K_range (iterable, optional):
+            Nombres de clusters testés (1 à 10 par défaut). Les valeurs
+            supérieures au nombre de joueurs sont ignorées.
+        nb_processus (int, optional):
+            Nombre de processus. Si None, un par cœur disponible (sans
+            dépasser le nombre de k testés).
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'k', 'inertie' et 'silhouette', une ligne par k.
+    """
+    liste_k = [k for k in K_range if 1 <= k <= len(X)]
+    cle = empreinte(X, liste_k)
+
+    if cle not in _scores:
+        if nb_processus is None:
+            nb_processus = min(len(liste_k), os.cpu_count() or 1)
+
+        if nb_processus <= 1:
+            resultats = [scores_k(X, k) for k in liste_k]
+        else:
+            with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+                resultats = list(
+                    executeur.map(scores_k, [X] * len(liste_k), liste_k)
+                    )
+
+        _scores[cle] = pd.DataFrame(
+            resultats, columns=["k", "inertie", "silhouette"]
+            )
+
+    return _scores[cle].copy()
+
+
+def k_suggere(scores):
+    """
+    Propose un nombre de clusters à partir des scores de la méthode du
+    coude : celui dont le score de silhouette est le plus élevé.
+
+    Args:
+        scores (pd.DataFrame): Scores renvoyés par `calculer_coude`.
+
+    Returns:
+        int or None: Nombre de clusters suggéré (None si aucune
+        silhouette n'a pu être calculée).
+    """
+    silhouettes = scores.dropna(subset=["silhouette"])
+    if silhouettes.empty:
+        return None
+
+    return int(silhouettes.loc[silhouettes["silhouette"].idxmax(), "k"])
@@ -1,34 +1,54 @@
 # clustering_module.py
+import datetime
+
 import numpy as np
 import pandas as pd
 
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
-
-from ..joueur.creer_joueur import creer_joueur
+from ..donnees.profilage import profiler
 from ..menus.menu import (
     menu_classification,
     sous_menu_classification
 )
 from ..affichage.afficher import (
+    afficher_tournoi,
     k_means_visualisation,
     plot_clusters,
     afficher_cluster_centroids
 )
+from .fonctions_joueurs import joueur_par_nom
+from .courbe_coude import calculer_coude, k_suggere
+from .moteur_clustering import (
+    choisir_moteur,
+    entrainer_kmeans,
+    entrainer_pca
+)
+from .classifications_enregistrees import (
+    charger_run,
+    cle_configuration,
+    k_enregistres,
+    lister_runs,
+    sauvegarder_run
+)
 from .fonctions_divers import (
     sortie,
-    boucle_01
+    boucle_01,
+    choix_invalide
 )
 from .fonctions_enregistrement import (
+    sauvegarder_data,
     sauvegarder_resultats_clustering
 )
 from .preparation_classification import (
     preaprer_liste_id,
+    choix_saison,
     choix_features,
     choix_nb_individu_groupe,
-    preparer_joueurs,
-    preparer_donnees,
-    preparer_features
+    tirer_joueurs,
+    calculer_features,
+    noms_complets,
+    joueurs_complets,
+    table_joueurs_eligibles,
+    table_joueurs_par_noms
 )
 
 
@@ -47,12 +67,20 @@ def preparer_classification(X):
     nb_joueurs_trouves = len(X)
 
     if nb_joueurs_trouves > 0:
-        # Graphique pour visualisation coude
-        k_means_visualisation(X)
+        # Graphique pour visualisation coude (k calculés en parallèle)
+        scores = calculer_coude(X)
+        k_propose = k_suggere(scores)
+        k_means_visualisation(scores, k_propose)
 
         while True:
             print("_____________________________________________________")
-            k_optimal = input("Combien de classe ? ")
+            if k_propose is not None:
+                print(f"Nombre de classes suggéré : {k_propose}")
+                k_optimal = input(
+                    f"Combien de classe ? (Entrée pour {k_propose}) "
+                    ) or str(k_propose)
+            else:
+                k_optimal = input("Combien de classe ? ")
             try:
                 k_optimal_int = int(k_optimal)
                 if 1 <= k_optimal_int <= nb_joueurs_trouves:
@@ -80,10 +108,15 @@ def preparer_classification(X):
     return k_optimal_int
 
 
-def clustering(X, noms_joueurs, k_optimal, features):
+@profiler
+def clustering(X, noms_joueurs, k_optimal, features, moteur=None):
     """
     Effectue l'algorithme de clustering K-Means sur les données des joueurs.
 
+    Pour un grand nombre de joueurs, le moteur par lots (MiniBatchKMeans et
+    IncrementalPCA, voir `tennis_app.logique.moteur_clustering`) borne la
+    mémoire utilisée ; les résultats ont la même forme.
+
     Args:
         X (np.ndarray):
             Matrice des caractéristiques des joueurs.
@@ -93,6 +126,8 @@ def clustering(X, noms_joueurs, k_optimal, features):
             Nombre de clusters à créer.
         features (list):
             Liste des noms des caractéristiques utilisées pour le clustering.
+        moteur (str, optional):
+            'complet' ou 'lots'. Si None, choisi selon le nombre de joueurs.
 
     Returns:
         tuple: Un tuple contenant :
@@ -101,12 +136,14 @@ def clustering(X, noms_joueurs, k_optimal, features):
                 les composantes PCA.
             - df_centroids (pd.DataFrame):
                 DataFrame des centroïdes de chaque cluster.
-            - kmeans (sklearn.cluster.KMeans):
+            - kmeans (sklearn.cluster.KMeans or MiniBatchKMeans):
                 L'objet KMeans entraîné.
+            - pca (sklearn.decomposition.PCA or IncrementalPCA):
+                La PCA entraînée (projection sur 'PCA1' et 'PCA2').
     """
-    kmeans = KMeans(n_clusters=k_optimal, random_state=42, n_init=10)
-    clusters = kmeans.fit_predict(X)
-    X_pca = PCA(n_components=2).fit_transform(X)
+    moteur = choisir_moteur(len(X), moteur)
+    kmeans, clusters = entrainer_kmeans(X, k_optimal, moteur)
+    pca, X_pca = entrainer_pca(X, moteur)
 
     df_result = pd.DataFrame({
         'Joueur': noms_joueurs,
@@ -138,26 +175,73 @@ def clustering(X, noms_joueurs, k_optimal, features):
     df_centroids.index = [f'Cluster {i}' for i in range(k_optimal)]
 
     # Ajouter le nombre d'éléments par cluster
-    cluster_counts = pd.Series(clusters).value_counts().sort_index()
+    cluster_counts = pd.Series(clusters).value_counts().reindex(
+        range(k_optimal), fill_value=0
+        )
     df_centroids['Nombre d\'éléments'] = cluster_counts.values
 
-    return df_result, df_centroids, kmeans
+    return df_result, df_centroids, kmeans, pca
+
+
+@profiler
+def predire_clusters(data, kmeans, features, pca=None):
+    """
+    Prédit en une fois le cluster de plusieurs joueurs avec un modèle
+    entraîné.
+
+    Les caractéristiques sont calculées en colonnes, avec la même liste de
+    caractéristiques que pour l'entraînement, puis projetées dans l'espace
+    de la PCA entraînée.
+
+    Args:
+        data (pd.DataFrame):
+            Table des joueurs (voir `table_joueurs_eligibles`). Les
+            joueurs incomplets sont ignorés.
+        kmeans (sklearn.cluster.KMeans):
+            L'objet KMeans entraîné.
+        features (list):
+            Caractéristiques utilisées pour l'entraînement.
+        pca (sklearn.decomposition.PCA, optional):
+            La PCA entraînée. Si None, les colonnes 'PCA1' et 'PCA2' ne
+            sont pas calculées.
+
+    Returns:
+        pd.DataFrame:
+            Colonnes 'Joueur', 'Cluster' (et 'PCA1', 'PCA2'), une ligne
+            par joueur complet.
+    """
+    data = joueurs_complets(data)
+    X = calculer_features(data, features)
+
+    df_prediction = pd.DataFrame({
+        'Joueur': noms_complets(data),
+        'Cluster': kmeans.predict(X) if len(X) else []
+    })
+
+    if pca is not None:
+        X_pca = pca.transform(X) if len(X) else np.empty((0, 2))
+        df_prediction['PCA1'] = X_pca[:, 0]
+        df_prediction['PCA2'] = X_pca[:, 1]
 
+    return df_prediction
 
-def predire_nouveau_joueur(kmeans, genre, df_result):
+
+def predire_nouveau_joueur(kmeans, features, df_result, pca=None):
     """
     Permet de prédire le cluster d'un nouveau joueur en saisissant son nom.
 
     Args:
         kmeans (sklearn.cluster.KMeans):
             L'objet KMeans entraîné.
-        genre (str):
-            Le genre des joueurs considérés ('H', 'F', 'M').
+        features (list):
+            Caractéristiques utilisées pour l'entraînement.
         df_result (pd.DataFrame):
             DataFrame contenant les résultats du clustering.
+        pca (sklearn.decomposition.PCA, optional):
+            La PCA entraînée.
     """
     prenom, nom = input("Saisir prénom : "), input("Saisir nom : ")
-    joueur = creer_joueur(nom=nom, prenom=prenom)
+    joueur = joueur_par_nom(prenom, nom)
 
     if joueur is None:
         print("Le joueur n'a pas été trouvé")
@@ -171,14 +255,111 @@ def predire_nouveau_joueur(kmeans, genre, df_result):
             ]['Cluster'].values[0]
         print(f"{nom_complet} est déjà dans les données (Cluster {cluster})")
     else:
-        features = preparer_features(joueur, genre)
-        prediction = kmeans.predict(np.array(features).reshape(1, -1))[0]
-        print(f"{nom_complet} serait classé dans le cluster : {prediction}")
+        data = table_joueurs_eligibles([joueur.id_joueur], joueur.sexe)
+        prediction = predire_clusters(data, kmeans, features, pca)
+        if prediction.empty:
+            print(f"Statistiques de {nom_complet} incomplètes.")
+        else:
+            print(
+                f"{nom_complet} serait classé dans le cluster : "
+                f"{prediction['Cluster'].iloc[0]}"
+                )
 
     input("Presser entrer pour continuer")
 
 
-def interpretation(df_centroids, df_result, kmeans, genre, k_optimal):
+def choix_joueurs_a_predire(genre):
+    """
+    Demande à l'utilisateur les joueurs dont il veut prédire le cluster.
+
+    Args:
+        genre (str):
+            Le genre des joueurs de la classification ('H', 'F', 'M').
+
+    Returns:
+        pd.DataFrame or None:
+            Table des joueurs choisis, ou None si le choix est abandonné.
+    """
+    print(
+        "\nPrédire la classe :\n"
+        "1. D'une liste d'identifiants\n"
+        "2. D'une liste de joueurs (prénom et nom)\n"
+        "3. De tous les joueurs d'une saison"
+        )
+    choix = input("Entrez votre choix : ")
+
+    if choix == "1":
+        saisie = input("Saisir les identifiants (séparés par des virgules) : ")
+        try:
+            ids = [int(id) for id in saisie.split(",") if id.strip()]
+        except ValueError:
+            print("Identifiants invalides (nombres entiers attendus).")
+            return None
+        return table_joueurs_eligibles(ids, genre)
+
+    if choix == "2":
+        noms = []
+        print("Laisser le prénom vide pour terminer la liste.")
+        while True:
+            prenom = input("Saisir prénom : ")
+            if prenom == "":
+                break
+            noms.append((prenom, input("Saisir nom : ")))
+        return table_joueurs_par_noms(noms, genre)
+
+    if choix == "3":
+        saison = choix_saison(genre)
+        return table_joueurs_eligibles(
+            preaprer_liste_id(genre, saison=saison),
+            genre
+            )
+
+    choix_invalide()
+    return None
+
+
+def predire_plusieurs_joueurs(kmeans, features, genre, pca=None):
+    """
+    Prédit le cluster de plusieurs joueurs choisis par l'utilisateur et
+    propose d'enregistrer le résultat.
+
+    Args:
+        kmeans (sklearn.cluster.KMeans):
+            L'objet KMeans entraîné.
+        features (list):
+            Caractéristiques utilisées pour l'entraînement.
+        genre (str):
+            Le genre des joueurs considérés ('H', 'F', 'M').
+        pca (sklearn.decomposition.PCA, optional):
+            La PCA entraînée.
+    """
+    data = choix_joueurs_a_predire(genre)
+    if data is None:
+        return
+
+    prediction = predire_clusters(data, kmeans, features, pca)
+    nb_ignores = len(data) - len(prediction)
+
+    if prediction.empty:
+        print("Aucun joueur trouvé avec des statistiques complètes.")
+        return input("Presser entrer pour continuer")
+
+    afficher_tournoi(prediction.round(2))
+    if nb_ignores:
+        print(
+            f"\n{nb_ignores} joueur(s) ignoré(s) : statistiques incomplètes."
+            )
+
+    print("\nSouhaitez-vous enregistrer les prédictions ? (0/1) : ")
+    if boucle_01() == "1":
+        now = datetime.datetime.now().strftime("%Y%m%d_%H%M")
+        sauvegarder_data(prediction, "enregistrement", f"predictions_{now}")
+
+    input("Presser entrer pour continuer")
+
+
+def interpretation(df_centroids, df_result, kmeans, genre, k_optimal,
+                   features, pca=None):
     """
     Gère l'interaction utilisateur pour l'interprétation des résultats
     du clustering.
@@ -197,6 +378,10 @@ def interpretation(df_centroids, df_result, kmeans, genre, k_optimal):
             Le genre des joueurs considérés ('H', 'F', 'M').
         k_optimal (int):
             Le nombre optimal de clusters.
+        features (list):
+            Caractéristiques utilisées pour l'entraînement.
+        pca (sklearn.decomposition.PCA, optional):
+            La PCA entraînée (pour projeter les joueurs prédits).
     """
     while True:
         sous_menu_classification()
@@ -208,19 +393,24 @@ def interpretation(df_centroids, df_result, kmeans, genre, k_optimal):
         elif choix == "2":
             afficher_cluster_centroids(df_centroids)
         elif choix == "3":
-            predire_nouveau_joueur(kmeans, genre, df_result)
+            predire_nouveau_joueur(kmeans, features, df_result, pca)
         elif choix == "4":
             sauvegarder_resultats_clustering(df_result, df_centroids)
+        elif choix == "5":
+            predire_plusieurs_joueurs(kmeans, features, genre, pca)
         else:
             print("Choix invalide. Veuillez réessayer.")
 
 
-def classification(genre, type_, rang_max):
+def classification(genre, type_, rang_max, saison=2024, graine=None):
     """
     Orchestre le processus de classification des joueurs.
 
     Gère la préparation des données, le clustering et l'interprétation
-    des résultats.
+    des résultats. Chaque classification est enregistrée (voir
+    `tennis_app.logique.classifications_enregistrees`) : relancer la même
+    configuration sur les mêmes joueurs recharge les modèles au lieu de
+    les réentraîner.
 
     Args:
         genre (str):
@@ -230,24 +420,142 @@ def classification(genre, type_, rang_max):
             None pour tous).
         rang_max (int or None):
             Le rang maximal à considérer pour les joueurs classés.
+        saison (int, optional):
+            La saison considérée (2024 par défaut).
+        graine (int, optional):
+            Graine du tirage des joueurs. Par défaut (None), l'échantillon
+            est tiré au hasard à chaque lancement ; une graine fixe tire
+            toujours les mêmes joueurs (mesures, tests).
     """
-    liste_id = preaprer_liste_id(genre, type_, rang_max)
+    liste_id = preaprer_liste_id(genre, type_, rang_max, saison)
     features = choix_features(genre)
     nb_element = choix_nb_individu_groupe(liste_id)
-    joueurs = preparer_joueurs(liste_id, genre, nb_element)
-    X, noms_joueurs = preparer_donnees(joueurs, features)
+    joueurs = tirer_joueurs(liste_id, genre, nb_element, graine)
+    cle = cle_configuration(
+        genre, type_, rang_max, saison, features, joueurs, graine
+        )
+
+    # Classification déjà faite sur ces joueurs et ces caractéristiques
+    liste_k = k_enregistres(cle)
+    if liste_k:
+        print(
+            "\nUne classification de ces joueurs est déjà enregistrée "
+            f"(nombre de classes : {', '.join(map(str, liste_k))})."
+            )
+        print("Voulez-vous la recharger ? (0/1)")
+        if boucle_01() == "1":
+            k_optimal = choix_k_enregistre(liste_k)
+            return interpreter_run(cle, k_optimal)
+
+    X = calculer_features(joueurs, features)
+    noms_joueurs = noms_complets(joueurs)
     k_optimal = preparer_classification(X)
 
     if k_optimal is None:
         return fonction_classification()
 
-    df_result, df_centroids, kmeans = clustering(
+    if k_optimal in liste_k:
+        return interpreter_run(cle, k_optimal)
+
+    df_result, df_centroids, kmeans, pca = clustering(
         X,
         noms_joueurs,
         k_optimal,
         features
         )
-    interpretation(df_centroids, df_result, kmeans, genre, k_optimal)
+    configuration = {
+        "genre": genre,
+        "type": type_,
+        "rang_max": rang_max,
+        "saison": saison,
+        "features": features,
+        "nb_joueurs": len(X),
+        "graine": graine,
+        "k": k_optimal
+    }
+    sauvegarder_run(cle, configuration, {
+        "kmeans": kmeans,
+        "pca": pca,
+        "df_result": df_result,
+        "df_centroids": df_centroids
+    })
+    interpretation(
+        df_centroids, df_result, kmeans, genre, k_optimal, features, pca
+        )
+
+
+def choix_k_enregistre(liste_k):
+    """
+    Fait choisir à l'utilisateur un nombre de classes parmi ceux déjà
+    enregistrés.
+
+    Args:
+        liste_k (list): Nombres de classes enregistrés.
+
+    Returns:
+        int: Nombre de classes choisi.
+    """
+    if len(liste_k) == 1:
+        return liste_k[0]
+
+    while True:
+        k = input(
+            f"Quel nombre de classes ({', '.join(map(str, liste_k))}) ? "
+            )
+        if k.isdigit() and int(k) in liste_k:
+            return int(k)
+        choix_invalide()
+
+
+def interpreter_run(cle, k_optimal):
+    """
+    Recharge une classification enregistrée et lance son interprétation,
+    sans réentraîner les modèles.
+
+    Args:
+        cle (str): Clé de la configuration.
+        k_optimal (int): Nombre de clusters.
+    """
+    configuration, resultats = charger_run(cle, k_optimal)
+    print(f"Classification du {configuration['date']} rechargée.")
+    interpretation(
+        resultats["df_centroids"],
+        resultats["df_result"],
+        resultats["kmeans"],
+        configuration["genre"],
+        k_optimal,
+        configuration["features"],
+        resultats["pca"]
+        )
+
+
+def recharger_classification():
+    """
+    Affiche les classifications enregistrées et lance l'interprétation de
+    celle choisie par l'utilisateur.
+    """
+    runs = lister_runs()
+
+    if runs.empty:
+        print("Aucune classification enregistrée.")
+        return input("Presser entrer pour continuer")
+
+    for i, run in runs.iterrows():
+        print(
+            f"{i + 1}. {run['date']} - genre {run['genre']}, "
+            f"{'classés' if run['type'] == 'classe' else 'tous'}, "
+            f"saison {run['saison']}, {run['nb_joueurs']} joueurs, "
+            f"{run['k']} classes"
+            )
+
+    while True:
+        choix = input("Entrez le numéro de la classification : ")
+        if choix.isdigit() and 1 <= int(choix) <= len(runs):
+            break
+        choix_invalide()
+
+    run = runs.iloc[int(choix) - 1]
+    interpreter_run(run["cle"], int(run["k"]))
 
 
 def fonction_classification():
@@ -263,6 +571,10 @@ def fonction_classification():
         if choix == '10':
             return sortie()
 
+        if choix == '7':
+            recharger_classification()
+            continue
+
         options = {
             '1': ('H', None),
             '2': ('H', 'classe'),
@@ -289,6 +601,7 @@ def fonction_classification():
                         except ValueError:
                             pass
                         print("Entrée invalide. Essayez encore.")
-            classification(genre, type_, rang_max or 2500)
+            saison = choix_saison(genre)
+            classification(genre, type_, rang_max or 2500, saison)
         else:
             print("Choix invalide. Veuillez réessayer.")
@@ -1,6 +1,7 @@
 import os
 import datetime
 
+from ..donnees.stockage import chercher_candidats
 from ..joueur.creer_joueur import creer_joueur
 from ..affichage.afficher import (
     afficher_joueur,
@@ -42,10 +43,52 @@ def creer_joueur_bis():
     print("\n_____________________________________________________")
     prenom = input("\nEntrez le prénom du joueur : ")
     nom = input("Entrez le nom du joueur : ")
-    joueur = creer_joueur(prenom=prenom, nom=nom)
+    joueur = joueur_par_nom(prenom, nom)
     return joueur
 
 
+def joueur_par_nom(prenom, nom):
+    """
+    Crée un joueur à partir de son prénom et nom, en faisant choisir
+    l'utilisateur si plusieurs joueurs portent ce nom.
+
+    Args:
+        prenom (str): Prénom saisi.
+        nom (str): Nom saisi.
+
+    Returns:
+        Joueur or None: Le joueur choisi, ou None si le nom est inconnu.
+    """
+    candidats = chercher_candidats(prenom, nom)
+
+    if len(candidats) == 0:
+        return None
+    if len(candidats) == 1:
+        return creer_joueur(
+            id=candidats["player_id"].iloc[0],
+            sexe=candidats["sexe"].iloc[0]
+            )
+
+    print("\nPlusieurs joueurs portent ce nom :")
+    for i, ligne in candidats.iterrows():
+        print(
+            f"{i + 1} - {ligne['name_first']} {ligne['name_last']} "
+            f"({ligne['sexe']}, {ligne['ioc']}, né(e) le {ligne['dob']})"
+            )
+
+    while True:
+        choix = input("Entrez le numéro du joueur : ")
+        if choix.isdigit() and 1 <= int(choix) <= len(candidats):
+            break
+        choix_invalide()
+
+    # Les identifiants ATP et WTA peuvent se recouper : on précise le sexe
+    return creer_joueur(
+        id=candidats["player_id"].iloc[int(choix) - 1],
+        sexe=candidats["sexe"].iloc[int(choix) - 1]
+        )
+
+
 def adversaire(joueur):
     """
     Affiche les adversaires les plus fréquents d'un joueur et permet de
@@ -128,6 +171,11 @@ def comparaison(joueur1, joueur2):
                 input("\nAppuie sur Entrée pour continuer")
 
         elif choix == "2":
+            victoires, defaites = joueur1.bilan_adversaire(joueur2)
+            print(
+                f"\nBilan de {joueur1.prenom} {joueur1.nom} : "
+                f"{victoires} victoire(s), {defaites} défaite(s)\n"
+                )
             data = joueur1.chercher_match_adversaire(joueur2)
             afficher_matchs_rencontre(data)
 
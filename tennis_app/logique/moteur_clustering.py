@@ -0,0 +1,119 @@
+import numpy as np
+
+
+# Au-delà de ce nombre de joueurs, le moteur par lots est utilisé
+SEUIL_MINIBATCH = 10000
+
+# Nombre de joueurs par lot pour le moteur par lots
+TAILLE_LOT = 2048
+
+# Nombre de passages sur les lots pour entraîner le K-Means par lots
+NB_PASSAGES = 5
+
+
+def choisir_moteur(nb_joueurs, moteur=None):
+    """
+    Choisit le moteur de clustering.
+
+    Args:
+        nb_joueurs (int):
+            Nombre de joueurs à classer.
+        moteur (str, optional):
+            'complet' (KMeans + PCA sur toute la matrice) ou 'lots'
+            (MiniBatchKMeans + IncrementalPCA, mémoire bornée). Si None,
+            'lots' au-delà de `SEUIL_MINIBATCH` joueurs.
+
+    Returns:
+        str: 'complet' ou 'lots'.
+    """
+    if moteur is not None:
+        if moteur not in ("complet", "lots"):
+            raise ValueError(f"Moteur de clustering inconnu : {moteur}")
+        return moteur
+
+    return "lots" if nb_joueurs > SEUIL_MINIBATCH else "complet"
+
+
+def lots(X, taille_lot=TAILLE_LOT):
+    """
+    Découpe une matrice en lots de tailles proches.
+
+    Args:
+        X (np.ndarray): Matrice des caractéristiques des joueurs.
+        taille_lot (int): Taille maximale d'un lot.
+
+    Returns:
+        list: Vues sur les lots successifs de X.
+    """
+    nb_lots = max(1, int(np.ceil(len(X) / taille_lot)))
+    return np.array_split(X, nb_lots)
+
+
+def entrainer_kmeans(X, k, moteur="complet"):
+    """
+    Entraîne un K-Means et attribue un cluster à chaque joueur.
+
+    Args:
+        X (np.ndarray): Matrice des caractéristiques des joueurs.
+        k (int): Nombre de clusters.
+        moteur (str): 'complet' ou 'lots' (voir `choisir_moteur`).
+
+    Returns:
+        tuple: (modèle entraîné, cluster de chaque joueur).
+    """
+    if moteur == "complet":
+        from sklearn.cluster import KMeans
+
+        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
+        return kmeans, kmeans.fit_predict(X)
+
+    from sklearn.cluster import MiniBatchKMeans
+
+    kmeans = MiniBatchKMeans(
+        n_clusters=k,
+        random_state=42,
+        batch_size=TAILLE_LOT,
+        n_init=3
+        )
+    # Les lots doivent contenir au moins k joueurs
+    liste_lots = lots(X, max(TAILLE_LOT, k))
+    for _ in range(NB_PASSAGES):
+        for lot in liste_lots:
+            kmeans.partial_fit(lot)
+
+    clusters = np.concatenate([kmeans.predict(lot) for lot in liste_lots])
+
+    # partial_fit ne garde que l'inertie du dernier lot : on la recalcule
+    # sur tous les joueurs pour qu'elle soit comparable à celle de KMeans
+    kmeans.inertia_ = -sum(kmeans.score(lot) for lot in liste_lots)
+    return kmeans, clusters
+
+
+def entrainer_pca(X, moteur="complet", nb_composantes=2):
+    """
+    Entraîne une PCA et projette les joueurs sur ses composantes.
+
+    Args:
+        X (np.ndarray): Matrice des caractéristiques des joueurs.
+        moteur (str): 'complet' ou 'lots' (voir `choisir_moteur`).
+        nb_composantes (int): Nombre de composantes gardées.
+
+    Returns:
+        tuple: (modèle entraîné, projection des joueurs).
+    """
+    if moteur == "complet":
+        from sklearn.decomposition import PCA
+
+        pca = PCA(n_components=nb_composantes)
+        return pca, pca.fit_transform(X)
+
+    from sklearn.decomposition import IncrementalPCA
+
+    pca = IncrementalPCA(n_components=nb_composantes)
+    # Les lots doivent contenir au moins nb_composantes joueurs
+    liste_lots = lots(X, max(TAILLE_LOT, nb_composantes))
+    for lot in liste_lots:
+        pca.partial_fit(lot)
+
+    X_pca = np.concatenate([pca.transform(lot) for lot in liste_lots])
+    return pca, X_pca
@@ -1,7 +1,30 @@
+import numpy as np
 import pandas as pd
 
-
-def preaprer_liste_id(genre, type=None, rang_max=None):
+from ..donnees.profilage import profiler
+from ..donnees.stockage import (
+    chercher_candidats,
+    classement_a_date,
+    ids_actifs,
+    joueurs_actifs,
+    lignes_joueurs,
+    table_joueurs
+)
+
+
+# Attributs qui doivent être renseignés pour qu'un joueur soit classé
+ATTRIBUTS_A_VERIFIER = [
+    "nb_matchs_joue",
+    "nb_tournois_joue",
+    "prop_vic_set_1_perdu",
+    "prop_balle_break_sauvee",
+    "nb_sem_classe"
+]
+
+
+@profiler
+def preaprer_liste_id(genre, type=None, rang_max=None, saison=2024,
+                      date=None):
     """
     Prépare une liste d'identifiants de joueurs en fonction de leur genre et
     du type de données souhaitées (tous les joueurs ou seulement les classés).
@@ -13,70 +36,88 @@ def preaprer_liste_id(genre, type=None, rang_max=None):
         type (str, optional):
             Type de joueurs à considérer.
             - None :
-                tous les joueurs ayant joué en 2024.
+                tous les joueurs ayant joué pendant la saison.
             - 'classe' :
                 uniquement les joueurs classés.
         rang_max (int, optional):
             Rang maximal pour filtrer les joueurs classés.
+        saison (int, optional):
+            Saison considérée (2024 par défaut). Pour les joueurs classés,
+            le classement retenu est le dernier publié pendant la saison.
+        date (str, optional):
+            Date du classement retenu pour les joueurs classés (dernier
+            classement publié à cette date). Prioritaire sur `saison`.
 
     Returns:
         list:
             Liste d'identifiants uniques des joueurs filtrés.
     """
-    if type is None:
+    if genre == "H" or genre == "F":
+        liste_sexe = [genre]
+    else:
+        liste_sexe = ["H", "F"]
 
-        if genre == "H":
-            liste_fichier = [
-                "Donnees/atp_matches_1968_2024.csv",
-                "Donnees/atp_matches_futures_1992_2024.csv",
-                "Donnees/atp_matches_qual_1978_2024.csv"
-                ]
-        elif genre == "F":
-            liste_fichier = [
-                "Donnees/wta_matches_1968_2024.csv",
-                "Donnees/wta_matches_qual_1968_2024.csv"
-                ]
-        else:
-            liste_fichier = [
-                "Donnees/atp_matches_1968_2024.csv",
-                "Donnees/atp_matches_futures_1992_2024.csv",
-                "Donnees/atp_matches_qual_1978_2024.csv",
-                "Donnees/wta_matches_1968_2024.csv",
-                "Donnees/wta_matches_qual_1968_2024.csv"
-                ]
-
-        data = pd.DataFrame()
-        for fichier in liste_fichier:
-            data_temp = pd.read_csv(fichier, low_memory=False)
-            data = pd.concat([data, data_temp], axis=0)
-
-        data = data[data["annee"] == 2024]
-
-        # Récupération d'un liste d'Id_joueur
-        liste_id_win = list(data["winner_id"].unique())
-        liste_id_los = list(data["loser_id"].unique())
-        liste_id = list(set(liste_id_win + liste_id_los))
+    liste_id = set()
+
+    if type is None:
+        # Joueurs actifs par saison, précalculés avec le cache
+        for sexe in liste_sexe:
+            liste_id.update(ids_actifs(sexe, saison).tolist())
 
     else:
-        if genre == "H":
-            data = pd.read_csv("Donnees/atp_rankings.csv")
-        elif genre == "F":
-            data = pd.read_csv("Donnees/wta_rankings.csv")
-        else:
-            dataH = pd.read_csv("Donnees/atp_rankings.csv")
-            dataF = pd.read_csv("Donnees/wta_rankings.csv")
-            data = pd.concat([dataH, dataF], axis=0)
+        if date is None and saison is not None:
+            date = f"{saison}-12-31"
 
-        date = (data["ranking_date"].unique()).max()
-        data = data[data["ranking_date"] == date].copy()
+        # Dernier classement publié de chaque circuit
+        for sexe in liste_sexe:
+            data = classement_a_date(sexe, date)
 
-        if rang_max is not None:
-            data = data[data["rank"] < rang_max]
+            if rang_max is not None:
+                data = data[data["rank"] < rang_max]
 
-        # Récupération d'un liste d'Id_joueur
-        liste_id = list(data["player"].unique())
+            liste_id.update(data["player"].tolist())
 
-    return liste_id
+    return list(liste_id)
+
+
+def choix_saison(genre):
+    """
+    Permet à l'utilisateur de choisir la saison à considérer.
+
+    Args:
+        genre (str):
+            Genre des joueurs ('H', 'F' ou 'M').
+
+    Returns:
+        int:
+            Saison choisie (la plus récente si l'utilisateur valide sans
+            saisir d'année).
+    """
+    if genre == "H" or genre == "F":
+        liste_sexe = [genre]
+    else:
+        liste_sexe = ["H", "F"]
+
+    saisons = sorted(set().union(*[
+        joueurs_actifs(sexe)["annee"].unique().tolist()
+        for sexe in liste_sexe
+    ]))
+
+    while True:
+        print("_____________________________________________________")
+        saison = input(
+            f"Saisir la saison ({saisons[0]}-{saisons[-1]}, "
+            f"Entrée pour {saisons[-1]}) : "
+            )
+        if saison == "":
+            return saisons[-1]
+        try:
+            saison_int = int(saison)
+            if saison_int in saisons:
+                return saison_int
+            print(f"Aucun match enregistré en {saison_int}.")
+        except ValueError:
+            print("Erreur : Veuillez entrer une année (un nombre entier).")
 
 
 def choix_features(genre):
@@ -168,165 +209,246 @@ def choix_nb_individu_groupe(liste_id):
     return nb_element_int
 
 
-def preparer_joueurs(liste_id, genre, nb_element):
+@profiler
+def table_joueurs_eligibles(liste_id, genre):
     """
-    Prépare une liste d'objets Joueur valides à partir des identifiants
-    fournis.
+    Rassemble en une table les lignes des joueurs d'une liste
+    d'identifiants.
 
     Args:
-        liste_id (list): Identifiants de joueurs.
-        genre (str): Genre des joueurs ('H', 'F' ou 'M').
-        nb_element (int): Nombre de joueurs souhaité.
+        liste_id (list):
+            Identifiants de joueurs.
+        genre (str):
+            Genre des joueurs ('H', 'F' ou 'M'). En mixte, un identifiant
+            est cherché chez les hommes puis chez les femmes.
 
     Returns:
-        list: Liste d'objets Joueur valides.
+        pd.DataFrame:
+            Colonnes de la table des joueurs et colonne 'sexe', une ligne
+            par identifiant trouvé (triés par identifiant).
     """
-    from ..joueur.creer_joueur import creer_joueur
-    import math
-    import random
-
-    if genre == 'H':
-        data = [pd.read_csv("Donnees/atp_players.csv")]
-    elif genre == 'F':
-        data = [pd.read_csv("Donnees/wta_players.csv")]
+    if genre == "H" or genre == "F":
+        liste_sexe = [genre]
     else:
-        dataH = pd.read_csv("Donnees/atp_players.csv")
-        dataF = pd.read_csv("Donnees/wta_players.csv")
-        data = [dataH, dataF]
-
-    joueurs = []  # Liste d'objets Joueur
-    ids_utilisés = set()
-
-    attributs_numeriques_a_verifier = [
-        "nb_matchs_joue",
-        "nb_tournois_joue",
-        "prop_vic_set_1_perdu",
-        "prop_balle_break_sauvee",
-        "nb_sem_classe"
-    ]
+        liste_sexe = ["H", "F"]
 
-    # Recherche aléatoire de nb_element par découpage en groupe pour
-    # par calculer tous les joueurs
-    while len(joueurs) < nb_element:
-        # Prendre des IDs qu'on n'a pas encore essayés
-        ids_restants = [id for id in liste_id if id not in ids_utilisés]
+    restants = np.unique(np.asarray(liste_id, dtype=np.int64))
+    tables = []
+    for sexe in liste_sexe:
+        positions = lignes_joueurs(sexe, restants)
+        trouves = positions >= 0
 
-        if not ids_restants:
-            print(
-                f"Plus de joueurs disponibles. Seulement {len(joueurs)} "
-                "joueurs valides trouvés.")
-            return joueurs
-
-        # Prendre un lot de joueurs à essayer
-        taille_lot = min(50, len(ids_restants), nb_element - len(joueurs))
-        lot_ids = random.sample(ids_restants, taille_lot)
-
-        for id in lot_ids:
-            ids_utilisés.add(id)
-            joueur = creer_joueur(id=id, info=(data, genre))
-
-            if joueur is not None:
-                est_valide = True
-                for attribut in attributs_numeriques_a_verifier:
-                    try:
-                        valeur_attribut = getattr(joueur, attribut)
-                        if math.isnan(valeur_attribut):
-                            est_valide = False
-                            break
-                    except AttributeError:
-                        est_valide = False
-                        break
-
-                if est_valide:
-                    joueurs.append(joueur)
-                    if len(joueurs) >= nb_element:
-                        break
-
-    return joueurs
-
-
-def preparer_features(joueur, features_choisies):
+        data = table_joueurs(sexe).iloc[positions[trouves]].copy()
+        data["sexe"] = sexe
+        tables.append(data)
+
+        restants = restants[~trouves]
+
+    return pd.concat(tables, ignore_index=True)
+
+
+def table_joueurs_par_noms(noms, genre):
     """
-    Extrait les caractéristiques numériques d’un joueur selon les
-    features choisies.
+    Rassemble en une table les lignes des joueurs d'une liste de noms.
+
+    Un nom porté par plusieurs joueurs (homonymes) donne une ligne par
+    joueur.
 
     Args:
-        joueur (object):
-            Instance d’un joueur.
+        noms (list):
+            Couples (prénom, nom) des joueurs.
+        genre (str):
+            Genre des joueurs ('H', 'F' ou 'M'). Les joueurs d'un autre
+            circuit sont ignorés.
+
+    Returns:
+        pd.DataFrame:
+            Même forme que `table_joueurs_eligibles`.
+    """
+    candidats = pd.concat(
+        [chercher_candidats(prenom, nom) for prenom, nom in noms]
+        + [pd.DataFrame(columns=["sexe", "player_id"])],
+        ignore_index=True
+        )
+
+    tables = []
+    for sexe in ["H", "F"]:
+        if genre in ("H", "F") and sexe != genre:
+            continue
+        ids = candidats.loc[candidats["sexe"] == sexe, "player_id"]
+        tables.append(table_joueurs_eligibles(ids.to_numpy(), sexe))
+
+    return pd.concat(tables, ignore_index=True)
+
+
+def joueurs_complets(data):
+    """
+    Garde les joueurs dont tous les attributs nécessaires à la
+    classification sont renseignés.
+
+    Args:
+        data (pd.DataFrame): Table des joueurs.
+
+    Returns:
+        pd.DataFrame: Lignes des joueurs complets.
+    """
+    return data[data[ATTRIBUTS_A_VERIFIER].notna().all(axis=1).to_numpy()]
+
+
+def _pourcentage(numerateur, denominateur):
+    """
+    Calcule numerateur / denominateur * 100, avec 0 si le dénominateur
+    est nul.
+    """
+    numerateur = np.asarray(numerateur, dtype=float)
+    denominateur = np.asarray(denominateur, dtype=float)
+    resultat = np.zeros_like(numerateur)
+    np.divide(
+        numerateur * 100,
+        denominateur,
+        out=resultat,
+        where=denominateur != 0
+        )
+    # Un dénominateur manquant laisse la valeur manquante
+    resultat[np.isnan(denominateur)] = np.nan
+    return resultat
+
+
+def calculer_features(data, features_choisies):
+    """
+    Calcule en une fois les caractéristiques de tous les joueurs d'une
+    table.
+
+    Les pourcentages valent 0 quand leur dénominateur est nul ; la main
+    dominante (droitier, gaucher) et le genre (homme, femme) donnent
+    chacun deux colonnes valant 0 ou 100.
+
+    Args:
+        data (pd.DataFrame):
+            Table des joueurs, avec une colonne 'sexe'.
         features_choisies (list):
-            Noms des caractéristiques à extraire.
+            Noms des caractéristiques à calculer.
 
     Returns:
-        list:
-            Valeurs numériques correspondant aux caractéristiques
-            sélectionnées.
+        np.ndarray: Une ligne par joueur, une colonne par valeur.
     """
-    features = []
+    colonnes = []
 
     if "pourcentage_victoire_matchs" in features_choisies:
-        # Pourcentage victoires/tournois
-        features.append(
-            joueur.nb_matchs_gagne / joueur.nb_matchs_joue*100
-            if joueur.nb_matchs_joue != 0 else 0
+        colonnes.append(
+            _pourcentage(data["nb_matchs_gagne"], data["nb_matchs_joue"])
             )
 
     if "pourcentage_victoire_tournois" in features_choisies:
-        # Pourcentage victoires/tournois
-        features.append(
-            joueur.nb_tournois_gagne / joueur.nb_tournois_joue*100
-            if joueur.nb_tournois_joue != 0 else 0
+        colonnes.append(
+            _pourcentage(data["nb_tournois_gagne"], data["nb_tournois_joue"])
             )
 
     if "pourcentage_victoire_set1_perdu" in features_choisies:
-        features.append(joueur.prop_vic_set_1_perdu)
+        colonnes.append(data["prop_vic_set_1_perdu"].to_numpy(dtype=float))
 
     if "pourcentage_balle_break_sauvée" in features_choisies:
-        features.append(joueur.prop_balle_break_sauvee)
+        colonnes.append(data["prop_balle_break_sauvee"].to_numpy(dtype=float))
+
+    for feature, attribut in [
+        ("pourcentage_sem_top_1_10", "nb_sem_1_10"),
+        ("pourcentage_sem_top_11_50", "nb_sem_11_50"),
+        ("pourcentage_sem_top_51_100", "nb_sem_51_100")
+    ]:
+        if feature in features_choisies:
+            colonnes.append(
+                _pourcentage(data[attribut], data["nb_sem_classe"])
+                )
 
-    if "pourcentage_sem_top_1_10" in features_choisies:
-        features.append(
-            joueur.nb_sem_1_10 / joueur.nb_sem_classe * 100
-            if joueur.nb_sem_classe != 0 else 0
-        )
+    if "main_dominante" in features_choisies:
+        main = data["hand"].astype(object).to_numpy()
+        colonnes.append(np.where(main == "R", 100.0, 0.0))
+        colonnes.append(np.where(main == "L", 100.0, 0.0))
 
-    if "pourcentage_sem_top_11_50" in features_choisies:
-        features.append(
-            joueur.nb_sem_11_50 / joueur.nb_sem_classe * 100
-            if joueur.nb_sem_classe != 0 else 0
-        )
+    if "genre" in features_choisies:
+        femme = data["sexe"].to_numpy() == "F"
+        colonnes.append(np.where(femme, 0.0, 100.0))
+        colonnes.append(np.where(femme, 100.0, 0.0))
 
-    if "pourcentage_sem_top_51_100" in features_choisies:
-        features.append(
-            joueur.nb_sem_51_100 / joueur.nb_sem_classe * 100
-            if joueur.nb_sem_classe != 0 else 0
-        )
+    if not colonnes:
+        return np.empty((len(data), 0))
 
-    if "main_dominante" in features_choisies:
-        if joueur.main == 'R':
-            features.extend([100, 0])  # [est_droitier, est_gaucher]
-        elif joueur.main == 'L':
-            features.extend([0, 100])
-        else:
-            features.extend([0, 0])
+    return np.column_stack(colonnes)
 
-    if "genre" in features_choisies:
-        if joueur.sexe == 'F':
-            features.extend([0, 100])
-        else:
-            features.extend([100, 0])
 
-    return features
+def tirer_joueurs(liste_id, genre, nb_element, graine=None):
+    """
+    Tire un échantillon de joueurs valides dans une liste d'identifiants.
 
+    Les joueurs incomplets sont écartés par un masque, puis l'échantillon
+    est tiré avec NumPy.
 
-def preparer_donnees(joueurs, features):
+    Args:
+        liste_id (list):
+            Identifiants de joueurs.
+        genre (str):
+            Genre des joueurs ('H', 'F' ou 'M').
+        nb_element (int or None):
+            Nombre de joueurs souhaité (None pour tous les joueurs
+            valides).
+        graine (int, optional):
+            Graine du tirage, pour reproduire un échantillon.
+
+    Returns:
+        pd.DataFrame:
+            Lignes des joueurs tirés (voir `table_joueurs_eligibles`).
+    """
+    # Joueurs dont tous les attributs nécessaires sont renseignés
+    data = joueurs_complets(table_joueurs_eligibles(liste_id, genre))
+
+    if nb_element is not None and nb_element < len(data):
+        rng = np.random.default_rng(graine)
+        tirage = np.sort(rng.choice(len(data), nb_element, replace=False))
+        data = data.iloc[tirage]
+    elif nb_element is not None and nb_element > len(data):
+        print(
+            f"Plus de joueurs disponibles. Seulement {len(data)} "
+            "joueurs valides trouvés.")
+
+    return data
+
+
+def noms_complets(data):
+    """
+    Retourne le nom complet ("prénom nom") de chaque joueur d'une table.
+
+    Args:
+        data (pd.DataFrame): Table des joueurs.
+
+    Returns:
+        list: Noms complets, dans l'ordre de la table.
+    """
+    return (
+        data["name_first"].astype(str) + " " + data["name_last"].astype(str)
+        ).tolist()
+
+
+@profiler
+def preparer_matrice(liste_id, genre, nb_element, features, graine=None):
     """
-    Prépare les données pour l'algorithme de clustering.
+    Prépare directement la matrice des caractéristiques d'un échantillon
+    de joueurs, sans créer d'objets Joueur.
+
+    Les caractéristiques de tous les joueurs tirés (voir `tirer_joueurs`)
+    sont calculées en colonnes.
 
     Args:
-        joueurs (list):
-            Liste d'objets Joueur.
+        liste_id (list):
+            Identifiants de joueurs.
+        genre (str):
+            Genre des joueurs ('H', 'F' ou 'M').
+        nb_element (int or None):
+            Nombre de joueurs souhaité (None pour tous les joueurs
+            valides).
         features (list):
             Caractéristiques sélectionnées.
+        graine (int, optional):
+            Graine du tirage, pour reproduire un échantillon.
 
     Returns:
         tuple:
@@ -335,17 +457,6 @@ def preparer_donnees(joueurs, features):
             - noms_joueurs (list):
                 Liste des noms complets des joueurs.
     """
-    import numpy as np
-
-    X = []
-    noms_joueurs = []
-
-    for joueur in joueurs:
-        features_joueur = preparer_features(joueur, features)
-        X.append(features_joueur)
-        noms_joueurs.append(f"{joueur.prenom} {joueur.nom}")
-
-    # Convertir en array numpy
-    X = np.array(X)
+    data = tirer_joueurs(liste_id, genre, nb_element, graine)
 
-    return X, noms_joueurs
+    return calculer_features(data, features), noms_complets(data)
@@ -191,6 +191,7 @@ def menu_classification():
     print("4. Un groupe de femme classée")
     print("5. Un groupe mixte quelconque")
     print("6. un groupe mixte classe")
+    print("\n7. Recharger une classification enregistrée")
 
     print("\n ############################## \n")
 
@@ -205,7 +206,7 @@ def sous_menu_classification():
 
     Propose à l'utilisateur les options pour afficher le graphique de
     classification, le tableau de répartition, trouver la classe d'un
-    nouveau joueur et enregistrer la classification.
+    ou de plusieurs joueurs et enregistrer la classification.
     """
     effacer_terminal()
     print("\n ########## Travailler sur la classification ########## \n")
@@ -214,6 +215,7 @@ def sous_menu_classification():
     print("2. Afficher le tableau des centroïdes")
     print("3. Trouver la classe d'un nouveau joueur")
     print("4. Enregistrer la classification")
+    print("5. Trouver la classe de plusieurs joueurs")
 
     print("\n ############################## \n")
 